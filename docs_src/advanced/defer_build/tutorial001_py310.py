@@ -0,0 +1,65 @@
+from pydantic import ConfigDict
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+class Base(SQLModel):
+    model_config = ConfigDict(defer_build=True)
+
+
+class Team(Base, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    headquarters: str
+
+
+class Hero(Base, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: int | None = Field(default=None, index=True)
+
+
+class HeroUpdate(Base):
+    name: str | None = None
+    age: int | None = None
+
+
+sqlite_file_name = "database.db"
+sqlite_url = f"sqlite:///{sqlite_file_name}"
+
+engine = create_engine(sqlite_url, echo=True)
+
+
+def create_db_and_tables():
+    SQLModel.metadata.create_all(engine)
+
+
+def create_heroes():
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+
+
+def update_hero():
+    with Session(engine) as session:
+        hero = session.exec(select(Hero).where(Hero.name == "Deadpond")).one()
+        print("Hero built:", Hero.__pydantic_complete__)
+        hero_update = HeroUpdate.model_validate({"age": "30"})
+        print("HeroUpdate built:", HeroUpdate.__pydantic_complete__)
+        hero.sqlmodel_update(hero_update.model_dump(exclude_unset=True))
+        session.add(hero)
+        session.commit()
+        session.refresh(hero)
+        print("Updated hero:", hero.model_dump())
+        print("Team built:", Team.__pydantic_complete__)
+
+
+def main():
+    create_db_and_tables()
+    create_heroes()
+    update_hero()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import logging
+
+from fastapi import Depends, FastAPI, Request
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+logger = logging.getLogger("heroes")
+
+
+class HeroBase(SQLModel):
+    name: str = Field(index=True)
+    secret_name: str
+    age: int | None = Field(default=None, index=True)
+
+
+class Hero(HeroBase, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class HeroCreate(HeroBase):
+    pass
+
+
+class HeroPublic(HeroBase):
+    id: int
+
+
+sqlite_file_name = "database.db"
+sqlite_url = f"sqlite:///{sqlite_file_name}"
+
+connect_args = {"check_same_thread": False}
+engine = create_engine(sqlite_url, connect_args=connect_args)
+
+
+def create_db_and_tables():
+    SQLModel.metadata.create_all(engine)
+
+
+def get_session(request: Request):
+    with Session(engine, stats=True) as session:
+        request.state.session_stats = session.stats
+        yield session
+
+
+app = FastAPI()
+
+
+@app.middleware("http")
+async def log_session_stats(request: Request, call_next):
+    response = await call_next(request)
+    stats = getattr(request.state, "session_stats", None)
+    if stats is not None:
+        logger.info(
+            "%s %s: %s statements, %.2f ms executing, %.2f ms hydrating %s rows",
+            request.method,
+            request.url.path,
+            sum(stats.statements.values()),
+            stats.execute_time * 1000,
+            stats.hydration_time * 1000,
+            stats.rows,
+        )
+    return response
+
+
+@app.on_event("startup")
+def on_startup():
+    create_db_and_tables()
+
+
+@app.post("/heroes/", response_model=HeroPublic)
+def create_hero(*, session: Session = Depends(get_session), hero: HeroCreate):
+    db_hero = Hero.model_validate(hero)
+    session.add(db_hero)
+    session.commit()
+    session.refresh(db_hero)
+    return db_hero
+
+
+@app.get("/heroes/", response_model=list[HeroPublic])
+def read_heroes(*, session: Session = Depends(get_session)):
+    heroes = session.exec(select(Hero)).all()
+    return heroes
@@ -0,0 +1,84 @@
+"""
+Time to define many table models, e.g. when importing a large models package.
+
+Defines `MODELS` table models with `FIELDS` fields each, a foreign key to the
+previous model, and relationships in both directions, then configures the
+SQLAlchemy mappers. Also compares defining them with `defer_build=True`, building
+the Pydantic schemas only when they are used.
+
+Run with:
+
+    python scripts/benchmarks/class_creation.py
+"""
+
+import timeit
+from time import process_time
+from typing import Optional
+
+from pydantic import ConfigDict
+from sqlalchemy.orm import configure_mappers, registry
+from sqlmodel import Field, Relationship, SQLModel
+
+MODELS = 400
+FIELDS = 10
+REPEAT = 5
+
+
+def define_models(defer_build: bool = False) -> list[type[SQLModel]]:
+    class Base(SQLModel, registry=registry()):
+        model_config = ConfigDict(defer_build=defer_build)
+
+    models: list[type[SQLModel]] = []
+    for i in range(MODELS):
+        annotations: dict[str, object] = {"id": Optional[int]}  # noqa: UP045
+        namespace: dict[str, object] = {
+            "__annotations__": annotations,
+            "__module__": __name__,
+            "id": Field(default=None, primary_key=True),
+        }
+        for j in range(FIELDS):
+            annotations[f"field_{j}"] = (str, int, float, bool)[j % 4]
+            if j % 3 == 0:
+                namespace[f"field_{j}"] = Field(index=True)
+        if i:
+            annotations["parent_id"] = Optional[int]  # noqa: UP045
+            namespace["parent_id"] = Field(default=None, foreign_key=f"model{i - 1}.id")
+            annotations["parent"] = Optional[f"Model{i - 1}"]  # noqa: UP045
+            namespace["parent"] = Relationship(back_populates="children")
+        if i < MODELS - 1:
+            annotations["children"] = list[f"Model{i + 1}"]
+            namespace["children"] = Relationship(back_populates="parent")
+        models.append(type(Base)(f"Model{i}", (Base,), namespace, table=True))
+    return models
+
+
+def define_and_configure() -> None:
+    define_models()
+    configure_mappers()
+
+
+def define_deferred() -> None:
+    define_models(defer_build=True)
+
+
+if __name__ == "__main__":
+    define_time = total_time = deferred_time = float("inf")
+    # Interleaved, so that the machine load affects all of them the same way
+    for _ in range(REPEAT):
+        define_time = min(
+            define_time, timeit.timeit(define_models, timer=process_time, number=1)
+        )
+        total_time = min(
+            total_time,
+            timeit.timeit(define_and_configure, timer=process_time, number=1),
+        )
+        deferred_time = min(
+            deferred_time,
+            timeit.timeit(define_deferred, timer=process_time, number=1),
+        )
+    print(f"{MODELS} table models with {FIELDS} fields and relationships")
+    print(f"  class creation       {define_time * 1000:8.2f} ms")
+    print(f"  per model            {define_time / MODELS * 1000:8.3f} ms")
+    print(f"  with mapper config   {total_time * 1000:8.2f} ms")
+    print(f"  with defer_build     {deferred_time * 1000:8.2f} ms")
+    print(f"  speedup              {define_time / deferred_time:8.2f}x")
@@ -0,0 +1,51 @@
+"""
+Time to import the `sqlmodel` package in a new interpreter, on its own and with the
+first use of some of its names, from the output of `python -X importtime`.
+
+Run with:
+
+    python scripts/benchmarks/import_time.py
+"""
+
+import subprocess
+import sys
+
+REPEAT = 10
+
+CASES = {
+    "import sqlmodel": "import sqlmodel",
+    "from sqlmodel import create_engine": "from sqlmodel import create_engine",
+    "from sqlmodel import SQLModel": "from sqlmodel import SQLModel",
+    "from sqlmodel import Session": "from sqlmodel import Session",
+}
+
+
+def import_time(code: str) -> float:
+    # The sum of the import times of the top level modules, in seconds
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    started = False
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Only the modules imported by the code, after the interpreter startup
+        if not name.startswith("  "):
+            if started:
+                total += int(cumulative)
+            started = started or name.strip() == "site"
+    return total / 1_000_000
+
+
+if __name__ == "__main__":
+    times = dict.fromkeys(CASES, float("inf"))
+    for _ in range(REPEAT):
+        for name, code in CASES.items():
+            times[name] = min(times[name], import_time(code))
+    for name, seconds in times.items():
+        print(f"  {name:36} {seconds * 1000:8.2f} ms")
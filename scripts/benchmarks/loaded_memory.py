@@ -0,0 +1,59 @@
+"""
+Memory used per instance loaded with `session.exec(select(Hero)).all()`, measured
+with tracemalloc.
+
+The Pydantic attributes of loaded instances (`__pydantic_fields_set__`, etc.) are
+only created on first access, the second line shows the memory that each instance
+would use if they were created when loading.
+
+Run with:
+
+    python scripts/benchmarks/loaded_memory.py
+"""
+
+import gc
+import tracemalloc
+
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+ROWS = 50_000
+
+
+class Hero(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: int | None = Field(default=None, index=True)
+    email: str | None = None
+    country: str = "Unknown"
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Hero(name=f"Hero {i}", secret_name=f"Secret {i}", age=i % 90)
+            for i in range(ROWS)
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        heroes = session.exec(select(Hero)).all()
+        loaded = tracemalloc.get_traced_memory()[0]
+        for hero in heroes:
+            hero.model_fields_set  # noqa: B018
+        materialized = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    print(f"Hero ({ROWS} rows loaded)")
+    print(f"  loaded                    {(loaded - start) / ROWS:8.1f} bytes per row")
+    print(
+        f"  with Pydantic attributes  {(materialized - start) / ROWS:8.1f} bytes per row"
+    )
+
+
+if __name__ == "__main__":
+    main()
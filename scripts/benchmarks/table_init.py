@@ -0,0 +1,74 @@
+"""
+Per-instance cost of creating table model instances with `Hero(...)`.
+
+Compares the constructor generated for each table model class with the generic
+loop over the model fields that it replaced.
+
+Run with:
+
+    python scripts/benchmarks/table_init.py
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from sqlmodel import Field, SQLModel
+from sqlmodel._compat import partial_init
+
+NUMBER = 20_000
+
+
+class Hero(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: int | None = Field(default=None, index=True)
+    email: str | None = None
+    city: str | None = None
+    country: str = "Unknown"
+    rank: int = 0
+    active: bool = True
+    score: float = 0.0
+
+
+data = {"name": "Deadpond", "secret_name": "Dive Wilson", "age": 42, "rank": 3}
+
+
+def generated_init() -> None:
+    Hero(**data)
+
+
+def generic_construct() -> None:
+    with partial_init():
+        hero = Hero()
+    values = dict(data)
+    old_dict = hero.__dict__.copy()
+    fields_values: dict[str, Any] = {}
+    defaults: dict[str, Any] = {}
+    for name, field in Hero.model_fields.items():
+        if field.alias and field.alias in values:
+            fields_values[name] = values.pop(field.alias)
+        elif name in values:
+            fields_values[name] = values.pop(name)
+        elif not field.is_required():
+            defaults[name] = field.get_default(call_default_factory=True)
+    fields_set = set(fields_values)
+    fields_values.update(defaults)
+    for key, value in {**old_dict, **fields_values}.items():
+        setattr(hero, key, value)
+    object.__setattr__(hero, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(hero, "__pydantic_extra__", None)
+    object.__setattr__(hero, "__pydantic_private__", None)
+
+
+def report(name: str, func: Callable[[], None]) -> float:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+    print(f"{name:<20} {best * 1_000_000:8.2f} µs per instance")
+    return best
+
+
+if __name__ == "__main__":
+    generic = report("generic construct", generic_construct)
+    generated = report("generated init", generated_init)
+    print(f"{'speedup':<20} {generic / generated:8.2f}x")
@@ -0,0 +1,59 @@
+"""
+Cost of validating a batch of payloads with `Model.model_validate_many()` compared
+to calling `Model.model_validate()` for each one.
+
+Run with:
+
+    python scripts/benchmarks/validate_many.py
+"""
+
+import timeit
+
+from sqlmodel import Field, SQLModel
+
+ROWS = 10_000
+
+
+class HeroBase(SQLModel):
+    name: str = Field(index=True)
+    secret_name: str
+    age: int | None = Field(default=None, index=True)
+    email: str | None = None
+    country: str = "Unknown"
+    rank: int = 0
+
+
+class Hero(HeroBase, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class HeroPublic(HeroBase):
+    id: int
+
+
+payloads = [
+    {"id": i, "name": f"Hero {i}", "secret_name": f"Secret {i}", "age": str(i % 90)}
+    for i in range(ROWS)
+]
+
+
+def report(model: type[SQLModel]) -> None:
+    one_by_one = min(
+        timeit.repeat(
+            lambda: [model.model_validate(payload) for payload in payloads],
+            number=1,
+            repeat=5,
+        )
+    )
+    many = min(
+        timeit.repeat(lambda: model.model_validate_many(payloads), number=1, repeat=5)
+    )
+    print(f"{model.__name__} ({ROWS} rows)")
+    print(f"  model_validate()      {one_by_one / ROWS * 1_000_000:8.2f} µs per row")
+    print(f"  model_validate_many() {many / ROWS * 1_000_000:8.2f} µs per row")
+    print(f"  speedup               {one_by_one / many:8.2f}x")
+
+
+if __name__ == "__main__":
+    report(Hero)
+    report(HeroPublic)
@@ -0,0 +1,88 @@
+"""
+Per-call cost of `Hero.model_validate(hero_create, update=...)`, the usual way to
+create a table model from a FastAPI request model, and of validating a non-table
+model with an update, for models with 10, 50 and 200 fields.
+
+Compares the current update wrapper with the previous one, that checked the update
+in a Python `__getattribute__` for every attribute.
+
+Run with:
+
+    python scripts/benchmarks/validate_update.py
+"""
+
+import timeit
+from dataclasses import dataclass
+from typing import Any
+
+from sqlmodel import Field, SQLModel, _compat
+
+NUMBER = 5_000
+
+
+@dataclass
+class PreviousObjectWithUpdateWrapper:
+    obj: Any
+    update: dict[str, Any]
+
+    def __getattribute__(self, __name: str) -> Any:
+        update = super().__getattribute__("update")
+        obj = super().__getattribute__("obj")
+        if __name in update:
+            return update[__name]
+        return getattr(obj, __name)
+
+
+def previous_get_object_with_update(obj: Any, update: dict[str, Any]) -> Any:
+    if isinstance(obj, dict):
+        return {**obj, **update}
+    return PreviousObjectWithUpdateWrapper(obj=obj, update=update)
+
+
+def create_models(size: int) -> tuple[type[SQLModel], ...]:
+    annotations = {f"field_{i}": str for i in range(size)}
+    hero_create = type(
+        f"HeroCreate{size}", (SQLModel,), {"__annotations__": annotations}
+    )
+    hero = type(
+        f"Hero{size}",
+        (SQLModel,),
+        {
+            "__annotations__": {"id": int | None, "owner": str, **annotations},
+            "id": Field(default=None, primary_key=True),
+        },
+        table=True,
+    )
+    hero_public = type(
+        f"HeroPublic{size}",
+        (SQLModel,),
+        {"__annotations__": {"id": int, "owner": str, **annotations}},
+    )
+    return hero_create, hero, hero_public
+
+
+def report(model: type[SQLModel], data: SQLModel, size: int) -> None:
+    update = {"owner": "Deadpond", "id": 1}
+
+    def validate() -> None:
+        model.model_validate(data, update=update)
+
+    current = min(timeit.repeat(validate, number=NUMBER, repeat=5)) / NUMBER
+    get_object_with_update = _compat.get_object_with_update
+    _compat.get_object_with_update = previous_get_object_with_update
+    try:
+        previous = min(timeit.repeat(validate, number=NUMBER, repeat=5)) / NUMBER
+    finally:
+        _compat.get_object_with_update = get_object_with_update
+    print(f"{model.__name__} ({size} fields)")
+    print(f"  previous wrapper {previous * 1_000_000:8.2f} µs per call")
+    print(f"  current wrapper  {current * 1_000_000:8.2f} µs per call")
+    print(f"  speedup          {previous / current:8.2f}x")
+
+
+if __name__ == "__main__":
+    for size in (10, 50, 200):
+        hero_create, hero, hero_public = create_models(size)
+        data = hero_create(**{f"field_{i}": f"value {i}" for i in range(size)})
+        report(hero, data, size)
+        report(hero_public, data, size)
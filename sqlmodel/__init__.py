@@ -1,143 +1,338 @@
 __version__ = "0.0.39"
 
-# Re-export from SQLAlchemy
-from sqlalchemy.engine import create_engine as create_engine
-from sqlalchemy.engine import create_mock_engine as create_mock_engine
-from sqlalchemy.engine import engine_from_config as engine_from_config
-from sqlalchemy.inspection import inspect as inspect
-from sqlalchemy.pool import QueuePool as QueuePool
-from sqlalchemy.pool import StaticPool as StaticPool
-from sqlalchemy.schema import BLANK_SCHEMA as BLANK_SCHEMA
-from sqlalchemy.schema import DDL as DDL
-from sqlalchemy.schema import CheckConstraint as CheckConstraint
-from sqlalchemy.schema import Column as Column
-from sqlalchemy.schema import ColumnDefault as ColumnDefault
-from sqlalchemy.schema import Computed as Computed
-from sqlalchemy.schema import Constraint as Constraint
-from sqlalchemy.schema import DefaultClause as DefaultClause
-from sqlalchemy.schema import FetchedValue as FetchedValue
-from sqlalchemy.schema import ForeignKey as ForeignKey
-from sqlalchemy.schema import ForeignKeyConstraint as ForeignKeyConstraint
-from sqlalchemy.schema import Identity as Identity
-from sqlalchemy.schema import Index as Index
-from sqlalchemy.schema import MetaData as MetaData
-from sqlalchemy.schema import PrimaryKeyConstraint as PrimaryKeyConstraint
-from sqlalchemy.schema import Sequence as Sequence
-from sqlalchemy.schema import Table as Table
-from sqlalchemy.schema import UniqueConstraint as UniqueConstraint
-from sqlalchemy.sql import LABEL_STYLE_DEFAULT as LABEL_STYLE_DEFAULT
-from sqlalchemy.sql import (
-    LABEL_STYLE_DISAMBIGUATE_ONLY as LABEL_STYLE_DISAMBIGUATE_ONLY,
-)
-from sqlalchemy.sql import LABEL_STYLE_NONE as LABEL_STYLE_NONE
-from sqlalchemy.sql import (
-    LABEL_STYLE_TABLENAME_PLUS_COL as LABEL_STYLE_TABLENAME_PLUS_COL,
-)
-from sqlalchemy.sql import alias as alias
-from sqlalchemy.sql import bindparam as bindparam
-from sqlalchemy.sql import column as column
-from sqlalchemy.sql import delete as delete
-from sqlalchemy.sql import except_ as except_
-from sqlalchemy.sql import except_all as except_all
-from sqlalchemy.sql import exists as exists
-from sqlalchemy.sql import false as false
-from sqlalchemy.sql import func as func
-from sqlalchemy.sql import insert as insert
-from sqlalchemy.sql import intersect as intersect
-from sqlalchemy.sql import intersect_all as intersect_all
-from sqlalchemy.sql import join as join
-from sqlalchemy.sql import lambda_stmt as lambda_stmt
-from sqlalchemy.sql import lateral as lateral
-from sqlalchemy.sql import literal as literal
-from sqlalchemy.sql import literal_column as literal_column
-from sqlalchemy.sql import modifier as modifier
-from sqlalchemy.sql import null as null
-from sqlalchemy.sql import nullsfirst as nullsfirst
-from sqlalchemy.sql import nullslast as nullslast
-from sqlalchemy.sql import outerjoin as outerjoin
-from sqlalchemy.sql import outparam as outparam
-from sqlalchemy.sql import table as table
-from sqlalchemy.sql import tablesample as tablesample
-from sqlalchemy.sql import text as text
-from sqlalchemy.sql import true as true
-from sqlalchemy.sql import union as union
-from sqlalchemy.sql import union_all as union_all
-from sqlalchemy.sql import update as update
-from sqlalchemy.sql import values as values
-from sqlalchemy.types import ARRAY as ARRAY
-from sqlalchemy.types import BIGINT as BIGINT
-from sqlalchemy.types import BINARY as BINARY
-from sqlalchemy.types import BLOB as BLOB
-from sqlalchemy.types import BOOLEAN as BOOLEAN
-from sqlalchemy.types import CHAR as CHAR
-from sqlalchemy.types import CLOB as CLOB
-from sqlalchemy.types import DATE as DATE
-from sqlalchemy.types import DATETIME as DATETIME
-from sqlalchemy.types import DECIMAL as DECIMAL
-from sqlalchemy.types import DOUBLE as DOUBLE
-from sqlalchemy.types import DOUBLE_PRECISION as DOUBLE_PRECISION
-from sqlalchemy.types import FLOAT as FLOAT
-from sqlalchemy.types import INT as INT
-from sqlalchemy.types import INTEGER as INTEGER
-from sqlalchemy.types import JSON as JSON
-from sqlalchemy.types import NCHAR as NCHAR
-from sqlalchemy.types import NUMERIC as NUMERIC
-from sqlalchemy.types import NVARCHAR as NVARCHAR
-from sqlalchemy.types import REAL as REAL
-from sqlalchemy.types import SMALLINT as SMALLINT
-from sqlalchemy.types import TEXT as TEXT
-from sqlalchemy.types import TIME as TIME
-from sqlalchemy.types import TIMESTAMP as TIMESTAMP
-from sqlalchemy.types import UUID as UUID
-from sqlalchemy.types import VARBINARY as VARBINARY
-from sqlalchemy.types import VARCHAR as VARCHAR
-from sqlalchemy.types import BigInteger as BigInteger
-from sqlalchemy.types import Boolean as Boolean
-from sqlalchemy.types import Date as Date
-from sqlalchemy.types import DateTime as DateTime
-from sqlalchemy.types import Double as Double
-from sqlalchemy.types import Enum as Enum
-from sqlalchemy.types import Float as Float
-from sqlalchemy.types import Integer as Integer
-from sqlalchemy.types import Interval as Interval
-from sqlalchemy.types import LargeBinary as LargeBinary
-from sqlalchemy.types import Numeric as Numeric
-from sqlalchemy.types import PickleType as PickleType
-from sqlalchemy.types import SmallInteger as SmallInteger
-from sqlalchemy.types import String as String
-from sqlalchemy.types import Text as Text
-from sqlalchemy.types import Time as Time
-from sqlalchemy.types import TupleType as TupleType
-from sqlalchemy.types import TypeDecorator as TypeDecorator
-from sqlalchemy.types import Unicode as Unicode
-from sqlalchemy.types import UnicodeText as UnicodeText
-from sqlalchemy.types import Uuid as Uuid
+from collections.abc import Callable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# From SQLModel, modifications of SQLAlchemy or equivalents of Pydantic
-from .main import Field as Field
-from .main import Relationship as Relationship
-from .main import SQLModel as SQLModel
-from .orm.session import Session as Session
-from .sql.expression import all_ as all_
-from .sql.expression import and_ as and_
-from .sql.expression import any_ as any_
-from .sql.expression import asc as asc
-from .sql.expression import between as between
-from .sql.expression import case as case
-from .sql.expression import cast as cast
-from .sql.expression import col as col
-from .sql.expression import collate as collate
-from .sql.expression import desc as desc
-from .sql.expression import distinct as distinct
-from .sql.expression import extract as extract
-from .sql.expression import funcfilter as funcfilter
-from .sql.expression import not_ as not_
-from .sql.expression import nulls_first as nulls_first
-from .sql.expression import nulls_last as nulls_last
-from .sql.expression import or_ as or_
-from .sql.expression import over as over
-from .sql.expression import select as select
-from .sql.expression import tuple_ as tuple_
-from .sql.expression import type_coerce as type_coerce
-from .sql.expression import within_group as within_group
-from .sql.sqltypes import AutoString as AutoString
+if TYPE_CHECKING:
+    # Re-export from SQLAlchemy
+    from sqlalchemy.engine import create_engine as create_engine
+    from sqlalchemy.engine import create_mock_engine as create_mock_engine
+    from sqlalchemy.engine import engine_from_config as engine_from_config
+    from sqlalchemy.inspection import inspect as inspect
+    from sqlalchemy.pool import QueuePool as QueuePool
+    from sqlalchemy.pool import StaticPool as StaticPool
+    from sqlalchemy.schema import BLANK_SCHEMA as BLANK_SCHEMA
+    from sqlalchemy.schema import DDL as DDL
+    from sqlalchemy.schema import CheckConstraint as CheckConstraint
+    from sqlalchemy.schema import Column as Column
+    from sqlalchemy.schema import ColumnDefault as ColumnDefault
+    from sqlalchemy.schema import Computed as Computed
+    from sqlalchemy.schema import Constraint as Constraint
+    from sqlalchemy.schema import DefaultClause as DefaultClause
+    from sqlalchemy.schema import FetchedValue as FetchedValue
+    from sqlalchemy.schema import ForeignKey as ForeignKey
+    from sqlalchemy.schema import ForeignKeyConstraint as ForeignKeyConstraint
+    from sqlalchemy.schema import Identity as Identity
+    from sqlalchemy.schema import Index as Index
+    from sqlalchemy.schema import MetaData as MetaData
+    from sqlalchemy.schema import PrimaryKeyConstraint as PrimaryKeyConstraint
+    from sqlalchemy.schema import Sequence as Sequence
+    from sqlalchemy.schema import Table as Table
+    from sqlalchemy.schema import UniqueConstraint as UniqueConstraint
+    from sqlalchemy.sql import LABEL_STYLE_DEFAULT as LABEL_STYLE_DEFAULT
+    from sqlalchemy.sql import (
+        LABEL_STYLE_DISAMBIGUATE_ONLY as LABEL_STYLE_DISAMBIGUATE_ONLY,
+    )
+    from sqlalchemy.sql import LABEL_STYLE_NONE as LABEL_STYLE_NONE
+    from sqlalchemy.sql import (
+        LABEL_STYLE_TABLENAME_PLUS_COL as LABEL_STYLE_TABLENAME_PLUS_COL,
+    )
+    from sqlalchemy.sql import alias as alias
+    from sqlalchemy.sql import bindparam as bindparam
+    from sqlalchemy.sql import column as column
+    from sqlalchemy.sql import delete as delete
+    from sqlalchemy.sql import except_ as except_
+    from sqlalchemy.sql import except_all as except_all
+    from sqlalchemy.sql import exists as exists
+    from sqlalchemy.sql import false as false
+    from sqlalchemy.sql import func as func
+    from sqlalchemy.sql import insert as insert
+    from sqlalchemy.sql import intersect as intersect
+    from sqlalchemy.sql import intersect_all as intersect_all
+    from sqlalchemy.sql import join as join
+    from sqlalchemy.sql import lambda_stmt as lambda_stmt
+    from sqlalchemy.sql import lateral as lateral
+    from sqlalchemy.sql import literal as literal
+    from sqlalchemy.sql import literal_column as literal_column
+    from sqlalchemy.sql import modifier as modifier
+    from sqlalchemy.sql import null as null
+    from sqlalchemy.sql import nullsfirst as nullsfirst
+    from sqlalchemy.sql import nullslast as nullslast
+    from sqlalchemy.sql import outerjoin as outerjoin
+    from sqlalchemy.sql import outparam as outparam
+    from sqlalchemy.sql import table as table
+    from sqlalchemy.sql import tablesample as tablesample
+    from sqlalchemy.sql import text as text
+    from sqlalchemy.sql import true as true
+    from sqlalchemy.sql import union as union
+    from sqlalchemy.sql import union_all as union_all
+    from sqlalchemy.sql import update as update
+    from sqlalchemy.sql import values as values
+    from sqlalchemy.types import ARRAY as ARRAY
+    from sqlalchemy.types import BIGINT as BIGINT
+    from sqlalchemy.types import BINARY as BINARY
+    from sqlalchemy.types import BLOB as BLOB
+    from sqlalchemy.types import BOOLEAN as BOOLEAN
+    from sqlalchemy.types import CHAR as CHAR
+    from sqlalchemy.types import CLOB as CLOB
+    from sqlalchemy.types import DATE as DATE
+    from sqlalchemy.types import DATETIME as DATETIME
+    from sqlalchemy.types import DECIMAL as DECIMAL
+    from sqlalchemy.types import DOUBLE as DOUBLE
+    from sqlalchemy.types import DOUBLE_PRECISION as DOUBLE_PRECISION
+    from sqlalchemy.types import FLOAT as FLOAT
+    from sqlalchemy.types import INT as INT
+    from sqlalchemy.types import INTEGER as INTEGER
+    from sqlalchemy.types import JSON as JSON
+    from sqlalchemy.types import NCHAR as NCHAR
+    from sqlalchemy.types import NUMERIC as NUMERIC
+    from sqlalchemy.types import NVARCHAR as NVARCHAR
+    from sqlalchemy.types import REAL as REAL
+    from sqlalchemy.types import SMALLINT as SMALLINT
+    from sqlalchemy.types import TEXT as TEXT
+    from sqlalchemy.types import TIME as TIME
+    from sqlalchemy.types import TIMESTAMP as TIMESTAMP
+    from sqlalchemy.types import UUID as UUID
+    from sqlalchemy.types import VARBINARY as VARBINARY
+    from sqlalchemy.types import VARCHAR as VARCHAR
+    from sqlalchemy.types import BigInteger as BigInteger
+    from sqlalchemy.types import Boolean as Boolean
+    from sqlalchemy.types import Date as Date
+    from sqlalchemy.types import DateTime as DateTime
+    from sqlalchemy.types import Double as Double
+    from sqlalchemy.types import Enum as Enum
+    from sqlalchemy.types import Float as Float
+    from sqlalchemy.types import Integer as Integer
+    from sqlalchemy.types import Interval as Interval
+    from sqlalchemy.types import LargeBinary as LargeBinary
+    from sqlalchemy.types import Numeric as Numeric
+    from sqlalchemy.types import PickleType as PickleType
+    from sqlalchemy.types import SmallInteger as SmallInteger
+    from sqlalchemy.types import String as String
+    from sqlalchemy.types import Text as Text
+    from sqlalchemy.types import Time as Time
+    from sqlalchemy.types import TupleType as TupleType
+    from sqlalchemy.types import TypeDecorator as TypeDecorator
+    from sqlalchemy.types import Unicode as Unicode
+    from sqlalchemy.types import UnicodeText as UnicodeText
+    from sqlalchemy.types import Uuid as Uuid
+
+    # From SQLModel, modifications of SQLAlchemy or equivalents of Pydantic
+    from .main import Field as Field
+    from .main import Relationship as Relationship
+    from .main import SQLModel as SQLModel
+    from .orm.lazy_loads import LazyLoadDetector as LazyLoadDetector
+    from .orm.lazy_loads import LazyLoadError as LazyLoadError
+    from .orm.lazy_loads import LazyLoadWarning as LazyLoadWarning
+    from .orm.session import Session as Session
+    from .orm.session import SessionStats as SessionStats
+    from .sql.expression import all_ as all_
+    from .sql.expression import and_ as and_
+    from .sql.expression import any_ as any_
+    from .sql.expression import asc as asc
+    from .sql.expression import between as between
+    from .sql.expression import case as case
+    from .sql.expression import cast as cast
+    from .sql.expression import col as col
+    from .sql.expression import collate as collate
+    from .sql.expression import desc as desc
+    from .sql.expression import distinct as distinct
+    from .sql.expression import extract as extract
+    from .sql.expression import funcfilter as funcfilter
+    from .sql.expression import not_ as not_
+    from .sql.expression import nulls_first as nulls_first
+    from .sql.expression import nulls_last as nulls_last
+    from .sql.expression import or_ as or_
+    from .sql.expression import over as over
+    from .sql.expression import select as select
+    from .sql.expression import tuple_ as tuple_
+    from .sql.expression import type_coerce as type_coerce
+    from .sql.expression import within_group as within_group
+    from .sql.prepared import PreparedStats as PreparedStats
+    from .sql.prepared import get_prepared_stats as get_prepared_stats
+    from .sql.prepared import prepared as prepared
+    from .sql.sqltypes import AutoString as AutoString
+
+# The module of each name exported here, imported on the first access to one of
+# them, so that "import sqlmodel" doesn't import SQLAlchemy and Pydantic until
+# they are used, e.g. for CLI commands that don't need the database
+_LAZY_IMPORTS: dict[str, str] = {
+    # Re-export from SQLAlchemy
+    "create_engine": "sqlalchemy.engine",
+    "create_mock_engine": "sqlalchemy.engine",
+    "engine_from_config": "sqlalchemy.engine",
+    "inspect": "sqlalchemy.inspection",
+    "QueuePool": "sqlalchemy.pool",
+    "StaticPool": "sqlalchemy.pool",
+    "BLANK_SCHEMA": "sqlalchemy.schema",
+    "DDL": "sqlalchemy.schema",
+    "CheckConstraint": "sqlalchemy.schema",
+    "Column": "sqlalchemy.schema",
+    "ColumnDefault": "sqlalchemy.schema",
+    "Computed": "sqlalchemy.schema",
+    "Constraint": "sqlalchemy.schema",
+    "DefaultClause": "sqlalchemy.schema",
+    "FetchedValue": "sqlalchemy.schema",
+    "ForeignKey": "sqlalchemy.schema",
+    "ForeignKeyConstraint": "sqlalchemy.schema",
+    "Identity": "sqlalchemy.schema",
+    "Index": "sqlalchemy.schema",
+    "MetaData": "sqlalchemy.schema",
+    "PrimaryKeyConstraint": "sqlalchemy.schema",
+    "Sequence": "sqlalchemy.schema",
+    "Table": "sqlalchemy.schema",
+    "UniqueConstraint": "sqlalchemy.schema",
+    "LABEL_STYLE_DEFAULT": "sqlalchemy.sql",
+    "LABEL_STYLE_DISAMBIGUATE_ONLY": "sqlalchemy.sql",
+    "LABEL_STYLE_NONE": "sqlalchemy.sql",
+    "LABEL_STYLE_TABLENAME_PLUS_COL": "sqlalchemy.sql",
+    "alias": "sqlalchemy.sql",
+    "bindparam": "sqlalchemy.sql",
+    "column": "sqlalchemy.sql",
+    "delete": "sqlalchemy.sql",
+    "except_": "sqlalchemy.sql",
+    "except_all": "sqlalchemy.sql",
+    "exists": "sqlalchemy.sql",
+    "false": "sqlalchemy.sql",
+    "func": "sqlalchemy.sql",
+    "insert": "sqlalchemy.sql",
+    "intersect": "sqlalchemy.sql",
+    "intersect_all": "sqlalchemy.sql",
+    "join": "sqlalchemy.sql",
+    "lambda_stmt": "sqlalchemy.sql",
+    "lateral": "sqlalchemy.sql",
+    "literal": "sqlalchemy.sql",
+    "literal_column": "sqlalchemy.sql",
+    "modifier": "sqlalchemy.sql",
+    "null": "sqlalchemy.sql",
+    "nullsfirst": "sqlalchemy.sql",
+    "nullslast": "sqlalchemy.sql",
+    "outerjoin": "sqlalchemy.sql",
+    "outparam": "sqlalchemy.sql",
+    "table": "sqlalchemy.sql",
+    "tablesample": "sqlalchemy.sql",
+    "text": "sqlalchemy.sql",
+    "true": "sqlalchemy.sql",
+    "union": "sqlalchemy.sql",
+    "union_all": "sqlalchemy.sql",
+    "update": "sqlalchemy.sql",
+    "values": "sqlalchemy.sql",
+    "ARRAY": "sqlalchemy.types",
+    "BIGINT": "sqlalchemy.types",
+    "BINARY": "sqlalchemy.types",
+    "BLOB": "sqlalchemy.types",
+    "BOOLEAN": "sqlalchemy.types",
+    "CHAR": "sqlalchemy.types",
+    "CLOB": "sqlalchemy.types",
+    "DATE": "sqlalchemy.types",
+    "DATETIME": "sqlalchemy.types",
+    "DECIMAL": "sqlalchemy.types",
+    "DOUBLE": "sqlalchemy.types",
+    "DOUBLE_PRECISION": "sqlalchemy.types",
+    "FLOAT": "sqlalchemy.types",
+    "INT": "sqlalchemy.types",
+    "INTEGER": "sqlalchemy.types",
+    "JSON": "sqlalchemy.types",
+    "NCHAR": "sqlalchemy.types",
+    "NUMERIC": "sqlalchemy.types",
+    "NVARCHAR": "sqlalchemy.types",
+    "REAL": "sqlalchemy.types",
+    "SMALLINT": "sqlalchemy.types",
+    "TEXT": "sqlalchemy.types",
+    "TIME": "sqlalchemy.types",
+    "TIMESTAMP": "sqlalchemy.types",
+    "UUID": "sqlalchemy.types",
+    "VARBINARY": "sqlalchemy.types",
+    "VARCHAR": "sqlalchemy.types",
+    "BigInteger": "sqlalchemy.types",
+    "Boolean": "sqlalchemy.types",
+    "Date": "sqlalchemy.types",
+    "DateTime": "sqlalchemy.types",
+    "Double": "sqlalchemy.types",
+    "Enum": "sqlalchemy.types",
+    "Float": "sqlalchemy.types",
+    "Integer": "sqlalchemy.types",
+    "Interval": "sqlalchemy.types",
+    "LargeBinary": "sqlalchemy.types",
+    "Numeric": "sqlalchemy.types",
+    "PickleType": "sqlalchemy.types",
+    "SmallInteger": "sqlalchemy.types",
+    "String": "sqlalchemy.types",
+    "Text": "sqlalchemy.types",
+    "Time": "sqlalchemy.types",
+    "TupleType": "sqlalchemy.types",
+    "TypeDecorator": "sqlalchemy.types",
+    "Unicode": "sqlalchemy.types",
+    "UnicodeText": "sqlalchemy.types",
+    "Uuid": "sqlalchemy.types",
+    # From SQLModel, modifications of SQLAlchemy or equivalents of Pydantic
+    "Field": ".main",
+    "Relationship": ".main",
+    "SQLModel": ".main",
+    "LazyLoadDetector": ".orm.lazy_loads",
+    "LazyLoadError": ".orm.lazy_loads",
+    "LazyLoadWarning": ".orm.lazy_loads",
+    "Session": ".orm.session",
+    "SessionStats": ".orm.session",
+    "all_": ".sql.expression",
+    "and_": ".sql.expression",
+    "any_": ".sql.expression",
+    "asc": ".sql.expression",
+    "between": ".sql.expression",
+    "case": ".sql.expression",
+    "cast": ".sql.expression",
+    "col": ".sql.expression",
+    "collate": ".sql.expression",
+    "desc": ".sql.expression",
+    "distinct": ".sql.expression",
+    "extract": ".sql.expression",
+    "funcfilter": ".sql.expression",
+    "not_": ".sql.expression",
+    "nulls_first": ".sql.expression",
+    "nulls_last": ".sql.expression",
+    "or_": ".sql.expression",
+    "over": ".sql.expression",
+    "select": ".sql.expression",
+    "tuple_": ".sql.expression",
+    "type_coerce": ".sql.expression",
+    "within_group": ".sql.expression",
+    "PreparedStats": ".sql.prepared",
+    "get_prepared_stats": ".sql.prepared",
+    "prepared": ".sql.prepared",
+    "AutoString": ".sql.sqltypes",
+}
+
+__all__ = ["__version__", *_LAZY_IMPORTS]
+
+
+def _lazy_submodules(package: str) -> Callable[[str], Any]:
+    # A module __getattr__() that imports the submodules of the package on first
+    # access, e.g. sqlmodel.sql.expression after only "import sqlmodel"
+    def __getattr__(name: str) -> Any:
+        if not name.startswith("__"):
+            try:
+                return import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+_import_submodule = _lazy_submodules(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        return _import_submodule(name)
+    value = getattr(import_module(module_name, __name__), name)
+    # Stored in the module, so that next time it's found without calling this
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
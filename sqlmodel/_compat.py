@@ -1,9 +1,12 @@
 import sys
 import types
-from collections.abc import Generator
+import uuid
+from collections.abc import Callable, Generator, Iterable, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -24,8 +27,23 @@ from pydantic._internal._fields import PydanticMetadata
 from pydantic._internal._model_construction import ModelMetaclass as ModelMetaclass
 from pydantic._internal._repr import Representation as Representation
 from pydantic.fields import FieldInfo
+from pydantic_core import (
+    InitErrorDetails,
+    PydanticCustomError,
+    SchemaValidator,
+    ValidationError,
+    core_schema,
+)
 from pydantic_core import PydanticUndefined as Undefined
 from pydantic_core import PydanticUndefinedType as PydanticUndefinedType
+from sqlalchemy import inspect, select, tuple_
+from sqlalchemy.orm import MANYTOONE, aliased
+from sqlalchemy.orm.attributes import (
+    instance_state,
+    set_attribute,
+    set_committed_value,
+)
+from sqlalchemy.orm.instrumentation import opt_manager_of_class
 
 BaseConfig = ConfigDict
 UndefinedType = PydanticUndefinedType
@@ -41,6 +59,26 @@ T = TypeVar("T")
 InstanceOrType: TypeAlias = T | type[T]
 _TSQLModel = TypeVar("_TSQLModel", bound="SQLModel")
 
+# Types whose values can't be modified in place, so they can be shared between
+# instances without copying them, and compared to detect assignments of the same value
+IMMUTABLE_VALUE_TYPES = frozenset(
+    {
+        NoneType,
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        Decimal,
+        datetime,
+        date,
+        time,
+        timedelta,
+        uuid.UUID,
+    }
+)
+
 
 class FakeMetadata:
     max_length: int | None = None
@@ -48,17 +86,29 @@ class FakeMetadata:
     decimal_places: int | None = None
 
 
-@dataclass
 class ObjectWithUpdateWrapper:
-    obj: Any
-    update: dict[str, Any]
+    # The instance __dict__ has the attributes of obj with the update on top, so
+    # that pydantic-core reads them with a plain attribute lookup, without calling
+    # Python code. Anything else (e.g. properties, or expired attributes of an
+    # object from the DB) is read from obj in __getattr__
+    __slots__ = ("__dict__", "_sqlmodel_wrapped_obj")
+
+    def __init__(self, obj: Any, update: dict[str, Any]) -> None:
+        object.__setattr__(self, "_sqlmodel_wrapped_obj", obj)
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is None:
+            object.__setattr__(self, "__dict__", dict(update))
+        else:
+            object.__setattr__(self, "__dict__", {**obj_dict, **update})
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._sqlmodel_wrapped_obj, name)
 
-    def __getattribute__(self, __name: str) -> Any:
-        update = super().__getattribute__("update")
-        obj = super().__getattribute__("obj")
-        if __name in update:
-            return update[__name]
-        return getattr(obj, __name)
+
+def get_object_with_update(obj: Any, update: dict[str, Any]) -> Any:
+    if isinstance(obj, dict):
+        return {**obj, **update}
+    return ObjectWithUpdateWrapper(obj=obj, update=update)
 
 
 def _is_union_type(t: Any) -> bool:
@@ -91,12 +141,6 @@ def get_model_fields(model: InstanceOrType[BaseModel]) -> dict[str, "FieldInfo"]
     return use_model.model_fields
 
 
-def init_pydantic_private_attrs(new_object: InstanceOrType["SQLModel"]) -> None:
-    object.__setattr__(new_object, "__pydantic_fields_set__", set())
-    object.__setattr__(new_object, "__pydantic_extra__", None)
-    object.__setattr__(new_object, "__pydantic_private__", None)
-
-
 def get_annotations(class_dict: dict[str, Any]) -> dict[str, Any]:
     raw_annotations: dict[str, Any] = class_dict.get("__annotations__", {})
     if sys.version_info >= (3, 14) and "__annotations__" not in class_dict:
@@ -112,7 +156,97 @@ def get_annotations(class_dict: dict[str, Any]) -> dict[str, Any]:
     return raw_annotations
 
 
+@dataclass(frozen=True)
+class SQLModelClassInfo:
+    # Computed once per class by SQLModelMetaclass, so that the code that runs for
+    # each instance or each attribute assignment doesn't have to compute it again
+    table: bool
+    field_names: frozenset[str]
+    relationship_names: frozenset[str]
+    # Fields and relationships instrumented by SQLAlchemy in this class
+    instrumented_names: frozenset[str]
+    # Fields that can be assigned with a single write through SQLAlchemy, as
+    # Pydantic would only store the value (no validate_assignment, not frozen)
+    direct_set_names: frozenset[str]
+    alias_to_field: Mapping[str, str]
+    required_fields: tuple[str, ...]
+    default_fields: tuple[str, ...]
+    # Only the default factories that don't take the validated data
+    default_factories: Mapping[str, Callable[..., Any]]
+
+
+def build_class_info(cls: type["SQLModel"]) -> SQLModelClassInfo:
+    fields = get_model_fields(cls)
+    relationship_names = frozenset(cls.__sqlmodel_relationships__)
+    table = is_table_model_class(cls)
+    manager = opt_manager_of_class(cls) if table else None
+    instrumented_names: frozenset[str] = frozenset()
+    if manager is not None:
+        instrumented_names = frozenset(
+            name
+            for name in (*fields, *relationship_names)
+            if manager.is_instrumented(name, search=True)
+        )
+    direct_set_names: frozenset[str] = frozenset()
+    config = cls.model_config
+    if not config.get("validate_assignment") and not config.get("frozen"):
+        direct_set_names = frozenset(
+            name
+            for name, field in fields.items()
+            if name in instrumented_names and not field.frozen
+        )
+    return SQLModelClassInfo(
+        table=table,
+        field_names=frozenset(fields),
+        relationship_names=relationship_names,
+        instrumented_names=instrumented_names,
+        direct_set_names=direct_set_names,
+        alias_to_field=types.MappingProxyType(
+            {field.alias: name for name, field in fields.items() if field.alias}
+        ),
+        required_fields=tuple(
+            name for name, field in fields.items() if field.is_required()
+        ),
+        default_fields=tuple(
+            name for name, field in fields.items() if not field.is_required()
+        ),
+        default_factories=types.MappingProxyType(
+            {
+                name: field.default_factory
+                for name, field in fields.items()
+                if field.default_factory is not None
+                and not field.default_factory_takes_validated_data
+            }
+        ),
+    )
+
+
+def is_unchanged_loaded_value(instance: Any, name: str, value: Any) -> bool:
+    # Assigning the same value to an attribute of an object loaded from the database
+    # would only mark it as modified, and make the session process it at flush.
+    # Only immutable values are compared, re-assigning a mutable value (e.g. a dict
+    # modified in place) is the way to tell SQLAlchemy that it changed.
+    if type(value) not in IMMUTABLE_VALUE_TYPES:
+        return False
+    instance_dict = instance.__dict__
+    state = instance_dict.get("_sa_instance_state")
+    if state is None or state.key is None:
+        return False
+    old_value = instance_dict.get(name, Undefined)
+    if old_value is not value and (
+        type(old_value) is not type(value) or old_value != value
+    ):
+        return False
+    # Don't skip "set" event listeners, e.g. from @validates()
+    return not state.manager[name].impl.dispatch.set
+
+
 def is_table_model_class(cls: type[Any]) -> bool:
+    # Classes already created by SQLModelMetaclass have the precomputed info, while
+    # the class is being created, read the config
+    class_info = cls.__dict__.get("__sqlmodel_class_info__")
+    if class_info is not None:
+        return class_info.table
     config = getattr(cls, "model_config", {})
     if config:
         return config.get("table", False) or False
@@ -171,15 +305,15 @@ def is_field_noneable(field: "FieldInfo") -> bool:
     return False
 
 
-def get_sa_type_from_type_annotation(annotation: Any) -> Any:
-    # Resolve Optional fields
+def get_sa_annotation_from_type_annotation(annotation: Any) -> Any:
+    # Resolve Optional fields, keep the arguments of generics, e.g. list[int]
     if annotation is None:
         raise ValueError("Missing field type")
     origin = get_origin(annotation)
     if origin is None:
         return annotation
     elif origin is Annotated:
-        return get_sa_type_from_type_annotation(get_args(annotation)[0])
+        return get_sa_annotation_from_type_annotation(get_args(annotation)[0])
     if _is_union_type(origin):
         bases = get_args(annotation)
         if len(bases) > 2:
@@ -189,13 +323,8 @@ def get_sa_type_from_type_annotation(annotation: Any) -> Any:
             raise ValueError("Cannot have a (non-optional) union as a SQLAlchemy field")
         # Optional unions are allowed
         use_type = bases[0] if bases[0] is not NoneType else bases[1]
-        return get_sa_type_from_type_annotation(use_type)
-    return origin
-
-
-def get_sa_type_from_field(field: Any) -> Any:
-    type_: Any = field.annotation
-    return get_sa_type_from_type_annotation(type_)
+        return get_sa_annotation_from_type_annotation(use_type)
+    return annotation
 
 
 def get_field_metadata(field: Any) -> Any:
@@ -205,72 +334,89 @@ def get_field_metadata(field: Any) -> Any:
     return FakeMetadata()
 
 
-def sqlmodel_table_construct(
-    *,
-    self_instance: _TSQLModel,
-    values: dict[str, Any],
-    _fields_set: set[str] | None = None,
-) -> _TSQLModel:
-    # Copy from Pydantic's BaseModel.construct()
-    # Ref: https://github.com/pydantic/pydantic/blob/v2.5.2/pydantic/main.py#L198
-    # Modified to not include everything, only the model fields, and to
-    # set relationships
-    # SQLModel override to get class SQLAlchemy __dict__ attributes and
-    # set them back in after creating the object
-    # new_obj = cls.__new__(cls)
-    cls = type(self_instance)
-    old_dict = self_instance.__dict__.copy()
-    # End SQLModel override
-
-    fields_values: dict[str, Any] = {}
-    defaults: dict[
-        str, Any
-    ] = {}  # keeping this separate from `fields_values` helps us compute `_fields_set`
-    for name, field in cls.model_fields.items():
-        if field.alias and field.alias in values:
-            fields_values[name] = values.pop(field.alias)
-        elif name in values:
-            fields_values[name] = values.pop(name)
-        elif not field.is_required():
-            defaults[name] = field.get_default(call_default_factory=True)
-    if _fields_set is None:
-        _fields_set = set(fields_values.keys())
-    fields_values.update(defaults)
-
-    _extra: dict[str, Any] | None = None
-    if cls.model_config.get("extra") == "allow":
-        _extra = {}
-        for k, v in values.items():
-            _extra[k] = v
-    # SQLModel override, do not include everything, only the model fields
-    # else:
-    #     fields_values.update(values)
-    # End SQLModel override
-    # SQLModel override
-    # Do not set __dict__, instead use setattr to trigger SQLAlchemy
-    # object.__setattr__(new_obj, "__dict__", fields_values)
-    # instrumentation
-    for key, value in {**old_dict, **fields_values}.items():
-        setattr(self_instance, key, value)
-    # End SQLModel override
-    object.__setattr__(self_instance, "__pydantic_fields_set__", _fields_set)
+TableInit: TypeAlias = Callable[[Any, dict[str, Any]], None]
+
+
+def build_table_init(
+    cls: type["SQLModel"], *, direct_set: bool, construct: bool = False
+) -> TableInit:
+    # Generate a constructor specialized for this table model class, it does the
+    # same as Pydantic's BaseModel.model_construct(), but only for the model fields,
+    # setting relationships, with the loop over the model fields unrolled, and
+    # with the aliases and defaults resolved once per class.
+    # With direct_set, values are set with SQLAlchemy's set_attribute(), that also
+    # stores them in the instance __dict__, instead of going through __setattr__.
+    # With construct, for model_construct(), values are stored in the instance
+    # __dict__ directly and relationships are left to the caller
+    class_info = cls.__sqlmodel_class_info__
+    field_aliases = {name: alias for alias, name in class_info.alias_to_field.items()}
+    namespace: dict[str, Any] = {
+        "_set": set_attribute if direct_set else setattr,
+        "_object_setattr": object.__setattr__,
+        "_missing": object(),
+        "_undefined": Undefined,
+    }
+    lookup_lines: list[str] = []
+    explicit_lines: list[str] = []
+    default_lines: list[str] = []
+    for i, (name, field) in enumerate(cls.model_fields.items()):
+        key = repr(name)
+        lookup_lines.append(f"    v{i} = _missing")
+        alias = field_aliases.get(name)
+        keys = [alias, name] if alias else [name]
+        for j, value_key in enumerate(keys):
+            condition = "elif" if j else "if"
+            lookup_lines.append(f"    {condition} {value_key!r} in values:")
+            lookup_lines.append(f"        v{i} = values.pop({value_key!r})")
+            lookup_lines.append(f"        fields_set.add({key})")
+        set_line = f"dict_[{key}] = " if construct else f"_set(self, {key}, "
+        set_end = "" if construct else ")"
+        explicit_lines.append(f"    if v{i} is not _missing:")
+        explicit_lines.append(f"        {set_line}v{i}{set_end}")
+        if name in class_info.required_fields:
+            continue
+        if name in class_info.default_factories:
+            namespace[f"default_factory_{i}"] = class_info.default_factories[name]
+            default_expr = f"default_factory_{i}()"
+        elif (
+            field.default_factory is None
+            and type(field.default) in IMMUTABLE_VALUE_TYPES
+        ):
+            namespace[f"default_{i}"] = field.default
+            default_expr = f"default_{i}"
+        else:
+            namespace[f"field_{i}"] = field
+            default_expr = f"field_{i}.get_default(call_default_factory=True)"
+        lookup_lines.append("    else:")
+        lookup_lines.append(f"        d{i} = {default_expr}")
+        default_lines.append(f"    if v{i} is _missing:")
+        default_lines.append(f"        {set_line}d{i}{set_end}")
+    final_lines = ["    _object_setattr(self, '__pydantic_fields_set__', fields_set)"]
     if not cls.__pydantic_root_model__:
-        object.__setattr__(self_instance, "__pydantic_extra__", _extra)
-
+        extra = "dict(values)" if cls.model_config.get("extra") == "allow" else "None"
+        final_lines.append(f"    _object_setattr(self, '__pydantic_extra__', {extra})")
     if cls.__pydantic_post_init__:
-        self_instance.model_post_init(None)
+        final_lines.append("    self.model_post_init(None)")
     elif not cls.__pydantic_root_model__:
-        # Note: if there are any private attributes, cls.__pydantic_post_init__ would exist
-        # Since it doesn't, that means that `__pydantic_private__` should be set to None
-        object.__setattr__(self_instance, "__pydantic_private__", None)
-    # SQLModel override, set relationships
-    # Get and set any relationship objects
-    for key in self_instance.__sqlmodel_relationships__:
-        value = values.get(key, Undefined)
-        if value is not Undefined:
-            setattr(self_instance, key, value)
-    # End SQLModel override
-    return self_instance
+        final_lines.append("    _object_setattr(self, '__pydantic_private__', None)")
+    for key in map(repr, () if construct else cls.__sqlmodel_relationships__):
+        final_lines.append(f"    value = values.get({key}, _undefined)")
+        final_lines.append("    if value is not _undefined:")
+        final_lines.append(f"        _set(self, {key}, value)")
+    source = "\n".join(
+        [
+            "def __sqlmodel_table_init__(self, values):",
+            "    fields_set = set()",
+            *(["    dict_ = self.__dict__"] if construct else []),
+            *lookup_lines,
+            *explicit_lines,
+            *default_lines,
+            *final_lines,
+        ]
+    )
+    exec(source, namespace)
+    table_init: TableInit = namespace["__sqlmodel_table_init__"]
+    return table_init
 
 
 def sqlmodel_validate(
@@ -282,7 +428,8 @@ def sqlmodel_validate(
     context: dict[str, Any] | None = None,
     update: dict[str, Any] | None = None,
 ) -> _TSQLModel:
-    if not is_table_model_class(cls):
+    table = cls.__sqlmodel_class_info__.table
+    if not table:
         new_obj: _TSQLModel = cls.__new__(cls)
     else:
         # If table, create the new instance normally to make SQLAlchemy create
@@ -294,10 +441,8 @@ def sqlmodel_validate(
     # set them back in after creating the object
     old_dict = new_obj.__dict__.copy()
     use_obj = obj
-    if isinstance(obj, dict) and update:
-        use_obj = {**obj, **update}
-    elif update:
-        use_obj = ObjectWithUpdateWrapper(obj=obj, update=update)
+    if update:
+        use_obj = get_object_with_update(obj, update)
     cls.__pydantic_validator__.validate_python(
         use_obj,
         strict=strict,
@@ -305,41 +450,392 @@ def sqlmodel_validate(
         context=context,
         self_instance=new_obj,
     )
+    if not table:
+        # If not table, normal Pydantic code, validate_python() already set
+        # __dict__ and the fields set, only keep anything that was there before
+        if old_dict:
+            object.__setattr__(new_obj, "__dict__", {**old_dict, **new_obj.__dict__})
+        return new_obj
     # Capture fields set to restore it later
     fields_set = new_obj.__pydantic_fields_set__.copy()
-    if not is_table_model_class(cls):
-        # If not table, normal Pydantic code, set __dict__
-        new_obj.__dict__ = {**old_dict, **new_obj.__dict__}
-    else:
-        # Do not set __dict__, instead use setattr to trigger SQLAlchemy
-        # instrumentation
-        for key, value in {**old_dict, **new_obj.__dict__}.items():
-            setattr(new_obj, key, value)
+    # Do not set __dict__, instead use setattr to trigger SQLAlchemy
+    # instrumentation
+    for key, value in {**old_dict, **new_obj.__dict__}.items():
+        setattr(new_obj, key, value)
     # Restore fields set
     object.__setattr__(new_obj, "__pydantic_fields_set__", fields_set)
     # Get and set any relationship objects
-    if is_table_model_class(cls):
+    for key in new_obj.__sqlmodel_relationships__:
+        value = getattr(use_obj, key, Undefined)
+        if value is not Undefined:
+            setattr(new_obj, key, value)
+    return new_obj
+
+
+def get_list_validator(cls: type["SQLModel"]) -> SchemaValidator | None:
+    # A validator for a list of the model fields, the same that the model validator
+    # uses internally, it returns (__dict__, __pydantic_extra__, fields set) for
+    # each item. The model schema itself can't be used, pydantic-core would use the
+    # prebuilt model validator, that calls Model(**data) as SQLModel overrides
+    # __init__, and that doesn't validate table models.
+    # Only plain model schemas are supported, e.g. not with "after" or "wrap"
+    # model validators, or self-referencing models. It's created the first time
+    # it's needed, as most models never validate lists
+    validator = cls.__dict__.get("__sqlmodel_list_validator__", Undefined)
+    if validator is Undefined:
+        validator = None
+        schema = cls.__pydantic_core_schema__
+        if schema["type"] == "model" and not schema.get("root_model"):
+            validator = SchemaValidator(
+                core_schema.list_schema(schema["schema"]), schema.get("config")
+            )
+        type.__setattr__(cls, "__sqlmodel_list_validator__", validator)
+    return validator
+
+
+_ERROR_TYPES = frozenset(get_args(core_schema.ErrorType))
+
+
+def _validate_one_by_one(
+    cls: type[_TSQLModel],
+    objs: list[Any],
+    *,
+    strict: bool | None = None,
+    from_attributes: bool | None = None,
+    context: dict[str, Any] | None = None,
+    update: dict[str, Any] | None = None,
+) -> list[_TSQLModel]:
+    new_objs: list[_TSQLModel] = []
+    line_errors: list[InitErrorDetails] = []
+    title = cls.__name__
+    for index, obj in enumerate(objs):
+        try:
+            new_obj = sqlmodel_validate(
+                cls,
+                obj,
+                strict=strict,
+                from_attributes=from_attributes,
+                context=context,
+                update=update,
+            )
+        except ValidationError as e:
+            # The same errors as the list validator, with the index first in the loc
+            title = e.title
+            for error in e.errors(include_url=False):
+                error_type: Any = error["type"]
+                if error_type not in _ERROR_TYPES:
+                    error_type = PydanticCustomError(
+                        error_type,
+                        error["msg"],  # ty: ignore[invalid-argument-type]
+                        error.get("ctx"),
+                    )
+                details = InitErrorDetails(
+                    type=error_type, loc=(index, *error["loc"]), input=error["input"]
+                )
+                if "ctx" in error:
+                    details["ctx"] = error["ctx"]
+                line_errors.append(details)
+        else:
+            new_objs.append(new_obj)
+    if line_errors:
+        raise ValidationError.from_exception_data(title, line_errors)
+    return new_objs
+
+
+def get_set_listener_names(cls: type["SQLModel"], manager: Any) -> list[str]:
+    # The attribute implementations only exist once the mappers are configured,
+    # e.g. after the first "init" event
+    return [
+        name
+        for name in cls.__sqlmodel_class_info__.field_names
+        if manager[name].impl.dispatch.set
+    ]
+
+
+def get_table_construct(cls: type["SQLModel"]) -> TableInit:
+    # Built on first use, most table models never call model_construct()
+    table_construct = cls.__dict__.get("__sqlmodel_table_construct__")
+    if table_construct is None:
+        table_construct = build_table_init(cls, direct_set=True, construct=True)
+        type.__setattr__(cls, "__sqlmodel_table_construct__", table_construct)
+    return table_construct
+
+
+def sqlmodel_table_model_construct(
+    cls: type[_TSQLModel], fields_set: set[str] | None, values: dict[str, Any]
+) -> _TSQLModel:
+    relationships = {
+        key: values.pop(key) for key in cls.__sqlmodel_relationships__ if key in values
+    }
+    manager = opt_manager_of_class(cls)
+    if manager is None:
+        # Not mapped itself, e.g. a subclass of a table model, let the instrumented
+        # __init__ create the state for it
+        with partial_init():
+            new_obj = cls()
+    else:
+        # The same the instrumented __init__ does, without calling __init__
+        new_obj = cls.__new__(cls)
+        manager.setup_instance(new_obj)
+        state = new_obj.__dict__["_sa_instance_state"]
+        manager.dispatch.init(state, (), {})  # ty: ignore[unresolved-attribute]
+    get_table_construct(cls)(new_obj, values)
+    if fields_set is not None:
+        object.__setattr__(new_obj, "__pydantic_fields_set__", fields_set)
+    if manager is not None:
+        # Trigger "set" event listeners, e.g. from @validates()
+        instance_dict = new_obj.__dict__
+        for name in get_set_listener_names(cls, manager):
+            if name in instance_dict:
+                set_attribute(new_obj, name, instance_dict[name])
+    for key, value in relationships.items():
+        setattr(new_obj, key, value)
+    return new_obj
+
+
+def sqlmodel_validate_many(
+    cls: type[_TSQLModel],
+    objs: Iterable[Any],
+    *,
+    strict: bool | None = None,
+    from_attributes: bool | None = None,
+    context: dict[str, Any] | None = None,
+    update: dict[str, Any] | None = None,
+    direct_set: bool = False,
+) -> list[_TSQLModel]:
+    objs = list(objs)
+    validator = get_list_validator(cls)
+    if validator is None:
+        return _validate_one_by_one(
+            cls,
+            objs,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+            update=update,
+        )
+    use_objs = objs
+    if update:
+        use_objs = [get_object_with_update(obj, update) for obj in objs]
+    # Validate all the objects in a single call, a ValidationError includes the
+    # errors of all the objects, with their index as the first item in the loc
+    results = validator.validate_python(
+        use_objs, strict=strict, from_attributes=from_attributes, context=context
+    )
+    table = cls.__sqlmodel_class_info__.table
+    manager = opt_manager_of_class(cls) if table else None
+    listened_names: list[str] | None = None
+    new_objs: list[_TSQLModel] = []
+    for use_obj, (values, extra, fields_set) in zip(use_objs, results, strict=True):
+        if table and (manager is None or not direct_set):
+            # Create the new instance normally and set the values with setattr, the
+            # same as sqlmodel_validate()
+            with partial_init():
+                new_obj = cls()
+            for key, value in values.items():
+                setattr(new_obj, key, value)
+        else:
+            # The same as pydantic-core does when validating a model
+            new_obj = cls.__new__(cls)
+            object.__setattr__(new_obj, "__dict__", values)
+        object.__setattr__(new_obj, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(new_obj, "__pydantic_extra__", extra)
+        if cls.__pydantic_post_init__:
+            new_obj.model_post_init(context)
+        if not table:
+            new_objs.append(new_obj)
+            continue
+        if manager is not None and direct_set:
+            # The values are already in __dict__, only attach the SQLAlchemy state,
+            # as the instrumented __init__ would do
+            manager.setup_instance(new_obj)
+            state = new_obj.__dict__["_sa_instance_state"]
+            manager.dispatch.init(state, (), {})  # ty: ignore[unresolved-attribute]
+            if listened_names is None:
+                # After the first "init" event, that configures the mappers
+                listened_names = get_set_listener_names(cls, manager)
+            # Trigger "set" event listeners, e.g. from @validates()
+            for name in listened_names:
+                if name in values:
+                    set_attribute(new_obj, name, values[name])
         for key in new_obj.__sqlmodel_relationships__:
             value = getattr(use_obj, key, Undefined)
             if value is not Undefined:
                 setattr(new_obj, key, value)
-    return new_obj
+        new_objs.append(new_obj)
+    return new_objs
 
 
 def sqlmodel_init(*, self: "SQLModel", data: dict[str, Any]) -> None:
+    cls = self.__class__
+    if cls.__sqlmodel_class_info__.table:
+        # The constructor generated for the class sets all the values through
+        # SQLAlchemy, so the existing __dict__ is kept as is
+        cls.__sqlmodel_table_init__(self, data)
+        return
     old_dict = self.__dict__.copy()
-    if not is_table_model_class(self.__class__):
-        self.__pydantic_validator__.validate_python(
-            data,
-            self_instance=self,
-        )
-    else:
-        sqlmodel_table_construct(
-            self_instance=self,
-            values=data,
-        )
+    self.__pydantic_validator__.validate_python(
+        data,
+        self_instance=self,
+    )
     object.__setattr__(
         self,
         "__dict__",
         {**old_dict, **self.__dict__},
     )
+
+
+def _get_relationships_to_dump(
+    cls: type["SQLModel"], relationships: Mapping[str, Any] | int
+) -> dict[str, Mapping[str, Any] | int]:
+    # Normalize the relationships to dump for cls into {name: nested relationships}
+    if not isinstance(relationships, Mapping):
+        if relationships <= 0:
+            return {}
+        return dict.fromkeys(cls.__sqlmodel_relationships__, relationships - 1)
+    result: dict[str, Mapping[str, Any] | int] = {}
+    for name, nested in relationships.items():
+        if name not in cls.__sqlmodel_relationships__:
+            raise ValueError(f"{name!r} is not a relationship of {cls.__name__}")
+        if not nested:
+            continue
+        result[name] = nested if isinstance(nested, Mapping) else int(nested) - 1
+    return result
+
+
+_NO_TARGET = object()
+_LOAD_CHUNK_SIZE = 500
+
+
+def _get_target_identity_getter(
+    mapper: Any, name: str
+) -> Callable[[dict[str, Any]], Any] | None:
+    # For a many-to-one using the primary key of the target, return a function to
+    # get the identity key of the target from the loaded values of an object
+    prop = mapper.relationships[name]
+    if prop.direction is not MANYTOONE or prop.secondary is not None:
+        return None
+    target = prop.mapper
+    remote_to_local = {remote: local for local, remote in prop.local_remote_pairs}
+    if set(remote_to_local) != set(target.primary_key):
+        return None
+    keys = [
+        mapper.get_property_by_column(remote_to_local[column]).key
+        for column in target.primary_key
+    ]
+
+    def get_target_identity(values: dict[str, Any]) -> Any:
+        if any(key not in values for key in keys):
+            return None
+        primary_key = [values[key] for key in keys]
+        if any(value is None for value in primary_key):
+            return _NO_TARGET
+        return target.identity_key_from_primary_key(primary_key)
+
+    return get_target_identity
+
+
+def _load_relationship(objs: list["SQLModel"], name: str) -> None:
+    # Load the relationship for all the objects not having it yet, selecting only
+    # the related objects, joined from the primary keys of the objects, with one
+    # query for each session, and set them as the loaded value of each object
+    cls = type(objs[0])
+    mapper = inspect(cls)
+    prop = mapper.relationships[name]
+    get_target_identity = _get_target_identity_getter(mapper, name)
+    by_session: dict[Any, dict[Any, SQLModel]] = {}
+    for obj in objs:
+        if name in obj.__dict__:
+            continue
+        state = instance_state(obj)
+        session = state.session
+        if session is None or state.identity is None:
+            continue
+        if get_target_identity is not None:
+            # A many-to-one already in the session is got without a query
+            target_identity = get_target_identity(obj.__dict__)
+            if target_identity is not None and (
+                target_identity is _NO_TARGET or target_identity in session.identity_map
+            ):
+                continue
+        by_session.setdefault(session, {})[state.identity] = obj
+    if not any(len(identity_objs) > 1 for identity_objs in by_session.values()):
+        # A single object is loaded with one query anyway when accessed
+        return
+    pk = [
+        getattr(cls, mapper.get_property_by_column(column).key)
+        for column in mapper.primary_key
+    ]
+    # Aliased, for relationships to the same table, e.g. parent and children
+    target = aliased(prop.mapper)
+    order_by = []
+    if prop.order_by:
+        order_by = [inspect(target)._adapt_element(column) for column in prop.order_by]
+    for session, identity_objs in by_session.items():
+        if len(identity_objs) < 2:
+            continue
+        keys = list(identity_objs)
+        # Split in chunks, the same as selectinload(), for the bound parameters limits
+        for start in range(0, len(keys), _LOAD_CHUNK_SIZE):
+            chunk = keys[start : start + _LOAD_CHUNK_SIZE]
+            if len(pk) == 1:
+                where = pk[0].in_([identity[0] for identity in chunk])
+            else:
+                where = tuple_(*pk).in_(chunk)
+            statement = (
+                select(*pk, target)
+                .join(getattr(cls, name).of_type(target))
+                .where(where)
+                .order_by(*order_by)
+            )
+            values: dict[Any, list[Any]] = {identity: [] for identity in chunk}
+            for *identity, value in session.execute(statement):
+                values[tuple(identity)].append(value)
+            for identity, related in values.items():
+                set_committed_value(
+                    identity_objs[identity],
+                    name,
+                    related if prop.uselist else next(iter(related), None),
+                )
+
+
+def sqlmodel_dump_relationships(
+    objs: list["SQLModel"],
+    dumps: list[dict[str, Any]],
+    relationships: Mapping[str, Any] | int,
+    dump_kwargs: dict[str, Any],
+) -> None:
+    # Add the dumped relationships to the dumps of objs, loading each relationship
+    # for all the objects of the same class at once, one level at a time
+    by_class: dict[type[SQLModel], list[int]] = {}
+    for index, obj in enumerate(objs):
+        by_class.setdefault(type(obj), []).append(index)
+    for cls, indexes in by_class.items():
+        cls_objs = [objs[index] for index in indexes]
+        to_dump = _get_relationships_to_dump(cls, relationships)
+        for name, nested in to_dump.items():
+            _load_relationship(cls_objs, name)
+            children: list[SQLModel] = []
+            children_dumps: list[dict[str, Any]] = []
+            for index, obj in zip(indexes, cls_objs, strict=True):
+                value = getattr(obj, name)
+                if value is None:
+                    dumps[index][name] = None
+                    continue
+                if isinstance(value, BaseModel):
+                    child_dump = value.model_dump(**dump_kwargs)
+                    dumps[index][name] = child_dump
+                    children.append(value)
+                    children_dumps.append(child_dump)
+                    continue
+                items = []
+                for child in value:
+                    child_dump = child.model_dump(**dump_kwargs)
+                    items.append(child_dump)
+                    children.append(child)
+                    children_dumps.append(child_dump)
+                dumps[index][name] = items
+            if children and nested:
+                sqlmodel_dump_relationships(
+                    children, children_dumps, nested, dump_kwargs
+                )
@@ -0,0 +1,437 @@
+from array import array
+from collections.abc import Iterator, Mapping
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.engine.cursor import CursorResult
+from sqlalchemy.engine.result import _NO_ROW, FilterResult, Result
+from sqlalchemy.engine.result import ScalarResult as _ScalarResult
+from sqlalchemy.engine.result import TupleResult as _TupleResult
+from sqlalchemy.types import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Integer,
+    Interval,
+    LargeBinary,
+    SmallInteger,
+    String,
+)
+
+_T = TypeVar("_T", bound=Any)
+
+# The list serializers of the models, they go away with the model classes
+_list_adapters: "WeakKeyDictionary[type[BaseModel], TypeAdapter[list[Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_model(items: list[Any]) -> type[BaseModel] | None:
+    # The model class when all the items are instances of the same one, to use its
+    # own serializer, skipping the type inference for each item
+    if not items:
+        return None
+    model = type(items[0])
+    if not issubclass(model, BaseModel):
+        return None
+    if any(type(item) is not model for item in items):
+        return None
+    return model
+
+
+# Built on first use, not when importing the module
+@cache
+def _get_any_adapter() -> TypeAdapter[Any]:
+    return TypeAdapter(Any)
+
+
+@cache
+def _get_any_list_adapter() -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[Any])
+
+
+def _get_list_adapter(model: type[BaseModel] | None) -> TypeAdapter[list[Any]]:
+    if model is None:
+        return _get_any_list_adapter()
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = TypeAdapter(list[model])  # ty: ignore[invalid-type-form]
+        _list_adapters[model] = adapter
+    return adapter
+
+
+def _dump_json_relationships(
+    items: list[Any],
+    relationships: Mapping[str, Any] | int,
+    *,
+    indent: int | None,
+    include: Any,
+    exclude: Any,
+    dump_kwargs: dict[str, Any],
+) -> bytes:
+    from .._compat import sqlmodel_dump_relationships
+
+    if any(not hasattr(item, "__sqlmodel_relationships__") for item in items):
+        raise ValueError("Relationships can only be dumped for SQLModel models")
+    dumps = [
+        item.model_dump(include=include, exclude=exclude, **dump_kwargs)
+        for item in items
+    ]
+    sqlmodel_dump_relationships(items, dumps, relationships, dump_kwargs)
+    return _get_list_adapter(None).dump_json(dumps, indent=indent)
+
+
+# The array typecode, NumPy dtype, and Arrow type name for each SQLAlchemy type,
+# checked in order, so subclasses come before their base classes
+_COLUMN_TYPES: list[tuple[type[Any], str | None, str, str | None]] = [
+    (Boolean, "b", "bool", "bool_"),
+    (SmallInteger, "h", "int16", "int16"),
+    (BigInteger, "q", "int64", "int64"),
+    (Integer, "q", "int64", "int64"),
+    (Float, "d", "float64", "float64"),
+    (DateTime, None, "datetime64[us]", None),
+    (Date, None, "datetime64[D]", "date32"),
+    (Interval, None, "timedelta64[us]", None),
+    (Enum, None, "object", "string"),
+    (String, None, "object", "string"),
+    (LargeBinary, None, "object", "binary"),
+]
+
+
+def _get_column_type(sa_type: Any) -> tuple[str | None, str, str | None]:
+    for type_, typecode, dtype, arrow_type in _COLUMN_TYPES:
+        if isinstance(sa_type, type_):
+            return typecode, dtype, arrow_type
+    return None, "object", None
+
+
+def _fetch_columns(
+    raw: CursorResult[Any], batch_size: int
+) -> tuple[list[str], list[Any], list["array[Any] | list[Any]"]]:
+    # Read the rows from the cursor in batches, without building any objects,
+    # into an array for each column with a numeric type, or a list otherwise,
+    # e.g. when a numeric column has NULL values
+    keys = list(raw.keys())
+    result_columns = getattr(raw.context.compiled, "_result_columns", None)
+    sa_types = [entry.type for entry in result_columns or ()] or [None] * len(keys)
+    columns: list[array[Any] | list[Any]] = []
+    for sa_type in sa_types:
+        typecode = _get_column_type(sa_type)[0]
+        columns.append(array(typecode) if typecode else [])
+    while rows := raw.fetchmany(batch_size):
+        for index, values in enumerate(zip(*rows, strict=True)):
+            column = columns[index]
+            if isinstance(column, array):
+                size = len(column)
+                try:
+                    column.extend(values)
+                    continue
+                except (TypeError, OverflowError):
+                    # The values before the invalid one were already added
+                    column = columns[index] = column.tolist()[:size]
+            column.extend(values)
+    return keys, sa_types, columns
+
+
+class _ExportResult(FilterResult[_T]):
+    # The methods to export the selected columns, for ScalarResult and TupleResult
+
+    __slots__ = ()
+
+    def _get_raw(self) -> CursorResult[Any]:
+        raw = getattr(self._real_result, "raw", None)
+        if not isinstance(raw, CursorResult):
+            raise ValueError(
+                "The columns can only be exported from a new result of a select "
+                "statement, without into()"
+            )
+        if raw._soft_closed:
+            # e.g. AsyncSession.exec() fetches all the rows before returning
+            raise ValueError(
+                "The columns can't be exported, the rows of this result were "
+                "already fetched from the database"
+            )
+        return raw
+
+    def to_columns(
+        self, *, batch_size: int = 10_000, numpy: bool = False
+    ) -> dict[str, Any]:
+        """
+        Fetch all the rows and return the values of each selected column, by
+        column name, reading them from the database cursor in batches of
+        `batch_size` rows, without creating any model or ORM objects.
+
+        The columns with a numeric type, from the field type, e.g. `int`, are
+        returned as compact `array.array` objects, other columns, and columns with
+        `None` values, as lists.
+
+        With `numpy=True`, each column is a NumPy array instead, with a dtype from
+        the field type, e.g. `int64` or `datetime64[D]`, or `object`.
+
+        Call it on a new result, before fetching any rows from it.
+        """
+        raw = self._get_raw()
+        if numpy:
+            try:
+                np = import_module("numpy")
+            except ImportError as e:  # pragma: no cover
+                raise ImportError(
+                    "NumPy is needed to use to_columns(numpy=True), install it "
+                    "with: pip install numpy"
+                ) from e
+        keys, sa_types, columns = _fetch_columns(raw, batch_size)
+        self.close()
+        if not numpy:
+            return dict(zip(keys, columns, strict=True))
+        arrays: dict[str, Any] = {}
+        for key, sa_type, column in zip(keys, sa_types, columns, strict=True):
+            dtype = _get_column_type(sa_type)[1]
+            if isinstance(column, array):
+                # Copied from the array buffer in one go, also makes it writable
+                arrays[key] = np.frombuffer(column, dtype=column.typecode).astype(dtype)
+                continue
+            try:
+                arrays[key] = np.array(column, dtype=dtype)
+            except (TypeError, ValueError):
+                # e.g. timezone aware datetimes or None in integer columns
+                arrays[key] = np.array(column, dtype=object)
+        return arrays
+
+    def to_arrow(self, *, batch_size: int = 10_000) -> Any:
+        """
+        Fetch all the rows and return a `pyarrow.Table` with the selected columns,
+        the same as `to_columns()`, with the Arrow types from the field types,
+        `None` values are stored as nulls.
+        """
+        raw = self._get_raw()
+        try:
+            pa = import_module("pyarrow")
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "PyArrow is needed to use to_arrow(), install it with: "
+                "pip install pyarrow"
+            ) from e
+        keys, sa_types, columns = _fetch_columns(raw, batch_size)
+        self.close()
+        arrays = []
+        for sa_type, column in zip(sa_types, columns, strict=True):
+            arrow_type = _get_column_type(sa_type)[2]
+            values = column.tolist() if isinstance(column, array) else column
+            if arrow_type == "bool_" and isinstance(column, array):
+                values = [value != 0 for value in values]
+            elif isinstance(sa_type, Enum) and sa_type.enum_class is not None:
+                # The names of the enum members, as they are stored by default
+                values = [value if value is None else value.name for value in values]
+            arrays.append(
+                pa.array(values, type=getattr(pa, arrow_type)() if arrow_type else None)
+            )
+        return pa.Table.from_arrays(arrays, names=keys)
+
+
+class ScalarResult(_ScalarResult[_T], _ExportResult[_T]):
+    """
+    The result of `session.exec()` for a select of a single column or model,
+    e.g. `select(Hero)`, with methods to serialize it to JSON, or to export the
+    columns for analytics tools.
+    """
+
+    __slots__ = ()
+
+    def dump_json(
+        self,
+        *,
+        indent: int | None = None,
+        include: Any = None,
+        exclude: Any = None,
+        by_alias: bool | None = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        relationships: Mapping[str, Any] | int | None = None,
+    ) -> bytes:
+        """
+        Fetch all the remaining items and serialize them to a JSON array, as
+        `bytes`, in a single call to Pydantic's serializer, without building a
+        dict for each item first.
+
+        The items are serialized the same as with `model_dump_json()`, `include`
+        and `exclude` apply to each item, e.g. `exclude={"secret_name"}`.
+
+        Pass `relationships` to also dump relationships of table models, the same
+        as with `model_dump()`, e.g. `{"heroes": True}` or a depth. Relationships
+        not loaded yet are loaded for all the items at once, with one query for
+        each level.
+        """
+        items = list(self.all())
+        if relationships:
+            return _dump_json_relationships(
+                items,
+                relationships,
+                indent=indent,
+                include=include,
+                exclude=exclude,
+                dump_kwargs={
+                    "mode": "json",
+                    "by_alias": by_alias,
+                    "exclude_unset": exclude_unset,
+                    "exclude_defaults": exclude_defaults,
+                    "exclude_none": exclude_none,
+                    "round_trip": round_trip,
+                },
+            )
+        return _get_list_adapter(_get_model(items)).dump_json(
+            items,
+            indent=indent,
+            include={"__all__": include} if include is not None else None,
+            exclude={"__all__": exclude} if exclude is not None else None,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+        )
+
+    def iter_ndjson(
+        self,
+        *,
+        chunk_size: int = 1000,
+        include: Any = None,
+        exclude: Any = None,
+        by_alias: bool | None = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        Serialize the items to newline delimited JSON, one JSON object per line,
+        yielding a chunk of `bytes` for each `chunk_size` items, e.g. to send it
+        in a streaming response.
+
+        With the `yield_per` execution option, e.g.
+        `select(Hero).execution_options(yield_per=1000)`, the rows are also
+        fetched from the database in chunks, as they are serialized.
+        """
+        for partition in self.partitions(chunk_size):
+            items = list(partition)
+            model = _get_model(items)
+            serializer = (
+                _get_any_adapter().serializer
+                if model is None
+                else model.__pydantic_serializer__
+            )
+            lines = [
+                serializer.to_json(
+                    item,
+                    include=include,
+                    exclude=exclude,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                )
+                for item in items
+            ]
+            lines.append(b"")
+            yield b"\n".join(lines)
+
+
+class TupleResult(_TupleResult[_T], _ExportResult[_T]):
+    """
+    The result of `session.exec()` for a select of several columns or models,
+    e.g. `select(Hero.id, Hero.age)`, with the same rows as SQLAlchemy's result,
+    and methods to export the columns for analytics tools.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, real_result: Result[Any]) -> None:
+        self._real_result = real_result
+        self._metadata = real_result._metadata
+        self._post_creational_filter = None
+        self._unique_filter_state = real_result._unique_filter_state
+
+    if not TYPE_CHECKING:
+        # SQLAlchemy's TupleResult only declares these for type checkers, the same
+        # as Result does them, for the rows of the real result
+
+        def keys(self):
+            return self._metadata.keys
+
+        def unique(self, strategy=None):
+            self._unique_filter_state = (set(), strategy)
+            return self
+
+        def columns(self, *col_expressions):
+            return self._column_slices(col_expressions)
+
+        def partitions(self, size=None):
+            getter = self._manyrow_getter
+            while partition := getter(self, size):
+                yield partition
+
+        def fetchall(self):
+            return self._allrows()
+
+        def fetchone(self):
+            row = self._onerow_getter(self)
+            return None if row is _NO_ROW else row
+
+        def fetchmany(self, size=None):
+            return self._manyrow_getter(self, size)
+
+        def all(self):
+            return self._allrows()
+
+        def __iter__(self):
+            return self._iter_impl()
+
+        def __next__(self):
+            return self._next_impl()
+
+        def first(self):
+            return self._only_one_row(
+                raise_for_second_row=False, raise_for_none=False, scalar=False
+            )
+
+        def one_or_none(self):
+            return self._only_one_row(
+                raise_for_second_row=True, raise_for_none=False, scalar=False
+            )
+
+        def one(self):
+            return self._only_one_row(
+                raise_for_second_row=True, raise_for_none=True, scalar=False
+            )
+
+        # The other methods of SQLAlchemy's Result
+        def scalar_one(self):
+            return self._real_result.scalar_one()
+
+        def scalar_one_or_none(self):
+            return self._real_result.scalar_one_or_none()
+
+        def scalar(self):
+            return self._real_result.scalar()
+
+        def scalars(self, index=0):
+            return ScalarResult(self._real_result, index)
+
+        def mappings(self):
+            return self._real_result.mappings()
+
+        def tuples(self):
+            return self
+
+        t = property(tuples)
+
+        def freeze(self):
+            return self._real_result.freeze()
@@ -0,0 +1,3 @@
+from sqlmodel import _lazy_submodules
+
+__getattr__ = _lazy_submodules(__name__)
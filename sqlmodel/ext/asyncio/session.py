@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import (
     Any,
     TypeVar,
@@ -6,30 +6,53 @@ from typing import (
     overload,
 )
 
+from pydantic import BaseModel
 from sqlalchemy import util
 from sqlalchemy.engine.cursor import CursorResult
 from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
-from sqlalchemy.engine.result import Result, ScalarResult, TupleResult
+from sqlalchemy.engine.result import Result
 from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
-from sqlalchemy.ext.asyncio.result import _ensure_sync_result
-from sqlalchemy.ext.asyncio.session import _EXECUTE_OPTIONS
+from sqlalchemy.ext.asyncio.result import (
+    AsyncResult,
+    AsyncScalarResult,
+    AsyncTupleResult,
+    _ensure_sync_result,
+)
+from sqlalchemy.ext.asyncio.session import _EXECUTE_OPTIONS, _STREAM_OPTIONS
+from sqlalchemy.orm import Session as _Session
 from sqlalchemy.orm._typing import OrmExecuteOptionsParameter
 from sqlalchemy.sql.base import Executable as _Executable
 from sqlalchemy.sql.dml import UpdateBase
 from sqlalchemy.util.concurrency import greenlet_spawn
 from typing_extensions import deprecated
 
-from ...orm.session import Session
+from ...engine.result import ScalarResult, TupleResult
+from ...orm.session import (
+    Session,
+    SessionStats,
+    _get_into_result,
+    _track_hydration,
+)
 from ...sql.base import Executable
 from ...sql.expression import Select, SelectOfScalar
+from ...sql.prepared import record_execution
 
 _TSelectParam = TypeVar("_TSelectParam", bound=Any)
+_TModel = TypeVar("_TModel", bound=BaseModel)
 
 
 class AsyncSession(_AsyncSession):
     sync_session_class: type[Session] = Session
     sync_session: Session
 
+    @property
+    def stats(self) -> SessionStats | None:
+        """
+        The counters of the session, when created with `stats=True`, see
+        `SessionStats`.
+        """
+        return self.sync_session.stats
+
     @overload
     async def exec(
         self,
@@ -54,6 +77,19 @@ class AsyncSession(_AsyncSession):
         _add_event: Any | None = None,
     ) -> ScalarResult[_TSelectParam]: ...
 
+    @overload
+    async def exec(
+        self,
+        statement: SelectOfScalar[Any],
+        *,
+        into: type[_TModel],
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+        _parent_execute_state: Any | None = None,
+        _add_event: Any | None = None,
+    ) -> ScalarResult[_TModel]: ...
+
     @overload
     async def exec(
         self,
@@ -73,12 +109,13 @@ class AsyncSession(_AsyncSession):
         | Executable[_TSelectParam]
         | UpdateBase,
         *,
+        into: type[BaseModel] | None = None,
         params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
         execution_options: Mapping[str, Any] = util.EMPTY_DICT,
         bind_arguments: dict[str, Any] | None = None,
         _parent_execute_state: Any | None = None,
         _add_event: Any | None = None,
-    ) -> TupleResult[_TSelectParam] | ScalarResult[_TSelectParam] | CursorResult[Any]:
+    ) -> TupleResult[_TSelectParam] | ScalarResult[Any] | CursorResult[Any]:
         if execution_options:
             execution_options = util.immutabledict(execution_options).union(
                 _EXECUTE_OPTIONS
@@ -89,6 +126,7 @@ class AsyncSession(_AsyncSession):
         result = await greenlet_spawn(
             self.sync_session.exec,
             statement,
+            into=into,
             params=params,
             execution_options=execution_options,
             bind_arguments=bind_arguments,
@@ -100,6 +138,112 @@ class AsyncSession(_AsyncSession):
         )
         return result_value  # type: ignore
 
+    @overload
+    async def exec_stream(
+        self,
+        statement: Select[_TSelectParam],
+        *,
+        chunk_size: int = 1000,
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+    ) -> AsyncTupleResult[_TSelectParam]: ...
+
+    @overload
+    async def exec_stream(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        chunk_size: int = 1000,
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+    ) -> AsyncScalarResult[_TSelectParam]: ...
+
+    async def exec_stream(
+        self,
+        statement: Select[_TSelectParam] | SelectOfScalar[_TSelectParam],
+        *,
+        chunk_size: int = 1000,
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+    ) -> AsyncTupleResult[_TSelectParam] | AsyncScalarResult[_TSelectParam]:
+        """
+        Execute a select statement and return a streaming result, that fetches
+        the rows from the database in chunks of `chunk_size` as they are iterated,
+        instead of loading all of them in memory at once.
+
+        For example:
+
+        ```Python
+        result = await session.exec_stream(select(Hero))
+        async for hero in result:
+            ...
+        ```
+        """
+        execution_options = util.immutabledict(execution_options).union(
+            {**_STREAM_OPTIONS, "yield_per": chunk_size}
+        )
+        result = await greenlet_spawn(
+            _Session.execute,
+            self.sync_session,
+            statement,
+            params=params,
+            execution_options=execution_options,
+            bind_arguments=bind_arguments,
+        )
+        record_execution(statement, result)
+        if self.sync_session.stats is not None:
+            _track_hydration(result, self.sync_session.stats)
+        if isinstance(statement, SelectOfScalar):
+            if statement._sqlmodel_into is not None:
+                result = _get_into_result(result, *statement._sqlmodel_into)
+            return AsyncResult(result).scalars()
+        return AsyncResult(result)  # type: ignore
+
+    async def bulk_insert(
+        self,
+        model: type[Any],
+        rows: Iterable[Any],
+        *,
+        return_pks: bool = True,
+        batch_size: int = 1000,
+    ) -> list[Any] | None:
+        """
+        Insert many rows of a table model using SQLAlchemy's bulk INSERT, the same
+        as `Session.bulk_insert()`.
+        """
+        return await greenlet_spawn(
+            self.sync_session.bulk_insert,
+            model,
+            rows,
+            return_pks=return_pks,
+            batch_size=batch_size,
+        )
+
+    async def upsert(
+        self,
+        model: type[Any],
+        rows: Iterable[Any],
+        *,
+        conflict_on: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Insert many rows of a table model, updating the existing rows they conflict
+        with, the same as `Session.upsert()`.
+        """
+        await greenlet_spawn(
+            self.sync_session.upsert,
+            model,
+            rows,
+            conflict_on=conflict_on,
+            update_fields=update_fields,
+            batch_size=batch_size,
+        )
+
     @deprecated(
         """
         🚨 You probably want to use `session.exec()` instead of `session.execute()`.
@@ -1,14 +1,8 @@
 from __future__ import annotations
 
 import builtins
-import ipaddress
-import uuid
-from collections.abc import Callable, Mapping, Sequence, Set
+from collections.abc import Callable, Iterable, Mapping, Sequence, Set
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
-from decimal import Decimal
-from enum import Enum
-from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,25 +12,18 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    get_args,
     get_origin,
     overload,
 )
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo as PydanticFieldInfo
 from sqlalchemy import (
-    Boolean,
     Column,
-    Date,
-    DateTime,
-    Float,
     ForeignKey,
-    Integer,
-    Interval,
-    Numeric,
     inspect,
 )
-from sqlalchemy import Enum as sa_Enum
 from sqlalchemy.orm import (
     Mapped,
     RelationshipProperty,
@@ -48,7 +35,6 @@ from sqlalchemy.orm.attributes import set_attribute
 from sqlalchemy.orm.decl_api import DeclarativeMeta
 from sqlalchemy.orm.instrumentation import is_instrumented
 from sqlalchemy.sql.schema import MetaData
-from sqlalchemy.sql.sqltypes import LargeBinary, Time, Uuid
 from typing_extensions import deprecated
 
 from ._compat import (
@@ -56,22 +42,28 @@ from ._compat import (
     BaseConfig,
     ModelMetaclass,
     Representation,
+    SQLModelClassInfo,
     SQLModelConfig,
+    TableInit,
     Undefined,
     UndefinedType,
+    build_class_info,
+    build_table_init,
     finish_init,
     get_annotations,
     get_field_metadata,
     get_model_fields,
     get_relationship_to,
-    get_sa_type_from_field,
-    init_pydantic_private_attrs,
     is_field_noneable,
     is_table_model_class,
+    is_unchanged_loaded_value,
+    sqlmodel_dump_relationships,
     sqlmodel_init,
+    sqlmodel_table_model_construct,
     sqlmodel_validate,
+    sqlmodel_validate_many,
 )
-from .sql.sqltypes import AutoString
+from .types import get_sa_type
 
 if TYPE_CHECKING:
     from pydantic._internal._model_construction import ModelMetaclass as ModelMetaclass
@@ -88,6 +80,17 @@ IncEx: TypeAlias = (
     | Mapping[str, Union["IncEx", bool]]
 )
 OnDeleteType = Literal["CASCADE", "SET NULL", "RESTRICT"]
+# The SQLAlchemy loader strategies that work with the list annotations
+LazyType = Literal[
+    "select",
+    "joined",
+    "selectin",
+    "subquery",
+    "immediate",
+    "raise",
+    "raise_on_sql",
+    "noload",
+]
 
 
 def __dataclass_transform__(
@@ -176,11 +179,21 @@ class RelationshipInfo(Representation):
         cascade_delete: bool | None = False,
         passive_deletes: bool | Literal["all"] | None = False,
         link_model: Any | None = None,
+        lazy: LazyType | None = None,
         sa_relationship: RelationshipProperty | None = None,
         sa_relationship_args: Sequence[Any] | None = None,
         sa_relationship_kwargs: Mapping[str, Any] | None = None,
     ) -> None:
+        if lazy is not None and lazy not in get_args(LazyType):
+            raise ValueError(
+                f"Invalid lazy loading strategy {lazy!r}, it should be one of: "
+                + ", ".join(repr(strategy) for strategy in get_args(LazyType))
+            )
         if sa_relationship is not None:
+            if lazy is not None:
+                raise RuntimeError(
+                    "Passing lazy is not supported when also passing a sa_relationship"
+                )
             if sa_relationship_args is not None:
                 raise RuntimeError(
                     "Passing sa_relationship_args is not supported when "
@@ -195,6 +208,7 @@ class RelationshipInfo(Representation):
         self.cascade_delete = cascade_delete
         self.passive_deletes = passive_deletes
         self.link_model = link_model
+        self.lazy = lazy
         self.sa_relationship = sa_relationship
         self.sa_relationship_args = sa_relationship_args
         self.sa_relationship_kwargs = sa_relationship_kwargs
@@ -479,6 +493,7 @@ def Relationship(
     cascade_delete: bool | None = False,
     passive_deletes: bool | Literal["all"] | None = False,
     link_model: Any | None = None,
+    lazy: LazyType | None = None,
     sa_relationship_args: Sequence[Any] | None = None,
     sa_relationship_kwargs: Mapping[str, Any] | None = None,
 ) -> Any: ...
@@ -501,6 +516,7 @@ def Relationship(
     cascade_delete: bool | None = False,
     passive_deletes: bool | Literal["all"] | None = False,
     link_model: Any | None = None,
+    lazy: LazyType | None = None,
     sa_relationship: RelationshipProperty[Any] | None = None,
     sa_relationship_args: Sequence[Any] | None = None,
     sa_relationship_kwargs: Mapping[str, Any] | None = None,
@@ -510,6 +526,7 @@ def Relationship(
         cascade_delete=cascade_delete,
         passive_deletes=passive_deletes,
         link_model=link_model,
+        lazy=lazy,
         sa_relationship=sa_relationship,
         sa_relationship_args=sa_relationship_args,
         sa_relationship_kwargs=sa_relationship_kwargs,
@@ -517,9 +534,21 @@ def Relationship(
     return relationship_info
 
 
+# Duplicate logic from Pydantic to filter config kwargs because if they are
+# passed directly including the registry Pydantic will pass them over to the
+# superclass causing an error
+_ALLOWED_CONFIG_KWARGS = frozenset(
+    key
+    for key in dir(BaseConfig)
+    if not (key.startswith("__") and key.endswith("__"))  # skip dunder attributes
+)
+
+
 @__dataclass_transform__(kw_only_default=True, field_descriptors=(Field, FieldInfo))
 class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
     __sqlmodel_relationships__: dict[str, RelationshipInfo]
+    __sqlmodel_class_info__: SQLModelClassInfo
+    __sqlmodel_table_init__: TableInit
     model_config: SQLModelConfig
     model_fields: ClassVar[dict[str, FieldInfo]]
 
@@ -565,18 +594,8 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
             "__sqlmodel_relationships__": relationships,
             "__annotations__": pydantic_annotations,
         }
-        # Duplicate logic from Pydantic to filter config kwargs because if they are
-        # passed directly including the registry Pydantic will pass them over to the
-        # superclass causing an error
-        allowed_config_kwargs: set[str] = {
-            key
-            for key in dir(BaseConfig)
-            if not (
-                key.startswith("__") and key.endswith("__")
-            )  # skip dunder methods and attributes
-        }
         config_kwargs = {
-            key: kwargs[key] for key in kwargs.keys() & allowed_config_kwargs
+            key: kwargs[key] for key in kwargs.keys() & _ALLOWED_CONFIG_KWARGS
         }
         new_cls = cast(
             "SQLModel", super().__new__(cls, name, bases, dict_used, **config_kwargs)
@@ -659,6 +678,8 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                     rel_kwargs["cascade"] = "all, delete-orphan"
                 if rel_info.passive_deletes:
                     rel_kwargs["passive_deletes"] = rel_info.passive_deletes
+                if rel_info.lazy is not None:
+                    rel_kwargs["lazy"] = rel_info.lazy
                 if rel_info.link_model:
                     ins = inspect(rel_info.link_model)
                     local_table = getattr(ins, "local_table")  # noqa: B009
@@ -681,6 +702,33 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
             DeclarativeMeta.__init__(cls, classname, bases, dict_, **kw)
         else:
             ModelMetaclass.__init__(cls, classname, bases, dict_, **kw)
+        model_cls = cast(type["SQLModel"], cls)
+        type.__setattr__(cls, "__sqlmodel_class_info__", build_class_info(model_cls))
+        if is_table_model_class(cls):
+            # The constructor used by SQLModel.__init__() is generated on the first
+            # instance, many table models are only loaded from the database
+            type.__setattr__(cls, "__sqlmodel_table_init__", _build_table_init)
+
+
+def _build_table_init(self: SQLModel, values: builtins.dict[str, Any]) -> None:
+    # Generate the constructor once per class, replacing this function in the class
+    cls = type(self)
+    table_init = build_table_init(cls, direct_set=_can_set_directly(cls))
+    type.__setattr__(cls, "__sqlmodel_table_init__", table_init)
+    table_init(self, values)
+
+
+def _can_set_directly(cls: type[SQLModel]) -> bool:
+    # Setting the values with SQLAlchemy alone is equivalent to SQLModel.__setattr__()
+    # only when Pydantic wouldn't do anything else on assignment and when all the
+    # attributes are instrumented in this same class
+    if cls.__setattr__ is not SQLModel.__setattr__:
+        return False
+    class_info = cls.__sqlmodel_class_info__
+    return (
+        class_info.direct_set_names == class_info.field_names
+        and class_info.relationship_names <= class_info.instrumented_names
+    )
 
 
 def get_sqlalchemy_type(field: Any) -> Any:
@@ -689,82 +737,39 @@ def get_sqlalchemy_type(field: Any) -> Any:
     if sa_type is not Undefined:
         return sa_type
 
-    type_ = get_sa_type_from_field(field)
-    metadata = get_field_metadata(field)
-
-    # Check enums first as an enum can also be a str, needed by Pydantic/FastAPI
-    if issubclass(type_, Enum):
-        return sa_Enum(type_)
-    if issubclass(
-        type_,
-        (
-            str,
-            ipaddress.IPv4Address,
-            ipaddress.IPv4Network,
-            ipaddress.IPv6Address,
-            ipaddress.IPv6Network,
-            Path,
-            EmailStr,
-        ),
-    ):
-        max_length = getattr(metadata, "max_length", None)
-        if max_length:
-            return AutoString(length=max_length)
-        return AutoString
-    if issubclass(type_, float):
-        return Float
-    if issubclass(type_, bool):
-        return Boolean
-    if issubclass(type_, int):
-        return Integer
-    if issubclass(type_, datetime):
-        return DateTime
-    if issubclass(type_, date):
-        return Date
-    if issubclass(type_, timedelta):
-        return Interval
-    if issubclass(type_, time):
-        return Time
-    if issubclass(type_, bytes):
-        return LargeBinary
-    if issubclass(type_, Decimal):
-        return Numeric(
-            precision=getattr(metadata, "max_digits", None),
-            scale=getattr(metadata, "decimal_places", None),
-        )
-    if issubclass(type_, uuid.UUID):
-        return Uuid
-    raise ValueError(f"{type_} has no matching SQLAlchemy type")
+    return get_sa_type(field.annotation, get_field_metadata(field))
 
 
 def get_column_from_field(field: Any) -> Column:
     field_info = field
-    sa_column = _get_sqlmodel_field_value(field_info, "sa_column", Undefined)
+    # Look up the SQLModel field metadata once, it has all the SQLModel attributes
+    values = _get_sqlmodel_field_metadata(field_info) or field_info
+    sa_column = getattr(values, "sa_column", Undefined)
     if isinstance(sa_column, Column):
         return sa_column
     sa_type = get_sqlalchemy_type(field)
-    primary_key = _get_sqlmodel_field_value(field_info, "primary_key", Undefined)
+    primary_key = getattr(values, "primary_key", Undefined)
     if primary_key is Undefined:
         primary_key = False
-    index = _get_sqlmodel_field_value(field_info, "index", Undefined)
+    index = getattr(values, "index", Undefined)
     if index is Undefined:
         index = False
     nullable = not primary_key and is_field_noneable(field)
     # Override derived nullability if the nullable property is set explicitly
     # on the field
-    field_nullable = _get_sqlmodel_field_value(field_info, "nullable", Undefined)
+    field_nullable = getattr(values, "nullable", Undefined)
     if field_nullable is not Undefined:
         assert not isinstance(field_nullable, UndefinedType)
         nullable = field_nullable
     args = []
-    foreign_key = _get_sqlmodel_field_value(field_info, "foreign_key", Undefined)
+    foreign_key = getattr(values, "foreign_key", Undefined)
     if foreign_key is Undefined:
         foreign_key = None
-    unique = _get_sqlmodel_field_value(field_info, "unique", Undefined)
+    unique = getattr(values, "unique", Undefined)
     if unique is Undefined:
         unique = False
     if foreign_key:
-        ondelete_value = _get_sqlmodel_field_value(field_info, "ondelete", Undefined)
+        ondelete_value = getattr(values, "ondelete", Undefined)
         if ondelete_value is Undefined:
             ondelete_value = None
         if ondelete_value == "SET NULL" and not nullable:
@@ -785,12 +790,10 @@ def get_column_from_field(field: Any) -> Column:
         sa_default = field_info.default
     if sa_default is not Undefined:
         kwargs["default"] = sa_default
-    sa_column_args = _get_sqlmodel_field_value(field_info, "sa_column_args", Undefined)
+    sa_column_args = getattr(values, "sa_column_args", Undefined)
     if sa_column_args is not Undefined:
         args.extend(list(cast(Sequence[Any], sa_column_args)))
-    sa_column_kwargs = _get_sqlmodel_field_value(
-        field_info, "sa_column_kwargs", Undefined
-    )
+    sa_column_kwargs = getattr(values, "sa_column_kwargs", Undefined)
     if sa_column_kwargs is not Undefined:
         kwargs.update(cast(dict[Any, Any], sa_column_kwargs))
     return Column(sa_type, *args, **kwargs)
@@ -806,6 +809,8 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
     __slots__ = ("__weakref__",)
     __tablename__: ClassVar[str | Callable[..., str]]
     __sqlmodel_relationships__: ClassVar[builtins.dict[str, RelationshipInfo]]
+    __sqlmodel_class_info__: ClassVar[SQLModelClassInfo]
+    __sqlmodel_table_init__: ClassVar[TableInit]
     __name__: ClassVar[str]
     metadata: ClassVar[MetaData]
     __allow_unmapped__ = True  # https://docs.sqlalchemy.org/en/20/changelog/migration_20.html#migration-20-step-six
@@ -814,14 +819,24 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
     # Typing spec says `__new__` returning `Any` overrides normal constructor
     # behavior, but a missing annotation does not:
     def __new__(cls, *args: Any, **kwargs: Any):  # type: ignore[no-untyped-def]
-        new_object = super().__new__(cls)
         # SQLAlchemy doesn't call __init__ on the base class when querying from DB
         # Ref: https://docs.sqlalchemy.org/en/14/orm/constructors.html
-        # Set __fields_set__ here, that would have been set when calling __init__
-        # in the Pydantic model so that when SQLAlchemy sets attributes that are
-        # added (e.g. when querying from DB) to the __fields_set__, this already exists
-        init_pydantic_private_attrs(new_object)
-        return new_object
+        # The attributes that __init__ would have set in the Pydantic model, e.g.
+        # __pydantic_fields_set__, are created on first access in __getattr__, so
+        # that objects loaded from the DB don't each allocate them up front
+        return super().__new__(cls)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if name == "__pydantic_fields_set__":
+                fields_set: set[str] = set()
+                object.__setattr__(self, name, fields_set)
+                return fields_set
+            if name == "__pydantic_extra__" or name == "__pydantic_private__":
+                object.__setattr__(self, name, None)
+                return None
+            return super().__getattr__(name)
 
     def __init__(__pydantic_self__, **data: Any) -> None:
         # Uses something other than `self` the first arg to allow "self" as a
@@ -848,12 +863,23 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             self.__dict__[name] = value
             return
         else:
+            class_info = self.__sqlmodel_class_info__
+            if name in class_info.direct_set_names:
+                # Pydantic would only store the value in __dict__, SQLAlchemy already
+                # does it, so set it once, and skip it if nothing changes
+                if is_unchanged_loaded_value(self, name, value):
+                    return
+                set_attribute(self, name, value)
+                self.__pydantic_fields_set__.add(name)
+                return
             # Set in SQLAlchemy, before Pydantic to trigger events and updates
-            if is_table_model_class(self.__class__) and is_instrumented(self, name):
+            if class_info.table and (
+                name in class_info.instrumented_names or is_instrumented(self, name)
+            ):
                 set_attribute(self, name, value)
             # Set in Pydantic model to trigger possible validation changes, only for
             # non relationship values
-            if name not in self.__sqlmodel_relationships__:
+            if name not in class_info.relationship_names:
                 super().__setattr__(name, value)
 
     def __repr_args__(self) -> Sequence[tuple[str | None, Any]]:
@@ -887,6 +913,51 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             update=update,
         )
 
+    @classmethod
+    def model_validate_many(
+        cls: type[_TSQLModel],
+        objs: Iterable[Any],
+        *,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: builtins.dict[str, Any] | None = None,
+        update: builtins.dict[str, Any] | None = None,
+    ) -> list[_TSQLModel]:
+        """
+        Validate a sequence of objects at once, the same as calling
+        `model_validate()` for each one.
+
+        If any object is invalid, a single `ValidationError` is raised with the
+        errors of all the objects, the first item of each error `loc` is the index
+        of the object.
+        """
+        return sqlmodel_validate_many(
+            cls=cls,
+            objs=objs,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+            update=update,
+            direct_set=_can_set_directly(cls),
+        )
+
+    @classmethod
+    def model_construct(
+        cls: type[_TSQLModel],
+        _fields_set: set[str] | None = None,
+        **values: Any,
+    ) -> _TSQLModel:
+        """
+        Create a new instance from trusted or pre-validated data, without
+        validation, the same as Pydantic's `model_construct()`.
+
+        For table models, the instance is also set up for SQLAlchemy, so it can be
+        added to a session, and relationships can be passed as keyword arguments.
+        """
+        if not cls.__sqlmodel_class_info__.table:
+            return super().model_construct(_fields_set, **values)  # type: ignore[misc]
+        return sqlmodel_table_model_construct(cls, _fields_set, values)
+
     def model_dump(
         self,
         *,
@@ -904,7 +975,19 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
         fallback: Callable[[Any], Any] | None = None,  # v2.11
         serialize_as_any: bool = False,  # v2.7
         polymorphic_serialization: bool | None = None,  # v2.13
+        relationships: Mapping[str, Any] | int | None = None,
     ) -> builtins.dict[str, Any]:
+        """
+        Dump the model to a dict, as with Pydantic.
+
+        Pass `relationships` to also dump relationships of table models, e.g.
+        `{"heroes": {"team": True}}`, or a depth, e.g. `2` to dump all the
+        relationships and the relationships of those. Relationships not loaded yet
+        are loaded for all the objects in a list at once, with one query for each
+        level instead of one for each object. To dump all the results of a query,
+        loading their relationships at once, use
+        `session.exec(statement).dump_json(relationships=...)`.
+        """
         if PYDANTIC_MINOR_VERSION < (2, 11):
             by_alias = by_alias or False
         extra_kwargs: dict[str, Any] = {}
@@ -916,7 +999,7 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             extra_kwargs["exclude_computed_fields"] = exclude_computed_fields
         if PYDANTIC_MINOR_VERSION >= (2, 13):
             extra_kwargs["polymorphic_serialization"] = polymorphic_serialization
-        return super().model_dump(
+        data = super().model_dump(
             mode=mode,
             include=include,
             exclude=exclude,
@@ -928,6 +1011,23 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
             warnings=warnings,
             **extra_kwargs,
         )
+        if relationships:
+            sqlmodel_dump_relationships(
+                [self],
+                [data],
+                relationships,
+                dict(
+                    mode=mode,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                    warnings=warnings,
+                    **extra_kwargs,
+                ),
+            )
+        return data
 
     @deprecated(
         """
@@ -989,9 +1089,10 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
         update: builtins.dict[str, Any] | None = None,
     ) -> _TSQLModel:
         use_update = (update or {}).copy()
+        field_names = self.__sqlmodel_class_info__.field_names
         if isinstance(obj, dict):
             for key, value in {**obj, **use_update}.items():
-                if key in get_model_fields(self):
+                if key in field_names:
                     setattr(self, key, value)
         elif isinstance(obj, BaseModel):
             for key in get_model_fields(obj):
@@ -1001,7 +1102,7 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
                     value = getattr(obj, key)
                 setattr(self, key, value)
             for remaining_key, value in use_update.items():
-                if remaining_key in get_model_fields(self):
+                if remaining_key in field_names:
                     setattr(self, remaining_key, value)
         else:
             raise ValueError(
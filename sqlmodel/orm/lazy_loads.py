@@ -0,0 +1,89 @@
+import os
+import sys
+import warnings
+from typing import Literal
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import Session as _Session
+
+# Frames from these packages are skipped to find the code that did the lazy load
+_LIBRARY_PATHS = (
+    os.path.dirname(sqlalchemy.__file__ or "") + os.sep,
+    os.path.dirname(os.path.dirname(__file__)) + os.sep,
+)
+
+
+class LazyLoadWarning(UserWarning):
+    """Warning for a relationship lazy loaded more times than the threshold."""
+
+
+class LazyLoadError(RuntimeError):
+    """Error for a relationship lazy loaded more times than the threshold."""
+
+
+class LazyLoadDetector:
+    """
+    Count the queries emitted to lazy load each relationship, e.g. `team.heroes`
+    for each team in a list, a common source of "N+1" queries.
+
+    Pass it to the sessions to track, e.g. `Session(engine, lazy_loads=detector)`,
+    the counts are per relationship name, like `"Team.heroes"`, in `counts`.
+
+    When a relationship is lazy loaded more than `threshold` times, with `action`:
+
+    * `"warn"`: a `LazyLoadWarning` is emitted once, pointing to the code that
+      accessed the relationship.
+    * `"raise"`: a `LazyLoadError` is raised instead of loading it.
+    * `"count"`: only the counts are kept, e.g. to export them as metrics.
+
+    Use a new detector, or call `reset()`, for each scope to track, e.g. each
+    request.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 10,
+        action: Literal["warn", "raise", "count"] = "warn",
+    ) -> None:
+        if action not in ("warn", "raise", "count"):
+            raise ValueError(f"Invalid action for lazy loads: {action!r}")
+        self.threshold = threshold
+        self.action = action
+        self.counts: dict[str, int] = {}
+
+    def reset(self) -> None:
+        """Set all the counts back to zero."""
+        self.counts = {}
+
+    def _watch(self, session: _Session) -> None:
+        event.listen(session, "do_orm_execute", self._on_execute)
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        state = orm_execute_state.lazy_loaded_from
+        path = orm_execute_state.loader_strategy_path
+        if state is None or path is None:
+            return
+        # The relationship property, e.g. "Team.heroes"
+        name = str(path[-1])
+        count = self.counts.get(name, 0) + 1
+        self.counts[name] = count
+        if count <= self.threshold or self.action == "count":
+            return
+        if self.action == "warn" and count > self.threshold + 1:
+            return
+        frame = sys._getframe(1)
+        stacklevel = 2
+        while frame.f_back and frame.f_code.co_filename.startswith(_LIBRARY_PATHS):
+            frame = frame.f_back
+            stacklevel += 1
+        message = (
+            f"{name} was lazy loaded {count} times, more than the threshold of "
+            f"{self.threshold}, at {frame.f_code.co_filename}:{frame.f_lineno}, "
+            "consider loading it with the parent objects, e.g. with selectinload()"
+        )
+        if self.action == "raise":
+            raise LazyLoadError(message)
+        warnings.warn(message, LazyLoadWarning, stacklevel=stacklevel)
@@ -1,28 +1,320 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import chain, groupby, islice
+from time import perf_counter
 from typing import (
     Any,
+    Literal,
     TypeVar,
     overload,
 )
 
-from sqlalchemy import util
+from pydantic import BaseModel
+from sqlalchemy import event, insert, inspect, util
+from sqlalchemy.engine import Connection
 from sqlalchemy.engine.cursor import CursorResult
 from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
-from sqlalchemy.engine.result import Result, ScalarResult, TupleResult
+from sqlalchemy.engine.result import (
+    ChunkedIteratorResult,
+    IteratorResult,
+    Result,
+    SimpleResultMetaData,
+)
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Mapper, SessionTransaction
 from sqlalchemy.orm import Query as _Query
 from sqlalchemy.orm import Session as _Session
 from sqlalchemy.orm._typing import OrmExecuteOptionsParameter
-from sqlalchemy.sql._typing import _ColumnsClauseArgument
+from sqlalchemy.orm.session import JoinTransactionMode, _SessionBind, _SessionBindKey
+from sqlalchemy.sql._typing import _ColumnsClauseArgument, _InfoType
 from sqlalchemy.sql.base import Executable as _Executable
+from sqlalchemy.sql.base import _NoArg
 from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import NamedColumn
+from sqlmodel.engine.result import ScalarResult, TupleResult
+from sqlmodel.orm.lazy_loads import LazyLoadDetector
 from sqlmodel.sql.base import Executable
 from sqlmodel.sql.expression import Select, SelectOfScalar
+from sqlmodel.sql.prepared import record_execution
 from typing_extensions import deprecated
 
 _TSelectParam = TypeVar("_TSelectParam", bound=Any)
+_TModel = TypeVar("_TModel", bound=BaseModel)
+
+
+def _get_column_keys(mapper: Mapper[Any]) -> tuple[list[str], set[str]]:
+    column_keys = [prop.key for prop in mapper.column_attrs]
+    # Primary keys and columns with a default, that the database can generate
+    default_keys = {
+        prop.key
+        for prop in mapper.column_attrs
+        if any(
+            column.primary_key
+            or column.default is not None
+            or column.server_default is not None
+            for column in prop.columns
+        )
+    }
+    return column_keys, default_keys
+
+
+def _get_insert_values(
+    row: Any, column_keys: list[str], default_keys: set[str]
+) -> dict[str, Any]:
+    if isinstance(row, Mapping):
+        values = row
+    else:
+        # A model instance, the column values are all in __dict__
+        values = {key: row.__dict__[key] for key in column_keys if key in row.__dict__}
+    # The same as the ORM does, None for a primary key or a column with a default
+    # means the database generates the value, leave it out
+    return {
+        key: value
+        for key, value in values.items()
+        if value is not None or key not in default_keys
+    }
+
+
+def _get_upsert_statement(
+    model: type[Any],
+    dialect_name: str,
+    *,
+    conflict_on: Sequence[str],
+    update_fields: Sequence[str],
+) -> UpdateBase:
+    mapper = inspect(model)
+    conflict_columns = [_get_column(mapper, name) for name in conflict_on]
+    update_columns = [_get_column(mapper, name) for name in update_fields]
+    if dialect_name in ("sqlite", "postgresql"):
+        # Only the dialect of the database is imported, when it's used
+        if dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as insert_func
+        else:
+            from sqlalchemy.dialects.postgresql import insert as insert_func
+        statement = insert_func(model)
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+        return statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={
+                column.key: statement.excluded[column.key] for column in update_columns
+            },
+        )
+    if dialect_name in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        mysql_statement = mysql_insert(model)
+        if not update_columns:
+            # ON DUPLICATE KEY UPDATE needs at least one column, set one to itself
+            return mysql_statement.on_duplicate_key_update(
+                {conflict_columns[0].key: conflict_columns[0]}
+            )
+        return mysql_statement.on_duplicate_key_update(
+            {
+                column.key: mysql_statement.inserted[column.key]
+                for column in update_columns
+            }
+        )
+    raise ValueError(f"Upsert is not supported for the {dialect_name!r} database")
+
+
+def _get_column(mapper: Mapper[Any], name: str) -> NamedColumn[Any]:
+    prop = mapper.column_attrs.get(name)
+    if prop is None:
+        raise ValueError(f"{name!r} is not a column field of {mapper.class_.__name__}")
+    return prop.columns[0]
+
+
+def _get_into_result(
+    result: Result[Any], model: type[BaseModel], keys: tuple[str, ...]
+) -> Result[Any]:
+    # Build the models from the rows as they are fetched, so that yield_per and
+    # partitions() keep working on the new result
+    objs = (
+        (model.model_validate(dict(zip(keys, row, strict=True))),) for row in result
+    )
+    into_result: Result[Any] = IteratorResult(SimpleResultMetaData(["obj"]), objs)
+    if result._yield_per:
+        into_result = into_result.yield_per(result._yield_per)
+    return into_result
+
+
+def _get_pks(rows: Iterable[Any], size: int) -> list[Any]:
+    if size == 1:
+        return [row[0] for row in rows]
+    return [tuple(row) for row in rows]
+
+
+@dataclass
+class SessionStats:
+    """
+    The counters of the work done by a session created with `stats=True`,
+    available in `session.stats`.
+
+    The statements are counted by their first keyword, e.g. `"select"` or
+    `"insert"`, including the ones emitted by flushes and lazy loads.
+    `execute_time` is the time spent executing them in the database, and
+    `hydration_time` the time spent fetching the rows of `session.exec()`
+    results and building the objects, in seconds.
+    """
+
+    statements: dict[str, int] = field(default_factory=dict)
+    execute_time: float = 0.0
+    hydration_time: float = 0.0
+    rows: int = 0
+    flushes: int = 0
+    objects_flushed: int = 0
+
+    def reset(self) -> None:
+        """Set all the counters back to zero."""
+        self.statements = {}
+        self.execute_time = 0.0
+        self.hydration_time = 0.0
+        self.rows = 0
+        self.flushes = 0
+        self.objects_flushed = 0
+
+
+def _track_hydration(result: Result[Any], stats: SessionStats) -> None:
+    # ORM results build the objects lazily from chunks of rows, time each chunk
+    if not isinstance(result, ChunkedIteratorResult):
+        return
+    chunks = result.chunks
+
+    def timed_chunks(size: int | None) -> Iterator[Sequence[Any]]:
+        chunk_iterator = iter(chunks(size))
+        while True:
+            start = perf_counter()
+            rows = next(chunk_iterator, None)
+            stats.hydration_time += perf_counter() - start
+            if rows is None:
+                return
+            stats.rows += len(rows)
+            yield rows
+
+    result.chunks = timed_chunks
+    # Nothing was fetched yet, set up the iterator the same way the result does
+    result.iterator = chain.from_iterable(timed_chunks(result._yield_per))
 
 
 class Session(_Session):
+    def __init__(
+        self,
+        bind: _SessionBind | None = None,
+        *,
+        autoflush: bool = True,
+        future: Literal[True] = True,
+        expire_on_commit: bool = True,
+        autobegin: bool = True,
+        twophase: bool = False,
+        binds: dict[_SessionBindKey, _SessionBind] | None = None,
+        enable_baked_queries: bool = True,
+        info: _InfoType | None = None,
+        query_cls: type[_Query[Any]] | None = None,
+        autocommit: Literal[False] = False,
+        join_transaction_mode: JoinTransactionMode = "conditional_savepoint",
+        close_resets_only: bool | _NoArg = _NoArg.NO_ARG,
+        stats: bool = False,
+        lazy_loads: LazyLoadDetector | None = None,
+    ) -> None:
+        """
+        The same as SQLAlchemy's `Session`, with `stats=True` it also counts the
+        statements, rows and flushes in `session.stats`, see `SessionStats`.
+
+        With `lazy_loads`, the relationships lazy loaded by the session are
+        tracked by that detector, see `LazyLoadDetector`.
+        """
+        kw: dict[str, Any] = {}
+        # Only available in SQLAlchemy 2.0.22 and above
+        if close_resets_only is not _NoArg.NO_ARG:
+            kw["close_resets_only"] = close_resets_only
+        super().__init__(
+            bind,
+            autoflush=autoflush,
+            future=future,
+            expire_on_commit=expire_on_commit,
+            autobegin=autobegin,
+            twophase=twophase,
+            binds=binds,
+            enable_baked_queries=enable_baked_queries,
+            info=info,
+            query_cls=query_cls,
+            autocommit=autocommit,
+            join_transaction_mode=join_transaction_mode,
+            **kw,
+        )
+        if lazy_loads is not None:
+            lazy_loads._watch(self)
+        self.stats: SessionStats | None = None
+        if stats:
+            self.stats = SessionStats()
+            event.listen(self, "after_begin", self._stats_after_begin)
+            event.listen(
+                self, "after_transaction_end", self._stats_after_transaction_end
+            )
+            event.listen(self, "before_flush", self._stats_before_flush)
+
+    def _stats_after_begin(
+        self,
+        session: _Session,
+        transaction: SessionTransaction,
+        connection: Connection,
+    ) -> None:
+        if not event.contains(
+            connection, "before_cursor_execute", self._stats_before_cursor_execute
+        ):
+            event.listen(
+                connection, "before_cursor_execute", self._stats_before_cursor_execute
+            )
+            event.listen(
+                connection, "after_cursor_execute", self._stats_after_cursor_execute
+            )
+
+    def _stats_after_transaction_end(
+        self, session: _Session, transaction: SessionTransaction
+    ) -> None:
+        # The connection could outlive the session, e.g. if it was passed as bind
+        if transaction.parent is not None:
+            return
+        for connection, *_ in transaction._connections.values():
+            if event.contains(
+                connection, "before_cursor_execute", self._stats_before_cursor_execute
+            ):
+                event.remove(
+                    connection,
+                    "before_cursor_execute",
+                    self._stats_before_cursor_execute,
+                )
+                event.remove(
+                    connection,
+                    "after_cursor_execute",
+                    self._stats_after_cursor_execute,
+                )
+
+    def _stats_before_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        conn.info.setdefault("sqlmodel_query_start", []).append(perf_counter())
+
+    def _stats_after_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        assert self.stats is not None
+        self.stats.execute_time += (
+            perf_counter() - conn.info["sqlmodel_query_start"].pop()
+        )
+        keyword = statement.lstrip().split(None, 1)[0].lower() if statement else ""
+        self.stats.statements[keyword] = self.stats.statements.get(keyword, 0) + 1
+
+    def _stats_before_flush(
+        self, session: _Session, flush_context: Any, instances: Any
+    ) -> None:
+        assert self.stats is not None
+        self.stats.flushes += 1
+        self.stats.objects_flushed += (
+            len(self.new) + len(self.dirty) + len(self.deleted)
+        )
+
     @overload
     def exec(
         self,
@@ -47,6 +339,19 @@ class Session(_Session):
         _add_event: Any | None = None,
     ) -> ScalarResult[_TSelectParam]: ...
 
+    @overload
+    def exec(
+        self,
+        statement: SelectOfScalar[Any],
+        *,
+        into: type[_TModel],
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+        _parent_execute_state: Any | None = None,
+        _add_event: Any | None = None,
+    ) -> ScalarResult[_TModel]: ...
+
     @overload
     def exec(
         self,
@@ -66,12 +371,27 @@ class Session(_Session):
         | Executable[_TSelectParam]
         | UpdateBase,
         *,
+        into: type[BaseModel] | None = None,
         params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
         execution_options: Mapping[str, Any] = util.EMPTY_DICT,
         bind_arguments: dict[str, Any] | None = None,
         _parent_execute_state: Any | None = None,
         _add_event: Any | None = None,
-    ) -> TupleResult[_TSelectParam] | ScalarResult[_TSelectParam] | CursorResult[Any]:
+    ) -> TupleResult[_TSelectParam] | ScalarResult[Any] | CursorResult[Any]:
+        if into is not None:
+            if not isinstance(statement, SelectOfScalar):
+                raise ValueError(
+                    "into can only be used to select a single table model, e.g. "
+                    "select(Hero)"
+                )
+            return self.exec(
+                statement.into(into),
+                params=params,
+                execution_options=execution_options,
+                bind_arguments=bind_arguments,
+                _parent_execute_state=_parent_execute_state,
+                _add_event=_add_event,
+            )
         results = super().execute(
             statement,
             params=params,
@@ -80,10 +400,178 @@ class Session(_Session):
             _parent_execute_state=_parent_execute_state,
             _add_event=_add_event,
         )
+        record_execution(statement, results)
+        if self.stats is not None:
+            _track_hydration(results, self.stats)
         if isinstance(statement, SelectOfScalar):
-            return results.scalars()
+            if statement._sqlmodel_into is not None:
+                results = _get_into_result(results, *statement._sqlmodel_into)
+            return ScalarResult(results, 0)
+        if isinstance(statement, Select):
+            return TupleResult(results)
         return results  # type: ignore
 
+    def exec_stream(
+        self,
+        statement: Select[_TSelectParam] | SelectOfScalar[_TSelectParam],
+        *,
+        chunk_size: int = 1000,
+        expunge: bool = False,
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: dict[str, Any] | None = None,
+    ) -> Iterator[Sequence[_TSelectParam]]:
+        """
+        Execute a select statement and iterate over its results in chunks of
+        `chunk_size` rows, fetching each chunk from the database only when it's
+        needed, instead of loading all the results in memory at once.
+
+        Each chunk has the same items that `session.exec(statement)` would return,
+        e.g. model objects for `select(Hero)`.
+
+        With `expunge=True`, the objects of each chunk are removed from the session
+        after the chunk is used, so that the session doesn't keep them.
+        """
+        result = self.exec(
+            statement,
+            params=params,
+            execution_options={**execution_options, "yield_per": chunk_size},
+            bind_arguments=bind_arguments,
+        )
+        partitions = result.partitions()
+        if not expunge:
+            return partitions
+        return self._expunge_partitions(partitions)
+
+    def _expunge_partitions(
+        self, partitions: Iterator[Sequence[_TSelectParam]]
+    ) -> Iterator[Sequence[_TSelectParam]]:
+        for partition in partitions:
+            yield partition
+            for item in partition:
+                for value in item if isinstance(item, Row) else (item,):
+                    if hasattr(value, "_sa_instance_state") and value in self:
+                        self.expunge(value)
+
+    def bulk_insert(
+        self,
+        model: type[Any],
+        rows: Iterable[Any],
+        *,
+        return_pks: bool = True,
+        batch_size: int = 1000,
+    ) -> list[Any] | None:
+        """
+        Insert many rows of a table model using SQLAlchemy's bulk INSERT, sending
+        `batch_size` rows to the database in each call.
+
+        Each row can be an instance of the model or a dict with the values by field
+        name. Dicts are inserted as they are, without validation or defaults. The
+        objects are not added to the session.
+
+        By default, it returns the primary keys of the inserted rows, in the same
+        order as `rows`, with a tuple for each row if the primary key has several
+        columns. With `return_pks=False` it returns `None`.
+        """
+        mapper = inspect(model)
+        column_keys, default_keys = _get_column_keys(mapper)
+        pk_attributes = [
+            getattr(model, mapper.get_property_by_column(column).key)
+            for column in mapper.primary_key
+        ]
+        # Keep None values as NULL, so that rows with the same columns are sent
+        # together
+        statement = insert(model).execution_options(render_nulls=True)
+        dialect = self.get_bind(mapper).dialect
+        # Without INSERT..RETURNING for many rows (e.g. MySQL), rows are inserted one
+        # at a time to get their primary keys
+        returning = (
+            return_pks and dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        if returning:
+            statement = statement.returning(
+                *pk_attributes, sort_by_parameter_order=True
+            )
+        pks: list[Any] = []
+        rows_iter = iter(rows)
+        while batch := list(islice(rows_iter, batch_size)):
+            params = [
+                _get_insert_values(row, column_keys, default_keys) for row in batch
+            ]
+            if returning:
+                result = self.exec(statement, params=params)
+                pks.extend(_get_pks(result.all(), len(pk_attributes)))
+            elif return_pks:
+                for values in params:
+                    result = self.exec(insert(model).values(values))
+                    pks.extend(
+                        _get_pks([result.inserted_primary_key], len(pk_attributes))
+                    )
+            else:
+                self.exec(statement, params=params)
+        return pks if return_pks else None
+
+    def upsert(
+        self,
+        model: type[Any],
+        rows: Iterable[Any],
+        *,
+        conflict_on: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Insert many rows of a table model, updating the existing rows they conflict
+        with, using `INSERT ... ON CONFLICT DO UPDATE` in SQLite and PostgreSQL, and
+        `INSERT ... ON DUPLICATE KEY UPDATE` in MySQL.
+
+        `conflict_on` are the fields of the primary key or unique constraint that
+        identify existing rows, by default the primary key. MySQL always checks all
+        the unique keys of the table.
+
+        `update_fields` are the fields updated in existing rows, by default the
+        fields given in each row, except the ones in `conflict_on` and the primary
+        key. With an empty `update_fields`, existing rows are left as they are.
+
+        The rows are handled as in `bulk_insert()`, `batch_size` at a time, and
+        SQLAlchemy splits each batch as needed to stay within the bind parameter
+        limits of the database.
+        """
+        mapper = inspect(model)
+        column_keys, default_keys = _get_column_keys(mapper)
+        pk_keys = [
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        ]
+        conflict_keys = list(conflict_on) if conflict_on is not None else pk_keys
+        dialect_name = self.get_bind(mapper).dialect.name
+        rows_iter = iter(rows)
+        while batch := list(islice(rows_iter, batch_size)):
+            params = [
+                _get_insert_values(row, column_keys, default_keys) for row in batch
+            ]
+            # One statement for each run of rows with the same fields, in order, so
+            # that each row updates the fields it has, and a later row for the same
+            # key still wins
+            for row_keys, group in groupby(params, key=lambda values: set(values)):
+                if update_fields is None:
+                    skip_keys = {*conflict_keys, *pk_keys}
+                    use_update_fields = [
+                        key
+                        for key in column_keys
+                        if key in row_keys and key not in skip_keys
+                    ]
+                else:
+                    use_update_fields = list(update_fields)
+                statement = _get_upsert_statement(
+                    model,
+                    dialect_name,
+                    conflict_on=conflict_keys,
+                    update_fields=use_update_fields,
+                )
+                self.exec(
+                    statement.execution_options(render_nulls=True), params=list(group)
+                )
+
     @deprecated(
         """
         🚨 You probably want to use `session.exec()` instead of `session.execute()`.
@@ -133,7 +621,7 @@ class Session(_Session):
         heroes = session.exec(select(Hero)).all()
         ```
         """
-        return super().execute(
+        result = super().execute(
             statement,
             params=params,
             execution_options=execution_options,
@@ -141,6 +629,9 @@ class Session(_Session):
             _parent_execute_state=_parent_execute_state,
             _add_event=_add_event,
         )
+        if self.stats is not None:
+            _track_hydration(result, self.stats)
+        return result
 
     @deprecated(
         """
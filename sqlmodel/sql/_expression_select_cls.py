@@ -1,14 +1,46 @@
+from collections.abc import Callable
 from typing import (
+    TYPE_CHECKING,
+    Any,
     TypeVar,
+    cast,
 )
 
+from pydantic import AliasChoices, BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    immediateload,
+    joinedload,
+    lazyload,
+    load_only,
+    noload,
+    raiseload,
+    selectinload,
+    subqueryload,
+)
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 from sqlalchemy.sql._typing import (
     _ColumnExpressionArgument,
 )
 from sqlalchemy.sql.expression import Select as _Select
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from ..main import LazyType
+
 _T = TypeVar("_T")
+_TModel = TypeVar("_TModel", bound=BaseModel)
+
+_LOADERS: dict[str, Callable[[Any], _AbstractLoad]] = {
+    "select": lazyload,
+    "joined": joinedload,
+    "selectin": selectinload,
+    "subquery": subqueryload,
+    "immediate": immediateload,
+    "raise": raiseload,
+    "raise_on_sql": lambda attr: raiseload(attr, sql_only=True),
+    "noload": noload,
+}
 
 
 # Separate this class in SelectBase, Select, and SelectOfScalar so that they can share
@@ -28,6 +60,33 @@ class SelectBase(_Select[tuple[_T]]):
         """
         return super().having(*having)  # ty: ignore[invalid-argument-type]
 
+    def only(self, *fields: Any, strict: bool = False) -> Self:
+        """Return a new `Select` construct that loads only the given fields of the
+        model, e.g. `select(Hero).only(Hero.id, Hero.name)`, the primary key is
+        always loaded.
+
+        The other fields are deferred, they are loaded from the database when
+        accessed, or with `strict=True`, accessing them raises an error instead.
+        `model_dump()` skips the fields that were not loaded.
+        """
+        return self.options(load_only(*fields, raiseload=strict))
+
+    def load(self, relationship: Any, *, strategy: "LazyType" = "selectin") -> Self:
+        """Return a new `Select` construct that loads the given relationship with
+        the given strategy, e.g. `select(Team).load(Team.heroes)` loads the heroes
+        of all the teams with a single extra query, instead of one per team.
+
+        With `strategy="joined"` for a list relationship, call `unique()` on the
+        results, e.g. `session.exec(statement).unique().all()`.
+        """
+        loader = _LOADERS.get(strategy)
+        if loader is None:
+            raise ValueError(
+                f"Invalid loading strategy {strategy!r}, it should be one of: "
+                + ", ".join(repr(name) for name in _LOADERS)
+            )
+        return self.options(loader(relationship))
+
 
 class Select(SelectBase[_T]):
     inherit_cache = True
@@ -39,3 +98,65 @@ class Select(SelectBase[_T]):
 # for loops on the results will feel natural.
 class SelectOfScalar(SelectBase[_T]):
     inherit_cache = True
+    # The model and its input keys for each column set by into(), used by
+    # session.exec()
+    _sqlmodel_into: tuple[type[BaseModel], tuple[str, ...]] | None = None
+
+    def into(self, model: type[_TModel]) -> "SelectOfScalar[_TModel]":
+        """Return a new `Select` construct that selects only the columns needed by
+        the non-table `model` and that returns instances of it, built directly from
+        the rows, e.g. `select(Hero).into(HeroPublic)`.
+
+        The table model objects are not created, and nothing is added to the session.
+        """
+        if inspect(model, raiseerr=False) is not None:
+            raise ValueError(
+                f"{model.__name__} is a table model, into() only builds non-table "
+                "models"
+            )
+        description = self.column_descriptions[0]
+        entity = description["entity"]
+        if len(self.column_descriptions) != 1 or description["expr"] is not entity:
+            raise ValueError(
+                "into() can only be used to select a single table model, e.g. "
+                "select(Hero).into(HeroPublic)"
+            )
+        column_attrs = inspect(entity).mapper.column_attrs
+        names = tuple(name for name in model.model_fields if name in column_attrs)
+        if not names:
+            raise ValueError(
+                f"{model.__name__} has no fields that are columns of "
+                f"{description['type'].__name__}"
+            )
+        statement = cast(
+            SelectOfScalar[_TModel],
+            self.with_only_columns(*(getattr(entity, name) for name in names)),
+        )
+        keys = tuple(_get_input_key(model, name) for name in names)
+        statement._sqlmodel_into = (model, keys)
+        return statement
+
+
+def _get_input_key(model: type[BaseModel], name: str) -> str:
+    # The key to validate a column value with, in the dict built for each row
+    field = model.model_fields[name]
+    config = model.model_config
+    if config.get("validate_by_alias") is False:
+        return name
+    alias = field.validation_alias
+    if alias is None:
+        return field.alias or name
+    if isinstance(alias, str):
+        return alias
+    choices = alias.choices if isinstance(alias, AliasChoices) else [alias]
+    for choice in choices:
+        if isinstance(choice, str):
+            return choice
+        if len(choice.path) == 1 and isinstance(choice.path[0], str):
+            return choice.path[0]
+    if config.get("validate_by_name") or config.get("populate_by_name"):
+        return name
+    raise ValueError(
+        f"The field {name!r} of {model.__name__} can only be validated from a "
+        "nested AliasPath, into() can't set it from a column"
+    )
@@ -0,0 +1,88 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.engine.cursor import CursorResult
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.engine.result import Result
+from sqlalchemy.sql.base import Executable
+
+_TExecutable = TypeVar("_TExecutable", bound=Executable)
+
+
+@dataclass
+class PreparedStats:
+    """
+    The execution counters of a statement created with `prepared()`.
+
+    `cache_misses` also counts the executions that couldn't use the compiled
+    cache at all, e.g. when the engine has it disabled.
+    """
+
+    name: str
+    executions: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+# The statements are only referenced weakly, their stats go away with them
+_prepared_stats: "WeakKeyDictionary[Any, PreparedStats]" = WeakKeyDictionary()
+
+
+def prepared(statement: _TExecutable, *, name: str | None = None) -> _TExecutable:
+    """
+    Register a statement that is built once and executed many times, with the
+    values passed as bind parameters, e.g.:
+
+    ```Python
+    hero_by_id = prepared(select(Hero).where(Hero.id == bindparam("hero_id")))
+
+    hero = session.exec(hero_by_id, params={"hero_id": 1}).one()
+    ```
+
+    Reusing the same statement skips building it and generating its cache key
+    on each execution. It returns the same statement, and the executions with
+    `session.exec()` are counted, see `get_prepared_stats()`. By default, the
+    `name` in the stats is the file and line where `prepared()` was called.
+    """
+    if name is None:
+        frame = sys._getframe(1)
+        name = f"{frame.f_code.co_filename}:{frame.f_lineno}"
+    _prepared_stats[statement] = PreparedStats(name=name)
+    return statement
+
+
+def get_prepared_stats(*, never_cached: bool = False) -> list[PreparedStats]:
+    """
+    Return the stats of the prepared statements, with `never_cached=True` only
+    the ones that were executed but never got a compiled cache hit.
+    """
+    stats = list(_prepared_stats.values())
+    if never_cached:
+        return [item for item in stats if item.executions and not item.cache_hits]
+    return stats
+
+
+def record_execution(statement: Any, result: Result[Any]) -> None:
+    if not _prepared_stats:
+        return
+    try:
+        stats = _prepared_stats.get(statement)
+    except TypeError:
+        # Not weak referenceable, so it can't be a prepared statement
+        return
+    if stats is None:
+        return
+    # ORM results wrap the cursor result, that has the execution context
+    cursor_result = (
+        result if isinstance(result, CursorResult) else getattr(result, "raw", None)
+    )
+    stats.executions += 1
+    if (
+        cursor_result is not None
+        and cursor_result.context.cache_hit is CacheStats.CACHE_HIT
+    ):
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
@@ -1,8 +1,12 @@
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from pydantic import TypeAdapter
 from sqlalchemy import types
 from sqlalchemy.engine.interfaces import Dialect
 
+if TYPE_CHECKING:
+    from sqlalchemy.sql.type_api import _BindProcessorType, _ResultProcessorType
+
 
 class AutoString(types.TypeDecorator):
     impl = types.String
@@ -14,3 +18,88 @@ class AutoString(types.TypeDecorator):
         if impl.length is None and dialect.name == "mysql":
             return dialect.type_descriptor(types.String(self.mysql_default_length))
         return super().load_dialect_impl(dialect)
+
+
+class PydanticJSON(types.TypeDecorator):
+    """
+    A JSON column for the values of a field type, e.g. `dict[str, Any]`,
+    `list[int]`, or a Pydantic model, validated and serialized with Pydantic when
+    saved, and validated with Pydantic when loaded, to that same type.
+
+    The JSON text from the database is parsed and validated in a single pass by
+    pydantic-core, without creating intermediate dicts with the `json` module, and
+    the values are serialized to JSON text by pydantic-core too, unless the engine
+    has its own `json_deserializer` or `json_serializer`.
+    A `None` value is stored as SQL `NULL`, and `jsonb=True` uses PostgreSQL's
+    `JSONB` type.
+    """
+
+    impl = types.JSON
+    cache_ok = True
+
+    def __init__(self, annotation: Any, *, jsonb: bool = False) -> None:
+        super().__init__(none_as_null=True)
+        self.annotation = annotation
+        self.jsonb = jsonb
+        if jsonb:
+            from sqlalchemy.dialects.postgresql import JSONB
+
+            self.impl = JSONB(none_as_null=True)
+        self._adapter: TypeAdapter[Any] | None = None
+
+    def _get_adapter(self) -> TypeAdapter[Any]:
+        # Created on first use, not when the model class is created
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self.annotation | None)
+        return self._adapter
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        # The JSON compatible data, serialized to JSON by the engine, e.g. a dict
+        # for a model, by alias, so that it's validated back the same way. Table
+        # models don't validate their values, e.g. a dict for a model field, so
+        # it's validated here, a model instance is used as is
+        adapter = self._get_adapter()
+        return adapter.dump_python(
+            adapter.validate_python(value), mode="json", by_alias=True
+        )
+
+    def bind_processor(self, dialect: Dialect) -> "_BindProcessorType[Any] | None":
+        impl = cast(types.JSON, self.impl_instance)
+        # Dialects with their own JSON binding, e.g. psycopg's Json wrapper, and
+        # engines created with a json_serializer, get the JSON compatible data
+        if (
+            type(impl).bind_processor is not types.JSON.bind_processor
+            or getattr(dialect, "_json_serializer", None) is not None
+        ):
+            return super().bind_processor(dialect)
+        adapter = self._get_adapter()
+
+        def serialize(value: Any) -> str:
+            return adapter.dump_json(
+                adapter.validate_python(value), by_alias=True
+            ).decode()
+
+        # The JSON type still handles None, SQL NULL and JSON.NULL
+        return impl._make_bind_processor(
+            impl._str_impl.bind_processor(dialect), serialize
+        )
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> "_ResultProcessorType[Any] | None":
+        # Replaces the result processing of the JSON type, the database driver
+        # returns the JSON text, or the data when the driver already decodes it.
+        # Engines created with a json_deserializer decode the JSON text with it
+        adapter = self._get_adapter()
+        json_deserializer = getattr(dialect, "_json_deserializer", None)
+
+        def process(value: Any) -> Any:
+            if value is None:
+                return None
+            if isinstance(value, (str, bytes)):
+                if json_deserializer is None:
+                    return adapter.validate_json(value)
+                value = json_deserializer(value)
+            return adapter.validate_python(value)
+
+        return process
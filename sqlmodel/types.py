@@ -0,0 +1,258 @@
+import ipaddress
+import uuid
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel, EmailStr
+from sqlalchemy.sql.sqltypes import (
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    Interval,
+    LargeBinary,
+    Numeric,
+    Time,
+    Uuid,
+)
+from sqlalchemy.sql.sqltypes import Enum as sa_Enum
+from sqlalchemy.sql.type_api import TypeEngine, to_instance
+
+from ._compat import (
+    FakeMetadata,
+    get_sa_annotation_from_type_annotation,
+    is_table_model_class,
+)
+from .sql.sqltypes import AutoString, PydanticJSON
+
+# The SQLAlchemy type, or function that returns it, registered for each Python
+# type, by dialect name, with None for the default one for any database
+_registry: dict[type[Any], dict[str | None, Any]] = {}
+# The annotation without Optional and the registered types found for it, for each
+# field annotation, cleared when a type is registered
+_lookup_cache: dict[Any, tuple[Any, dict[str | None, Any]]] = {}
+
+
+def register(
+    py_type: type[Any],
+    sa_type_factory: Any,
+    *,
+    dialects: str | Iterable[str] | None = None,
+) -> None:
+    """
+    Register the SQLAlchemy type used for the fields of type `py_type`, or of a
+    subclass of it, that don't set `sa_type` or `sa_column`, e.g.:
+
+    ```Python
+    from sqlalchemy import Numeric
+    from sqlalchemy.dialects import postgresql
+    from sqlmodel import types
+
+    types.register(Money, Numeric(12, 2))
+    types.register(Money, postgresql.MONEY, dialects="postgresql")
+    ```
+
+    `sa_type_factory` is a SQLAlchemy type, class or instance, or a function that
+    is called with the field type annotation, without `Optional`, e.g.
+    `list[int]`, and an object with the field constraints as attributes, e.g.
+    `max_length`, and returns the SQLAlchemy type.
+
+    With `dialects`, e.g. `"postgresql"`, it's only used for those databases, as
+    a variant of the type registered without `dialects` for the same class, or
+    for the nearest base class that has one. Registering the same class again
+    replaces its type.
+
+    For subclasses, the type of the nearest class in the MRO is used, checking
+    the enum classes first, so that e.g. `class Color(str, Enum)` is stored as
+    an enum and not as a string.
+    """
+    if dialects is None or isinstance(dialects, str):
+        dialect_names: list[str | None] = [dialects]
+    else:
+        dialect_names = list(dialects)
+    factories = _registry.setdefault(py_type, {})
+    for dialect_name in dialect_names:
+        factories[dialect_name] = sa_type_factory
+    _lookup_cache.clear()
+
+
+def _get_factories(type_: Any) -> dict[str | None, Any]:
+    if not isinstance(type_, type):
+        return {}
+    factories: dict[str | None, Any] = {}
+    mro = sorted(type_.__mro__, key=lambda base: not issubclass(base, Enum))
+    for base in mro:
+        for dialect_name, factory in _registry.get(base, {}).items():
+            factories.setdefault(dialect_name, factory)
+        # The dialect types of more generic classes don't apply to this one
+        if None in factories:
+            return factories
+    # Only types for some databases, there's none to use for the rest
+    return {}
+
+
+def _lookup(annotation: Any) -> tuple[Any, dict[str | None, Any]]:
+    try:
+        return _lookup_cache[annotation]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not hashable, e.g. Annotated with a dict
+        annotation = get_sa_annotation_from_type_annotation(annotation)
+        return annotation, _get_factories(get_origin(annotation) or annotation)
+    sa_annotation = get_sa_annotation_from_type_annotation(annotation)
+    result = sa_annotation, _get_factories(get_origin(sa_annotation) or sa_annotation)
+    _lookup_cache[annotation] = result
+    return result
+
+
+def _build_sa_type(factory: Any, annotation: Any, metadata: Any) -> Any:
+    if isinstance(factory, TypeEngine) or (
+        isinstance(factory, type) and issubclass(factory, TypeEngine)
+    ):
+        return factory
+    return factory(annotation, metadata)
+
+
+def get_sa_type(annotation: Any, metadata: Any = None) -> Any:
+    """
+    Return the SQLAlchemy type registered for a field type annotation, e.g.
+    `int | None`, with `metadata` having the field constraints, as in
+    `register()`, e.g. to use it for the items in the type of a list.
+
+    It raises a `ValueError` when there's no type registered for it.
+    """
+    annotation, factories = _lookup(annotation)
+    if None not in factories:
+        type_ = get_origin(annotation) or annotation
+        raise ValueError(f"{type_} has no matching SQLAlchemy type")
+    if metadata is None:
+        metadata = FakeMetadata()
+    sa_type = _build_sa_type(factories[None], annotation, metadata)
+    for dialect_name, factory in factories.items():
+        if dialect_name is not None:
+            variant = _build_sa_type(factory, annotation, metadata)
+            sa_type = to_instance(sa_type).with_variant(
+                to_instance(variant), dialect_name
+            )
+    return sa_type
+
+
+def use_native_postgresql_types() -> None:
+    """
+    Register the native PostgreSQL types, used instead of the portable ones only
+    in PostgreSQL:
+
+    * `INET` and `CIDR` for the IP address and network fields, instead of strings.
+    * `JSONB` for the dict and Pydantic model fields, instead of `JSON`.
+    * `ARRAY` for the list fields with items of a type that has a SQL type, e.g.
+      `list[int]`, and `JSONB` for other lists, instead of `JSON`.
+
+    It's not the default, as it changes the tables of existing models. UUIDs
+    are already stored with the native `UUID` type in PostgreSQL.
+    """
+    from sqlalchemy.dialects.postgresql import CIDR, INET
+
+    for py_type in (ipaddress.IPv4Address, ipaddress.IPv6Address):
+        register(py_type, INET, dialects="postgresql")
+    for py_type in (ipaddress.IPv4Network, ipaddress.IPv6Network):
+        register(py_type, CIDR, dialects="postgresql")
+    register(dict, _get_jsonb_type, dialects="postgresql")
+    register(BaseModel, _get_model_jsonb_type, dialects="postgresql")
+    register(list, _get_array_type, dialects="postgresql")
+
+
+def _get_json_type(annotation: Any, metadata: Any) -> Any:
+    _check_model_type(annotation)
+    return PydanticJSON(annotation)
+
+
+def _get_jsonb_type(annotation: Any, metadata: Any) -> Any:
+    _check_model_type(annotation)
+    return PydanticJSON(annotation, jsonb=True)
+
+
+def _check_model_type(annotation: Any) -> None:
+    # Also for the items of collections, e.g. list[Team] or dict[str, list[Team]]
+    if isinstance(annotation, type) and is_table_model_class(annotation):
+        raise ValueError(
+            f"{annotation} is a table model, it can't be stored in a JSON column, "
+            "declare the field with Relationship()"
+        )
+    for arg in get_args(annotation):
+        _check_model_type(arg)
+
+
+def _get_model_json_type(annotation: Any, metadata: Any) -> Any:
+    _check_model_type(annotation)
+    return PydanticJSON(annotation)
+
+
+def _get_model_jsonb_type(annotation: Any, metadata: Any) -> Any:
+    _check_model_type(annotation)
+    return PydanticJSON(annotation, jsonb=True)
+
+
+def _get_array_type(annotation: Any, metadata: Any) -> Any:
+    from sqlalchemy.dialects.postgresql import ARRAY
+
+    _check_model_type(annotation)
+    args = get_args(annotation)
+    try:
+        item_type = get_sa_type(args[0]) if args else None
+    except ValueError:
+        item_type = None
+    if item_type is None or isinstance(to_instance(item_type), PydanticJSON):
+        # e.g. lists of models or lists of lists, stored as JSON arrays
+        return PydanticJSON(annotation, jsonb=True)
+    return ARRAY(item_type)
+
+
+def _get_enum_type(annotation: Any, metadata: Any) -> Any:
+    return sa_Enum(annotation)
+
+
+def _get_string_type(annotation: Any, metadata: Any) -> Any:
+    max_length = getattr(metadata, "max_length", None)
+    if max_length:
+        return AutoString(length=max_length)
+    return AutoString
+
+
+def _get_numeric_type(annotation: Any, metadata: Any) -> Any:
+    return Numeric(
+        precision=getattr(metadata, "max_digits", None),
+        scale=getattr(metadata, "decimal_places", None),
+    )
+
+
+register(Enum, _get_enum_type)
+for _py_type in (
+    str,
+    ipaddress.IPv4Address,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Address,
+    ipaddress.IPv6Network,
+    Path,
+):
+    register(_py_type, _get_string_type)
+# For type checkers EmailStr is Annotated[str, ...], at runtime it's a class
+register(EmailStr, _get_string_type)  # ty: ignore[invalid-argument-type]
+register(float, Float)
+register(bool, Boolean)
+register(int, Integer)
+register(datetime, DateTime)
+register(date, Date)
+register(timedelta, Interval)
+register(time, Time)
+register(bytes, LargeBinary)
+register(Decimal, _get_numeric_type)
+register(uuid.UUID, Uuid)
+register(dict, _get_json_type)
+register(list, _get_json_type)
+register(BaseModel, _get_model_json_type)
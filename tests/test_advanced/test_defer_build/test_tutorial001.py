@@ -0,0 +1,33 @@
+import importlib
+from types import ModuleType
+
+import pytest
+from sqlmodel import create_engine
+
+from ...conftest import PrintMock
+
+
+@pytest.fixture(
+    name="mod",
+    params=[
+        pytest.param("tutorial001_py310"),
+    ],
+)
+def get_module(request: pytest.FixtureRequest) -> ModuleType:
+    mod = importlib.import_module(f"docs_src.advanced.defer_build.{request.param}")
+    mod.sqlite_url = "sqlite://"
+    mod.engine = create_engine(mod.sqlite_url)
+    return mod
+
+
+def test_tutorial(print_mock: PrintMock, mod: ModuleType) -> None:
+    mod.main()
+    assert print_mock.calls == [
+        ["Hero built:", False],
+        ["HeroUpdate built:", True],
+        [
+            "Updated hero:",
+            {"secret_name": "Dive Wilson", "id": 1, "age": 30, "name": "Deadpond"},
+        ],
+        ["Team built:", False],
+    ]
@@ -0,0 +1,45 @@
+import importlib
+import logging
+from types import ModuleType
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import create_engine
+from sqlmodel.pool import StaticPool
+
+
+@pytest.fixture(
+    name="module",
+    params=[
+        pytest.param("tutorial001_py310"),
+    ],
+)
+def get_module(request: pytest.FixtureRequest) -> ModuleType:
+    mod = importlib.import_module(f"docs_src.advanced.session_stats.{request.param}")
+    mod.sqlite_url = "sqlite://"
+    mod.engine = create_engine(
+        mod.sqlite_url, connect_args=mod.connect_args, poolclass=StaticPool
+    )
+    return mod
+
+
+def test_tutorial(module: ModuleType, caplog: pytest.LogCaptureFixture):
+    with TestClient(module.app) as client:
+        with caplog.at_level(logging.INFO, logger="heroes"):
+            response = client.post(
+                "/heroes/", json={"name": "Deadpond", "secret_name": "Dive Wilson"}
+            )
+            assert response.status_code == 200, response.text
+            response = client.post(
+                "/heroes/", json={"name": "Rusty-Man", "secret_name": "Tommy Sharp"}
+            )
+            assert response.status_code == 200, response.text
+            response = client.get("/heroes/")
+            assert response.status_code == 200, response.text
+            assert len(response.json()) == 2
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 3
+    assert messages[0].startswith("POST /heroes/: 2 statements")
+    assert messages[2].startswith("GET /heroes/: 1 statements")
+    assert messages[2].endswith("hydrating 2 rows")
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_async_exec_stream(clear_sqlmodel, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    database = tmp_path / "heroes.db"
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}") for i in range(25))
+        session.commit()
+    engine.dispose()
+
+    async def main() -> None:
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        async with AsyncSession(async_engine) as session:
+            result = await session.exec_stream(
+                select(Hero).order_by(Hero.id), chunk_size=10
+            )
+            names = [hero.name async for hero in result]
+            assert names == [f"Hero {i}" for i in range(25)]
+
+            result = await session.exec_stream(select(Hero), chunk_size=10)
+            chunks = [chunk async for chunk in result.partitions()]
+            assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+            tuple_result = await session.exec_stream(
+                select(Hero.id, Hero.name).where(Hero.id <= 2).order_by(Hero.id)
+            )
+            assert [tuple(row) async for row in tuple_result] == [
+                (1, "Hero 0"),
+                (2, "Hero 1"),
+            ]
+        await async_engine.dispose()
+
+    asyncio.run(main())
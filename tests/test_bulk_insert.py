@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_bulk_insert(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+        country: str = "Unknown"
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    rows = [
+        Hero(name="Deadpond"),
+        {"name": "Spider-Boy", "age": 16, "country": "USA"},
+        Hero(id=10, name="Rusty-Man", age=48),
+        Hero(name="Tarantula"),
+    ]
+    with Session(engine) as session:
+        assert session.bulk_insert(Hero, rows, batch_size=3) == [1, 2, 10, 11]
+        assert len(session.identity_map) == 0
+        assert not session.new
+        session.commit()
+
+    assert rows[0].id is None
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [hero.model_dump() for hero in heroes] == [
+            {"id": 1, "name": "Deadpond", "age": None, "country": "Unknown"},
+            {"id": 2, "name": "Spider-Boy", "age": 16, "country": "USA"},
+            {"id": 10, "name": "Rusty-Man", "age": 48, "country": "Unknown"},
+            {"id": 11, "name": "Tarantula", "age": None, "country": "Unknown"},
+        ]
+
+
+def test_bulk_insert_without_pks(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        rows = (Hero(name=f"Hero {i}") for i in range(25))
+        assert session.bulk_insert(Hero, rows, return_pks=False, batch_size=10) is None
+        session.commit()
+        assert len(session.exec(select(Hero)).all()) == 25
+
+
+def test_bulk_insert_composite_pk_without_returning(clear_sqlmodel):
+    class HeroTeamLink(SQLModel, table=True):
+        hero_id: int = Field(primary_key=True)
+        team_id: int = Field(primary_key=True)
+        is_training: bool = False
+
+    engine = create_engine("sqlite://")
+    # Like databases that don't support INSERT..RETURNING with many rows
+    engine.dialect.insert_executemany_returning_sort_by_parameter_order = False
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        pks = session.bulk_insert(
+            HeroTeamLink,
+            [HeroTeamLink(hero_id=1, team_id=2), {"hero_id": 3, "team_id": 4}],
+        )
+        assert pks == [(1, 2), (3, 4)]
+        session.commit()
+        assert len(session.exec(select(HeroTeamLink)).all()) == 2
+
+
+def test_async_bulk_insert(clear_sqlmodel):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            pks = await session.bulk_insert(
+                Hero, [Hero(name="Deadpond"), {"name": "Spider-Boy"}]
+            )
+            assert pks == [1, 2]
+            await session.commit()
+            result = await session.exec(select(Hero.name).order_by(Hero.id))
+            assert result.all() == ["Deadpond", "Spider-Boy"]
+        await engine.dispose()
+
+    asyncio.run(main())
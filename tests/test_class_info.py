@@ -0,0 +1,46 @@
+from sqlalchemy import JSON
+from sqlmodel import Field, Relationship, SQLModel
+
+
+def test_class_info(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class HeroBase(SQLModel):
+        name: str = Field(alias="heroName")
+        tags: list[str] = Field(default_factory=list, sa_type=JSON)
+
+    class Hero(HeroBase, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    base_info = HeroBase.__sqlmodel_class_info__
+    assert not base_info.table
+    assert base_info.field_names == {"name", "tags"}
+    assert base_info.instrumented_names == frozenset()
+    assert base_info.alias_to_field == {"heroName": "name"}
+    assert base_info.required_fields == ("name",)
+    assert base_info.default_fields == ("tags",)
+    assert base_info.default_factories == {"tags": list}
+
+    hero_info = Hero.__sqlmodel_class_info__
+    assert hero_info.table
+    assert hero_info.field_names == {"name", "tags", "id", "team_id"}
+    assert hero_info.relationship_names == {"team"}
+    assert hero_info.instrumented_names == {"name", "tags", "id", "team_id", "team"}
+    assert Team.__sqlmodel_class_info__.relationship_names == {"heroes"}
+
+
+def test_sqlmodel_update_only_sets_fields(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    hero = Hero(name="Deadpond")
+    hero.sqlmodel_update({"age": 30, "not_a_field": "ignored"})
+    assert hero.age == 30
+    assert not hasattr(hero, "not_a_field")
@@ -0,0 +1,65 @@
+import pytest
+from pydantic import ConfigDict, ValidationError
+from sqlalchemy.orm import class_mapper
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def test_defer_build_table_models(clear_sqlmodel):
+    class Base(SQLModel):
+        model_config = ConfigDict(defer_build=True)
+
+    class Team(Base, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(Base, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    assert not Team.__pydantic_complete__
+    assert not Hero.__pydantic_complete__
+    # The SQLAlchemy mappers are not deferred
+    assert class_mapper(Hero).class_ is Hero
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", team=Team(name="Preventers")))
+        session.commit()
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        assert hero.team is not None
+        assert hero.team.name == "Preventers"
+        Hero.model_construct(name="Rusty-Man")
+    # Creating, querying, and loading the models doesn't need Pydantic's schema
+    assert not Team.__pydantic_complete__
+    assert not Hero.__pydantic_complete__
+
+    assert hero.model_dump() == {"id": 1, "name": "Deadpond", "age": None, "team_id": 1}
+    assert Hero.__pydantic_complete__
+    assert not Team.__pydantic_complete__
+    assert Team.model_validate({"name": "Z-Force"}).name == "Z-Force"
+    with pytest.raises(ValidationError):
+        Hero.model_validate({"name": "Spider-Boy", "age": "unknown"})
+    heroes = Hero.model_validate_many([{"name": "Spider-Boy", "age": "16"}])
+    assert heroes[0].age == 16
+
+
+def test_defer_build_non_table_models(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        model_config = ConfigDict(defer_build=True)
+
+        name: str
+        age: int | None = None
+
+    class HeroCreate(HeroBase):
+        pass
+
+    assert not HeroCreate.__pydantic_complete__
+    hero = HeroCreate(name="Deadpond", age="42")
+    assert hero.age == 42
+    assert HeroCreate.__pydantic_complete__
@@ -0,0 +1,60 @@
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_exec_stream(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}") for i in range(25))
+        session.commit()
+
+    with Session(engine) as session:
+        chunks = list(
+            session.exec_stream(select(Hero).order_by(Hero.id), chunk_size=10)
+        )
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert chunks[0][0].name == "Hero 0"
+        assert chunks[2][4].name == "Hero 24"
+        assert chunks[0][0] in session
+
+    with Session(engine) as session:
+        chunks = session.exec_stream(
+            select(Hero.id, Hero.name).where(Hero.id <= 3).order_by(Hero.id),
+            chunk_size=2,
+        )
+        assert [list(map(tuple, chunk)) for chunk in chunks] == [
+            [(1, "Hero 0"), (2, "Hero 1")],
+            [(3, "Hero 2")],
+        ]
+
+
+def test_exec_stream_expunge(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}") for i in range(25))
+        session.commit()
+
+    with Session(engine) as session:
+        seen: list[Hero] = []
+        for chunk in session.exec_stream(select(Hero), chunk_size=10, expunge=True):
+            assert all(hero in session for hero in chunk)
+            seen.extend(chunk)
+        assert len(seen) == 25
+        assert not any(hero in session for hero in seen)
+        assert len(session.identity_map) == 0
+
+    with Session(engine) as session:
+        statement = select(Hero, Hero.name).where(Hero.id == 1)
+        for chunk in session.exec_stream(statement, expunge=True):
+            hero, name = chunk[0]
+            assert name == "Hero 0"
+        assert hero not in session
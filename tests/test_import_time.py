@@ -0,0 +1,90 @@
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import sqlmodel
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    # The cumulative import time in microseconds of each module imported by the code
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_sqlmodel_is_lazy():
+    times = get_import_times("import sqlmodel")
+    assert "sqlmodel" in times
+    assert not [
+        name
+        for name in times
+        if name.split(".")[0] in {"sqlalchemy", "pydantic"}
+        or name.startswith("sqlmodel.")
+    ]
+
+
+def test_lazy_name_imports_its_module_only():
+    times = get_import_times("from sqlmodel import create_engine")
+    assert "sqlalchemy.engine" in times
+    assert "sqlmodel.main" not in times
+    assert "pydantic" not in times
+
+
+def test_lazy_names():
+    for name in sqlmodel.__all__:
+        assert getattr(sqlmodel, name) is not None
+    assert set(sqlmodel.__all__) <= set(dir(sqlmodel))
+    from sqlmodel.orm.session import Session
+
+    assert sqlmodel.Session is Session
+    assert sqlmodel.__dict__["Session"] is Session
+    with pytest.raises(AttributeError, match="has no attribute 'Sesion'"):
+        sqlmodel.Sesion  # noqa: B018
+
+
+def test_lazy_names_match_type_checking_imports():
+    # The imports for type checkers have to be kept in sync with the lazy names
+    tree = ast.parse(Path(sqlmodel.__file__).read_text())
+    type_checking = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    imports = {
+        alias.name: "." * node.level + (node.module or "")
+        for node in type_checking.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert imports == sqlmodel._LAZY_IMPORTS
+
+
+def test_submodules_after_import_sqlmodel():
+    code = (
+        "import sqlmodel\n"
+        "assert sqlmodel.main.SQLModel is sqlmodel.SQLModel\n"
+        "assert sqlmodel.sql.expression.select is sqlmodel.select\n"
+        "assert sqlmodel.orm.session.Session is sqlmodel.Session\n"
+        "assert sqlmodel.ext.asyncio.session.AsyncSession\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_dir_lists_public_names():
+    names = dir(sqlmodel)
+    assert names == sorted(sqlmodel.__all__)
+    assert not [
+        name for name in names if name.startswith("_") and name != "__version__"
+    ]
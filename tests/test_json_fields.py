@@ -0,0 +1,163 @@
+import json
+from datetime import datetime
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field as PydanticField
+from sqlalchemy import JSON, text
+from sqlalchemy.exc import StatementError
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+class Power(BaseModel):
+    name: str
+    level: int = 1
+    since: datetime | None = None
+
+
+class Profile(BaseModel):
+    bio: str
+    secret_identity: str = PydanticField(alias="secretIdentity")
+    powers: list[Power] = []
+
+
+def test_json_fields(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        tags: list[str] = Field(default_factory=list)
+        stats: dict[str, Any] = Field(default_factory=dict)
+        profile: Profile | None = None
+        sidekicks: list[Profile] = Field(default_factory=list)
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    since = datetime(2020, 1, 2, 3, 4, 5)
+    with Session(engine) as session:
+        session.add(
+            Hero(
+                name="Deadpond",
+                tags=["funny", "fast"],
+                stats={"speed": 9.5, "missions": [1, 2]},
+                profile={
+                    "bio": "Mercenary",
+                    "secretIdentity": "Dive Wilson",
+                    "powers": [{"name": "Healing", "since": since}],
+                },
+                sidekicks=[Profile(bio="Rookie", secretIdentity="Tommy")],
+            )
+        )
+        session.add(Hero(name="Spider-Boy"))
+        session.commit()
+
+    with Session(engine) as session:
+        deadpond = session.exec(select(Hero).where(Hero.name == "Deadpond")).one()
+        assert deadpond.tags == ["funny", "fast"]
+        assert deadpond.stats == {"speed": 9.5, "missions": [1, 2]}
+        assert deadpond.profile == Profile(
+            bio="Mercenary",
+            secretIdentity="Dive Wilson",
+            powers=[Power(name="Healing", since=since)],
+        )
+        assert deadpond.sidekicks == [Profile(bio="Rookie", secretIdentity="Tommy")]
+        spider_boy = session.exec(select(Hero).where(Hero.name == "Spider-Boy")).one()
+        assert spider_boy.profile is None
+        assert spider_boy.tags == []
+        # Also validated when selecting the column alone
+        profiles = session.exec(select(Hero.profile).order_by(Hero.id)).all()
+        assert profiles == [deadpond.profile, None]
+        # The JSON operators of the column type still work
+        statement = select(Hero.name).where(Hero.stats["speed"].as_float() > 9)
+        assert session.exec(statement).all() == ["Deadpond"]
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT profile FROM hero ORDER BY id")
+        ).fetchall()
+    # Stored by alias, and None as NULL instead of the JSON null
+    assert json.loads(rows[0][0]) == {
+        "bio": "Mercenary",
+        "secretIdentity": "Dive Wilson",
+        "powers": [{"name": "Healing", "level": 1, "since": "2020-01-02T03:04:05"}],
+    }
+    assert rows[1][0] is None
+
+
+def test_json_fields_update(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        profile: Profile
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        hero = Hero(name="Deadpond", profile=Profile(bio="", secretIdentity="Dive"))
+        session.add(hero)
+        session.commit()
+        hero.profile = Profile(bio="Mercenary", secretIdentity="Dive Wilson")
+        session.add(hero)
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        assert hero.profile.bio == "Mercenary"
+        assert hero.model_dump(mode="json", by_alias=True)["profile"] == {
+            "bio": "Mercenary",
+            "secretIdentity": "Dive Wilson",
+            "powers": [],
+        }
+        hero.profile = {"bio": "Mercenary"}
+        session.add(hero)
+        with pytest.raises(StatementError, match="secretIdentity"):
+            session.commit()
+
+
+def test_json_serializer(clear_sqlmodel):
+    class Event(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        data: dict[str, Any]
+        raw: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+
+    engine = create_engine("sqlite://")
+    # The engine keeps SQLAlchemy's JSON serializer, for the JSON columns
+    assert engine.dialect._json_serializer is None
+    assert engine.dialect._json_deserializer is None
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Serialized by pydantic-core, the json module can't serialize a datetime
+        session.add(Event(data={"at": datetime(2020, 1, 2), "count": 2}))
+        session.commit()
+        event = session.exec(select(Event)).one()
+        assert event.data == {"at": "2020-01-02T00:00:00", "count": 2}
+        event.raw = {"at": datetime(2020, 1, 2)}
+        session.add(event)
+        with pytest.raises(StatementError, match="not JSON serializable"):
+            session.commit()
+
+    calls = []
+
+    def json_serializer(value: Any) -> str:
+        calls.append(("dumps", value))
+        return json.dumps(value)
+
+    def json_deserializer(value: str) -> Any:
+        calls.append(("loads", value))
+        return json.loads(value)
+
+    # The engine json_serializer and json_deserializer are used when given, with
+    # the data dumped and validated by Pydantic
+    engine = create_engine(
+        "sqlite://",
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Event(data={"at": datetime(2020, 1, 2)}))
+        session.commit()
+        assert ("dumps", {"at": "2020-01-02T00:00:00"}) in calls
+        event = session.exec(select(Event)).one()
+        assert event.data == {"at": "2020-01-02T00:00:00"}
+        assert ("loads", '{"at": "2020-01-02T00:00:00"}') in calls
@@ -0,0 +1,89 @@
+import warnings
+
+import pytest
+from sqlalchemy.orm import selectinload
+from sqlmodel import (
+    Field,
+    LazyLoadDetector,
+    LazyLoadError,
+    LazyLoadWarning,
+    Relationship,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+
+def create_heroes():
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(4):
+            team = Team(name=f"Team {i}")
+            session.add(Hero(name=f"Hero {i}", team=team))
+        session.commit()
+    return engine, Team, Hero
+
+
+def test_lazy_loads_warn(clear_sqlmodel):
+    engine, Team, Hero = create_heroes()
+    detector = LazyLoadDetector(threshold=2)
+    with Session(engine, lazy_loads=detector) as session:
+        teams = session.exec(select(Team)).all()
+        with pytest.warns(LazyLoadWarning) as record:
+            for team in teams:
+                assert len(team.heroes) == 1
+        assert len(record) == 1
+        assert record[0].filename == __file__
+        assert str(record[0].message).startswith(
+            "Team.heroes was lazy loaded 3 times, more than the threshold of 2, "
+            f"at {__file__}:"
+        )
+        assert detector.counts == {"Team.heroes": 4}
+
+        # Already loaded, or loaded with the parents, there are no lazy loads
+        detector.reset()
+        for team in teams:
+            assert len(team.heroes) == 1
+        session.expunge_all()
+        statement = select(Hero).options(selectinload(Hero.team))  # type: ignore[arg-type]
+        for hero in session.exec(statement).all():
+            assert hero.team is not None
+        assert detector.counts == {}
+
+
+def test_lazy_loads_raise(clear_sqlmodel):
+    engine, Team, Hero = create_heroes()
+    detector = LazyLoadDetector(threshold=1, action="raise")
+    with Session(engine, lazy_loads=detector) as session:
+        heroes = session.exec(select(Hero)).all()
+        assert heroes[0].team is not None
+        with pytest.raises(LazyLoadError, match="Hero.team was lazy loaded 2 times"):
+            assert heroes[1].team
+
+
+def test_lazy_loads_count(clear_sqlmodel):
+    engine, Team, Hero = create_heroes()
+    detector = LazyLoadDetector(threshold=1, action="count")
+    for _ in range(2):
+        with Session(engine, lazy_loads=detector) as session:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                for team in session.exec(select(Team)).all():
+                    assert team.heroes
+    assert detector.counts == {"Team.heroes": 8}
+
+    with pytest.raises(ValueError, match="Invalid action for lazy loads: 'log'"):
+        LazyLoadDetector(action="log")  # type: ignore[arg-type]
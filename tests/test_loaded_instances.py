@@ -0,0 +1,42 @@
+import copy
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_loaded_instance_pydantic_attributes(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", age=48))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        # Not created when loading the object, only on first access
+        with pytest.raises(AttributeError):
+            object.__getattribute__(hero, "__pydantic_fields_set__")
+        assert hero.model_dump() == {"id": 1, "name": "Deadpond", "age": 48}
+        assert hero.model_dump(exclude_unset=True) == {}
+        assert hero.model_fields_set == set()
+        hero.age = 49
+        assert hero.model_fields_set == {"age"}
+        hero_copy = copy.deepcopy(hero)
+        assert hero_copy.model_fields_set == {"age"}
+        assert hero_copy.model_fields_set is not hero.model_fields_set
+        assert hero_copy == hero
+
+
+def test_missing_attribute(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    hero = Hero(name="Deadpond")
+    with pytest.raises(AttributeError, match="not_an_attribute"):
+        hero.not_an_attribute  # noqa: B018
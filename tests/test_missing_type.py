@@ -1,17 +1,18 @@
+from typing import Any
+
 import pytest
-from pydantic import BaseModel
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
 from sqlmodel import Field, SQLModel
 
 
 def test_missing_sql_type():
-    class CustomType(BaseModel):
-        @classmethod
-        def __get_validators__(cls):
-            yield cls.validate
-
+    class CustomType:
         @classmethod
-        def validate(cls, v):  # pragma: no cover
-            return v
+        def __get_pydantic_core_schema__(
+            cls, source_type: Any, handler: GetCoreSchemaHandler
+        ) -> core_schema.CoreSchema:
+            return core_schema.is_instance_schema(cls)
 
     with pytest.raises(ValueError):
 
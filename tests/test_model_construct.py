@@ -0,0 +1,94 @@
+from pydantic import field_validator
+from sqlalchemy import JSON
+from sqlalchemy.orm import validates
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def test_model_construct_table(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+        @field_validator("age")
+        @classmethod
+        def check_age(cls, value: int | None) -> int | None:
+            raise ValueError("not called for trusted data")
+
+    team = Team.model_construct(name="Preventers")
+    hero = Hero.model_construct(name="Deadpond", age=48, team=team)
+    assert hero.age == 48
+    assert hero.team is team
+    assert team.heroes == [hero]
+    assert hero.model_fields_set == {"name", "age"}
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero)
+        session.commit()
+        assert hero.id == 1
+        assert hero.team_id == team.id == 1
+
+    with Session(engine) as session:
+        db_hero = session.exec(select(Hero)).one()
+        assert db_hero.name == "Deadpond"
+        assert db_hero.team is not None
+        assert db_hero.team.name == "Preventers"
+
+
+def test_model_construct_fields_set(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        tags: list[str] = Field(default_factory=list, sa_type=JSON)
+
+    hero = Hero.model_construct({"id", "name"}, id=1, name="Deadpond")
+    assert hero.tags == []
+    assert hero.model_fields_set == {"id", "name"}
+    hero.tags = ["fast"]
+    assert hero.model_fields_set == {"id", "name", "tags"}
+
+
+def test_model_construct_set_listener(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+        @validates("name")
+        def validate_name(self, key: str, value: str) -> str:
+            return value.title()
+
+    hero = Hero.model_construct(name="deadpond")
+    assert hero.name == "Deadpond"
+
+
+def test_model_construct_unmapped_subclass(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    class SpecialHero(Hero):
+        pass
+
+    hero = SpecialHero.model_construct(name="Deadpond")
+    assert hero.name == "Deadpond"
+    assert hero.model_fields_set == {"name"}
+    assert "_sa_instance_state" in hero.__dict__
+
+
+def test_model_construct_non_table(clear_sqlmodel):
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+
+    hero = HeroPublic.model_construct(id=1, name="Deadpond")
+    assert hero.model_dump() == {"id": 1, "name": "Deadpond"}
+    assert "_sa_instance_state" not in hero.__dict__
@@ -0,0 +1,242 @@
+import json
+from typing import Optional
+
+import pytest
+from sqlmodel import (
+    Field,
+    LazyLoadDetector,
+    Relationship,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+
+def create_models():
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+        powers: list["Power"] = Relationship(back_populates="hero")
+
+    class Power(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        hero_id: int = Field(foreign_key="hero.id")
+        hero: Hero = Relationship(back_populates="powers")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        preventers = Team(name="Preventers")
+        z_force = Team(name="Z-Force")
+        session.add_all(
+            [
+                Hero(name="Deadpond", team=z_force),
+                Hero(
+                    name="Rusty-Man",
+                    team=preventers,
+                    powers=[Power(name="Flight"), Power(name="Armor")],
+                ),
+                Hero(name="Tarantula", team=preventers, powers=[Power(name="Webs")]),
+                Hero(name="Spider-Boy"),
+            ]
+        )
+        session.commit()
+    return Team, Hero, engine
+
+
+def test_model_dump_relationships(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    with Session(engine) as session:
+        team = session.exec(select(Team).where(Team.name == "Preventers")).one()
+        data = team.model_dump(relationships={"heroes": {"team": True}})
+    assert data == {
+        "id": 2,
+        "name": "Preventers",
+        "heroes": [
+            {
+                "id": 2,
+                "name": "Rusty-Man",
+                "team_id": 2,
+                "team": {"id": 2, "name": "Preventers"},
+            },
+            {
+                "id": 3,
+                "name": "Tarantula",
+                "team_id": 2,
+                "team": {"id": 2, "name": "Preventers"},
+            },
+        ],
+    }
+
+
+def test_model_dump_relationships_depth(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    with Session(engine) as session:
+        hero = session.exec(select(Hero).where(Hero.name == "Deadpond")).one()
+        assert hero.model_dump(relationships=0) == {
+            "id": 1,
+            "name": "Deadpond",
+            "team_id": 1,
+        }
+        assert hero.model_dump(relationships=1) == {
+            "id": 1,
+            "name": "Deadpond",
+            "team_id": 1,
+            "team": {"id": 1, "name": "Z-Force"},
+            "powers": [],
+        }
+        assert hero.model_dump(relationships=2)["team"]["heroes"] == [
+            {"id": 1, "name": "Deadpond", "team_id": 1}
+        ]
+        hero = session.exec(select(Hero).where(Hero.name == "Spider-Boy")).one()
+        assert hero.model_dump(relationships=2, exclude_none=True) == {
+            "id": 4,
+            "name": "Spider-Boy",
+            "team": None,
+            "powers": [],
+        }
+
+
+def test_model_dump_relationships_json(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    with Session(engine) as session:
+        team = session.exec(select(Team).where(Team.name == "Z-Force")).one()
+        data = team.model_dump(
+            mode="json", by_alias=True, relationships={"heroes": True}
+        )
+    assert data == {
+        "id": 1,
+        "name": "Z-Force",
+        "heroes": [{"id": 1, "name": "Deadpond", "team_id": 1}],
+    }
+
+
+def test_model_dump_relationships_batched(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    detector = LazyLoadDetector(action="count")
+    with Session(engine, lazy_loads=detector, stats=True) as session:
+        team = session.exec(select(Team).where(Team.name == "Preventers")).one()
+        session.stats.reset()
+        data = team.model_dump(relationships={"heroes": {"powers": {"hero": True}}})
+        # The heroes of the team, then the powers of all the heroes at once, the
+        # heroes are not selected again
+        assert session.stats.statements == {"select": 2}
+    assert detector.counts == {"Team.heroes": 1}
+    assert [hero["name"] for hero in data["heroes"]] == ["Rusty-Man", "Tarantula"]
+    assert [
+        [(power["name"], power["hero"]["name"]) for power in hero["powers"]]
+        for hero in data["heroes"]
+    ] == [[("Flight", "Rusty-Man"), ("Armor", "Rusty-Man")], [("Webs", "Tarantula")]]
+
+
+def test_model_dump_relationships_loaded(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    detector = LazyLoadDetector(action="count")
+    with Session(engine, lazy_loads=detector, stats=True) as session:
+        team = session.exec(
+            select(Team).where(Team.name == "Preventers").load(Team.heroes)
+        ).one()
+        team.heroes[0].name = "Captain North America"
+        session.stats.reset()
+        data = team.model_dump(relationships={"heroes": True})
+        assert session.stats.statements == {}
+    assert [hero["name"] for hero in data["heroes"]] == [
+        "Captain North America",
+        "Tarantula",
+    ]
+    assert detector.counts == {}
+
+
+def test_model_dump_relationships_invalid(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    with Session(engine) as session:
+        team = session.exec(select(Team)).first()
+        assert team is not None
+        with pytest.raises(ValueError, match="'team' is not a relationship of Team"):
+            team.model_dump(relationships={"team": True})
+
+
+def test_model_dump_relationships_link_and_self(clear_sqlmodel):
+    class HeroTeamLink(SQLModel, table=True):
+        team_id: int | None = Field(
+            default=None, foreign_key="team.id", primary_key=True
+        )
+        hero_id: int | None = Field(
+            default=None, foreign_key="hero.id", primary_key=True
+        )
+
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(
+            back_populates="teams", link_model=HeroTeamLink
+        )
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        mentor_id: int | None = Field(default=None, foreign_key="hero.id")
+        teams: list[Team] = Relationship(
+            back_populates="heroes", link_model=HeroTeamLink
+        )
+        mentor: Optional["Hero"] = Relationship(
+            back_populates="students",
+            sa_relationship_kwargs={"remote_side": "Hero.id"},
+        )
+        students: list["Hero"] = Relationship(
+            back_populates="mentor",
+            sa_relationship_kwargs={"order_by": "Hero.name.desc()"},
+        )
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        rusty_man = Hero(name="Rusty-Man")
+        deadpond = Hero(name="Deadpond", mentor=rusty_man)
+        session.add_all(
+            [
+                Team(name="Preventers", heroes=[rusty_man, deadpond]),
+                Team(name="Z-Force", heroes=[deadpond]),
+                Hero(name="Tarantula", mentor=rusty_man),
+            ]
+        )
+        session.commit()
+
+    with Session(engine, stats=True) as session:
+        assert session.stats is not None
+        result = session.exec(select(Team).order_by(Team.id))
+        data = json.loads(
+            result.dump_json(relationships={"heroes": {"students": True}})
+        )
+        # The teams, the heroes of all the teams, the students of all the heroes
+        assert session.stats.statements == {"select": 3}
+    assert [
+        (
+            team["name"],
+            [
+                (hero["name"], [student["name"] for student in hero["students"]])
+                for hero in sorted(team["heroes"], key=lambda hero: hero["id"])
+            ],
+        )
+        for team in data
+    ] == [
+        ("Preventers", [("Rusty-Man", ["Tarantula", "Deadpond"]), ("Deadpond", [])]),
+        ("Z-Force", [("Deadpond", [])]),
+    ]
+
+
+def test_dump_json_relationships_non_table(clear_sqlmodel):
+    Team, Hero, engine = create_models()
+    with Session(engine) as session:
+        result = session.exec(select(Hero.name))
+        with pytest.raises(ValueError, match="only be dumped for SQLModel models"):
+            result.dump_json(relationships=1)
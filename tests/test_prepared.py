@@ -0,0 +1,66 @@
+from sqlmodel import (
+    Field,
+    Session,
+    SQLModel,
+    bindparam,
+    create_engine,
+    get_prepared_stats,
+    prepared,
+    select,
+    update,
+)
+
+
+def test_prepared(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name="Deadpond"), Hero(name="Rusty-Man")])
+        session.commit()
+
+    hero_by_id = prepared(select(Hero).where(Hero.id == bindparam("hero_id")))
+    rename = prepared(
+        update(Hero).where(Hero.id == bindparam("hero_id")).values(name="Spider-Boy"),
+        name="rename",
+    )
+    with Session(engine) as session:
+        hero = session.exec(hero_by_id, params={"hero_id": 1}).one()
+        assert hero.name == "Deadpond"
+        hero = session.exec(hero_by_id, params={"hero_id": 2}).one()
+        assert hero.name == "Rusty-Man"
+        session.exec(hero_by_id.where(Hero.name == "Deadpond"), params={"hero_id": 1})
+        session.exec(rename, params={"hero_id": 2})
+
+    stats = {item.name: item for item in get_prepared_stats()}
+    hero_by_id_stats = next(
+        item for name, item in stats.items() if name.endswith("test_prepared.py:25")
+    )
+    assert hero_by_id_stats.executions == 2
+    assert hero_by_id_stats.cache_hits == 1
+    assert hero_by_id_stats.cache_misses == 1
+    assert stats["rename"].executions == 1
+    assert stats["rename"] in get_prepared_stats(never_cached=True)
+    assert hero_by_id_stats not in get_prepared_stats(never_cached=True)
+
+
+def test_prepared_without_cache(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://", query_cache_size=0)
+    SQLModel.metadata.create_all(engine)
+    hero_by_name = prepared(
+        select(Hero).where(Hero.name == bindparam("name")), name="no cache"
+    )
+    with Session(engine) as session:
+        for _ in range(3):
+            assert session.exec(hero_by_name, params={"name": "Deadpond"}).all() == []
+
+    [stats] = [item for item in get_prepared_stats() if item.name == "no cache"]
+    assert (stats.executions, stats.cache_hits, stats.cache_misses) == (3, 0, 3)
+    assert stats in get_prepared_stats(never_cached=True)
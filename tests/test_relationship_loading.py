@@ -0,0 +1,93 @@
+from typing import get_args
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import relationship
+from sqlmodel import (
+    Field,
+    LazyLoadDetector,
+    Relationship,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+from sqlmodel.main import LazyType
+from sqlmodel.sql._expression_select_cls import _LOADERS
+
+
+def create_heroes(lazy: LazyType | None = None):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team", lazy=lazy)
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(3):
+            team = Team(name=f"Team {i}")
+            session.add_all(
+                [Hero(name=f"Hero {i}", team=team), Hero(name="", team=team)]
+            )
+        session.commit()
+    return engine, Team, Hero
+
+
+def test_relationship_lazy(clear_sqlmodel):
+    engine, Team, Hero = create_heroes(lazy="selectin")
+    assert Team.heroes.property.lazy == "selectin"
+    assert Hero.team.property.lazy == "select"
+    detector = LazyLoadDetector(action="raise", threshold=0)
+    with Session(engine, lazy_loads=detector) as session:
+        teams = session.exec(select(Team)).all()
+        assert [len(team.heroes) for team in teams] == [2, 2, 2]
+    assert detector.counts == {}
+
+
+def test_relationship_lazy_raise(clear_sqlmodel):
+    engine, Team, Hero = create_heroes(lazy="raise")
+    with Session(engine) as session:
+        team = session.exec(select(Team)).first()
+        assert team is not None
+        with pytest.raises(InvalidRequestError, match="'Team.heroes' is not available"):
+            assert team.heroes
+
+
+def test_relationship_lazy_invalid(clear_sqlmodel):
+    with pytest.raises(ValueError, match="Invalid lazy loading strategy 'dynamic'"):
+        Relationship(lazy="dynamic")  # type: ignore[call-overload]
+    with pytest.raises(RuntimeError, match="Passing lazy is not supported"):
+        Relationship(lazy="joined", sa_relationship=relationship("Hero"))  # type: ignore[call-overload]
+
+
+def test_select_load(clear_sqlmodel):
+    engine, Team, Hero = create_heroes()
+    assert set(_LOADERS) == set(get_args(LazyType))
+    detector = LazyLoadDetector(action="raise", threshold=0)
+    with Session(engine, lazy_loads=detector) as session:
+        teams = session.exec(select(Team).load(Team.heroes).order_by(Team.id)).all()
+        assert [len(team.heroes) for team in teams] == [2, 2, 2]
+        session.expunge_all()
+
+        statement = select(Team).load(Team.heroes, strategy="joined")
+        teams = session.exec(statement).unique().all()
+        assert [len(team.heroes) for team in teams] == [2, 2, 2]
+        session.expunge_all()
+
+        hero = session.exec(
+            select(Hero).load(Hero.team, strategy="raise_on_sql")
+        ).first()
+        assert hero is not None
+        with pytest.raises(InvalidRequestError, match="'Hero.team' is not available"):
+            assert hero.team
+    assert detector.counts == {}
+
+    with pytest.raises(ValueError, match="Invalid loading strategy 'dynamic'"):
+        select(Team).load(Team.heroes, strategy="dynamic")  # type: ignore[arg-type]
@@ -0,0 +1,186 @@
+from array import array
+from datetime import date
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, func, select
+
+
+def create_heroes(engine, hero_model) -> None:
+    with Session(engine) as session:
+        session.add_all(
+            [
+                hero_model(name="Deadpond", age=None, born=date(2000, 1, 1)),
+                hero_model(name="Spider-Boy", age=16, rank=2, score=1.5, active=True),
+                hero_model(name="Rusty-Man", age=48, rank=1, score=2.5, active=False),
+            ]
+        )
+        session.commit()
+
+
+def create_engine_with_heroes():
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+        rank: int = 0
+        score: float = 0.0
+        active: bool = False
+        born: date | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    create_heroes(engine, Hero)
+    return Hero, engine
+
+
+def test_to_columns(clear_sqlmodel):
+    Hero, engine = create_engine_with_heroes()
+    with Session(engine) as session:
+        columns = session.exec(select(Hero).order_by(Hero.id)).to_columns(batch_size=2)
+        assert list(columns) == ["id", "name", "age", "rank", "score", "active", "born"]
+        assert columns["id"] == array("q", [1, 2, 3])
+        assert columns["name"] == ["Deadpond", "Spider-Boy", "Rusty-Man"]
+        # A NULL value in a numeric column
+        assert columns["age"] == [None, 16, 48]
+        assert columns["rank"] == array("q", [0, 2, 1])
+        assert columns["score"] == array("d", [0.0, 1.5, 2.5])
+        assert columns["active"] == array("b", [0, 1, 0])
+        assert columns["born"] == [date(2000, 1, 1), None, None]
+        # No ORM objects were created
+        assert not session.identity_map
+
+        columns = session.exec(
+            select(Hero).only(Hero.age).where(Hero.age > 20)
+        ).to_columns()
+        assert columns == {"id": array("q", [3]), "age": array("q", [48])}
+        columns = session.exec(select(func.count(Hero.id))).to_columns()
+        assert columns == {"count_1": array("q", [3])}
+        columns = session.exec(select(Hero.name).where(Hero.id > 10)).to_columns()
+        assert columns == {"name": []}
+
+
+def test_to_columns_several_columns(clear_sqlmodel):
+    Hero, engine = create_engine_with_heroes()
+    with Session(engine) as session:
+        columns = session.exec(
+            select(Hero.id, Hero.age, Hero.name).order_by(Hero.id)
+        ).to_columns()
+        assert columns == {
+            "id": array("q", [1, 2, 3]),
+            "age": [None, 16, 48],
+            "name": ["Deadpond", "Spider-Boy", "Rusty-Man"],
+        }
+        columns = session.exec(
+            select(Hero.active, func.count(Hero.id).label("heroes"))
+            .group_by(Hero.active)
+            .order_by(Hero.active)
+        ).to_columns()
+        assert columns == {
+            "active": array("b", [0, 1]),
+            "heroes": array("q", [2, 1]),
+        }
+
+
+def test_several_columns_result(clear_sqlmodel):
+    Hero, engine = create_engine_with_heroes()
+    statement = select(Hero.name, Hero.age).order_by(Hero.id)
+    with Session(engine) as session:
+        result = session.exec(statement)
+        assert list(result.keys()) == ["name", "age"]
+        rows = result.all()
+        assert rows == [("Deadpond", None), ("Spider-Boy", 16), ("Rusty-Man", 48)]
+        assert rows[1].age == 16
+        assert [row.name for row in session.exec(statement)] == [
+            "Deadpond",
+            "Spider-Boy",
+            "Rusty-Man",
+        ]
+        assert session.exec(statement).first() == ("Deadpond", None)
+        assert session.exec(statement).scalar() == "Deadpond"
+        assert session.exec(statement).scalars(1).all() == [None, 16, 48]
+        assert session.exec(statement.limit(1)).one().name == "Deadpond"
+        assert session.exec(statement).mappings().first() == {
+            "name": "Deadpond",
+            "age": None,
+        }
+        assert list(session.exec(statement).partitions(2)) == [
+            [("Deadpond", None), ("Spider-Boy", 16)],
+            [("Rusty-Man", 48)],
+        ]
+        assert session.exec(select(Hero.active, Hero.rank)).unique().all() == [
+            (False, 0),
+            (True, 2),
+            (False, 1),
+        ]
+
+
+def test_to_columns_invalid(clear_sqlmodel):
+    Hero, engine = create_engine_with_heroes()
+
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+
+    with Session(engine) as session:
+        result = session.exec(select(Hero), into=HeroPublic)
+        with pytest.raises(ValueError, match="without into()"):
+            result.to_columns()
+
+
+def test_to_columns_fetched(clear_sqlmodel):
+    Hero, engine = create_engine_with_heroes()
+    with Session(engine) as session:
+        result = session.exec(
+            select(Hero.id, Hero.name), execution_options={"prebuffer_rows": True}
+        )
+        with pytest.raises(ValueError, match="already fetched"):
+            result.to_columns()
+
+
+def test_to_columns_numpy(clear_sqlmodel):
+    np = pytest.importorskip("numpy")
+    Hero, engine = create_engine_with_heroes()
+    with Session(engine) as session:
+        columns = session.exec(select(Hero).order_by(Hero.id)).to_columns(numpy=True)
+    assert columns["id"].dtype == np.int64
+    assert columns["id"].tolist() == [1, 2, 3]
+    assert columns["age"].dtype == object
+    assert columns["score"].dtype == np.float64
+    assert columns["active"].tolist() == [False, True, False]
+    assert columns["born"].dtype == np.dtype("datetime64[D]")
+    columns["rank"][0] = 3
+    assert columns["rank"].tolist() == [3, 2, 1]
+
+
+def test_to_arrow(clear_sqlmodel):
+    pa = pytest.importorskip("pyarrow")
+    Hero, engine = create_engine_with_heroes()
+    with Session(engine) as session:
+        table = session.exec(select(Hero).order_by(Hero.id)).to_arrow()
+    assert table.column_names == [
+        "id",
+        "name",
+        "age",
+        "rank",
+        "score",
+        "active",
+        "born",
+    ]
+    assert table.schema.field("age").type == pa.int64()
+    assert table.schema.field("born").type == pa.date32()
+    assert table.column("age").to_pylist() == [None, 16, 48]
+    assert table.column("active").to_pylist() == [False, True, False]
+
+
+def test_several_columns_numpy_arrow(clear_sqlmodel):
+    np = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    Hero, engine = create_engine_with_heroes()
+    statement = select(Hero.born, Hero.score).order_by(Hero.id)
+    with Session(engine) as session:
+        columns = session.exec(statement).to_columns(numpy=True)
+        table = session.exec(statement).to_arrow()
+    assert columns["born"].dtype == np.dtype("datetime64[D]")
+    assert columns["score"].tolist() == [0.0, 1.5, 2.5]
+    assert table.schema.field("born").type == pa.date32()
+    assert table.column("score").to_pylist() == [0.0, 1.5, 2.5]
@@ -0,0 +1,142 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def create_heroes(engine, hero_model, count: int) -> None:
+    with Session(engine) as session:
+        session.bulk_insert(
+            hero_model,
+            (
+                {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i or None}
+                for i in range(count)
+            ),
+        )
+        session.commit()
+
+
+def test_dump_json(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str = Field(alias="secretName")
+        age: int | None = None
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    create_heroes(engine, Hero, 3)
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        # Loaded relationships and SQLAlchemy attributes are not fields
+        assert heroes[0].team is None
+        expected = json.dumps(
+            [hero.model_dump() for hero in heroes], separators=(",", ":")
+        ).encode()
+        assert session.exec(select(Hero)).dump_json() == expected
+        data = json.loads(
+            session.exec(select(Hero).order_by(Hero.id)).dump_json(
+                include={"id", "secret_name", "age"}, exclude_none=True, by_alias=True
+            )
+        )
+        assert data == [
+            {"id": 1, "secretName": "Secret 0"},
+            {"id": 2, "secretName": "Secret 1", "age": 1},
+            {"id": 3, "secretName": "Secret 2", "age": 2},
+        ]
+        data = json.loads(
+            session.exec(select(Hero).where(Hero.id == 2)).dump_json(
+                exclude={"secret_name", "team_id"}, indent=2
+            )
+        )
+        assert data == [{"id": 2, "name": "Hero 1", "age": 1}]
+        assert session.exec(select(Hero).where(Hero.id == 10)).dump_json() == b"[]"
+        assert (
+            session.exec(select(Hero.name).order_by(Hero.id).limit(2)).dump_json()
+            == b'["Hero 0","Hero 1"]'
+        )
+
+
+def test_dump_json_into(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+        birthday: date = date(2000, 1, 1)
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    create_heroes(engine, Hero, 2)
+    with Session(engine) as session:
+        result = session.exec(select(Hero), into=HeroPublic)
+        assert json.loads(result.dump_json()) == [
+            {"id": 1, "name": "Hero 0", "birthday": "2000-01-01"},
+            {"id": 2, "name": "Hero 1", "birthday": "2000-01-01"},
+        ]
+
+
+def test_iter_ndjson(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    create_heroes(engine, Hero, 5)
+    with Session(engine) as session:
+        statement = select(Hero).order_by(Hero.id).execution_options(yield_per=2)
+        chunks = list(
+            session.exec(statement).iter_ndjson(chunk_size=2, exclude={"secret_name"})
+        )
+        assert len(chunks) == 3
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": i + 1, "name": f"Hero {i}", "age": i or None} for i in range(5)
+        ]
+        chunks = list(session.exec(select(Hero.id).order_by(Hero.id)).iter_ndjson())
+        assert chunks == [b"1\n2\n3\n4\n5\n"]
+        assert list(session.exec(select(Hero).where(Hero.id == 10)).iter_ndjson()) == []
+
+
+def test_dump_json_async(clear_sqlmodel, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    database = tmp_path / "heroes.db"
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    create_heroes(engine, Hero, 2)
+    engine.dispose()
+
+    async def main():
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        async with AsyncSession(async_engine) as session:
+            result = await session.exec(select(Hero.name).order_by(Hero.id))
+            assert result.dump_json() == b'["Hero 0","Hero 1"]'
+        await async_engine.dispose()
+
+    asyncio.run(main())
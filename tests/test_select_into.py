@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+from pydantic import AliasChoices, AliasPath
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_exec_into(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+        age: int | None = None
+
+    class Hero(HeroBase, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        secret_name: str
+
+    class HeroPublic(HeroBase):
+        id: int
+        nickname: str = Field(default="", alias="nickName")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson"))
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+
+    statement = select(Hero).where(Hero.name != "Spider-Boy").order_by(Hero.id)
+    assert "secret_name" not in str(statement.into(HeroPublic))
+    with Session(engine) as session:
+        heroes = session.exec(statement, into=HeroPublic).all()
+        assert heroes == [
+            HeroPublic(id=1, name="Deadpond"),
+            HeroPublic(id=2, name="Rusty-Man", age=48),
+        ]
+        assert not session.identity_map
+
+        hero = session.exec(statement.into(HeroPublic).where(Hero.age > 40)).one()
+        assert hero.model_dump() == {
+            "id": 2,
+            "name": "Rusty-Man",
+            "age": 48,
+            "nickname": "",
+        }
+        assert not session.identity_map
+
+
+def test_exec_stream_into(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    class HeroPublic(SQLModel):
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}") for i in range(25))
+        session.commit()
+
+    with Session(engine) as session:
+        chunks = list(
+            session.exec_stream(
+                select(Hero).order_by(Hero.id).into(HeroPublic),
+                chunk_size=10,
+                expunge=True,
+            )
+        )
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert chunks[2][-1] == HeroPublic(name="Hero 24")
+
+
+def test_into_errors(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    class HeroPublic(SQLModel):
+        name: str
+
+    class Team(SQLModel):
+        headquarters: str
+
+    with pytest.raises(ValueError, match="Hero is a table model"):
+        select(Hero).into(Hero)
+    with pytest.raises(ValueError, match="single table model"):
+        select(Hero.name).into(HeroPublic)
+    with pytest.raises(ValueError, match="Team has no fields that are columns"):
+        select(Hero).into(Team)
+    with Session(create_engine("sqlite://")) as session:
+        with pytest.raises(ValueError, match="single table model"):
+            session.exec(select(Hero.id, Hero.name), into=HeroPublic)  # type: ignore[call-overload]
+
+
+def test_async_exec_into(clear_sqlmodel, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+
+    database = tmp_path / "heroes.db"
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}") for i in range(3))
+        session.commit()
+    engine.dispose()
+
+    async def main() -> None:
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        async with AsyncSession(async_engine) as session:
+            statement = select(Hero).order_by(Hero.id)
+            heroes = (await session.exec(statement, into=HeroPublic)).all()
+            assert heroes == [HeroPublic(id=i + 1, name=f"Hero {i}") for i in range(3)]
+            result = await session.exec_stream(statement.into(HeroPublic))
+            assert [hero.id async for hero in result] == [1, 2, 3]
+            assert not session.sync_session.identity_map
+        await async_engine.dispose()
+
+    asyncio.run(main())
+
+
+def test_exec_into_validation_alias(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    class HeroPublic(SQLModel):
+        id: int
+        name: str = Field(validation_alias=AliasChoices("heroName", "name"))
+        secret_name: str = Field(validation_alias=AliasPath("secretName"))
+        age: int | None = Field(
+            default=None, validation_alias=AliasChoices(AliasPath("age", 0), "years")
+        )
+
+    class HeroNested(SQLModel):
+        id: int
+        name: str = Field(validation_alias=AliasPath("hero", "name"))
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Rusty-Man", secret_name="Tommy Sharp", age=48))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero).into(HeroPublic)).one()
+        assert hero.model_dump() == {
+            "id": 1,
+            "name": "Rusty-Man",
+            "secret_name": "Tommy Sharp",
+            "age": 48,
+        }
+    with pytest.raises(ValueError, match="'name' of HeroNested .* nested AliasPath"):
+        select(Hero).into(HeroNested)
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_select_only(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson", age=48))
+        session.commit()
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def log_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        hero: Hero = session.exec(select(Hero).only(Hero.name)).one()
+        assert "secret_name" not in statements[0]
+        assert hero.model_dump() == {"id": 1, "name": "Deadpond"}
+        assert json.loads(hero.model_dump_json()) == {"id": 1, "name": "Deadpond"}
+        assert len(statements) == 1
+        # Deferred fields are loaded on access
+        assert hero.age == 48
+        assert len(statements) == 2
+        assert hero.model_dump() == {"id": 1, "name": "Deadpond", "age": 48}
+
+
+def test_select_only_strict(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", age=48))
+        session.commit()
+
+    with Session(engine) as session:
+        statement = (
+            select(Hero).where(Hero.name == "Deadpond").only(Hero.name, strict=True)
+        )
+        hero = session.exec(statement).one()
+        assert hero.name == "Deadpond"
+        with pytest.raises(InvalidRequestError):
+            hero.age  # noqa: B018
+
+
+def test_select_only_with_columns(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        headquarters: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Team(name="Preventers", headquarters="Sharp Tower"))
+        session.commit()
+
+    with Session(engine) as session:
+        team, name = session.exec(select(Team, Team.name).only(Team.id)).one()
+        assert name == "Preventers"
+        assert team.model_dump() == {"id": 1}
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_session_stats(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine, stats=True) as session:
+        assert session.stats is not None
+        session.add_all([Hero(name="Deadpond"), Hero(name="Rusty-Man")])
+        session.commit()
+        assert session.stats.flushes == 1
+        assert session.stats.objects_flushed == 2
+        assert session.stats.statements["insert"] >= 1
+
+        session.stats.reset()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [hero.name for hero in heroes] == ["Deadpond", "Rusty-Man"]
+        assert session.stats.statements == {"select": 1}
+        assert session.stats.rows == 2
+        assert session.stats.execute_time > 0
+        assert session.stats.hydration_time > 0
+
+        heroes[0].name = "Spider-Boy"
+        session.commit()
+        assert session.stats.statements == {"select": 1, "update": 1}
+        assert (session.stats.flushes, session.stats.objects_flushed) == (1, 1)
+
+        chunks = list(session.exec_stream(select(Hero), chunk_size=1))
+        assert len(chunks) == 2
+        assert session.stats.rows == 4
+
+    with Session(engine) as session:
+        assert session.stats is None
+        assert len(session.exec(select(Hero)).all()) == 2
+
+
+def test_session_options(clear_sqlmodel):
+    engine = create_engine("sqlite://")
+    with Session(
+        engine, expire_on_commit=False, info={"request": 1}, stats=True
+    ) as session:
+        assert session.expire_on_commit is False
+        assert session.info == {"request": 1}
+        assert session.stats is not None
+
+
+def test_session_stats_with_connection(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.connect() as connection:
+        with Session(connection, stats=True) as session:
+            assert session.stats is not None
+            session.exec(select(Hero)).all()
+            session.rollback()
+            assert session.stats.statements == {"select": 1}
+        # The listeners are removed from the connection with the transaction
+        connection.exec_driver_sql("SELECT 1")
+        assert session.stats.statements == {"select": 1}
+
+
+def test_async_session_stats(clear_sqlmodel, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    async def main() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'heroes.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine, stats=True) as session:
+            assert session.stats is not None
+            session.add(Hero(name="Deadpond"))
+            await session.commit()
+            heroes = (await session.exec(select(Hero))).all()
+            assert len(heroes) == 1
+            assert session.stats.flushes == 1
+            assert session.stats.statements["select"] == 1
+            assert session.stats.rows == 1
+            session.add(Hero(name="Rusty-Man"))
+            await session.commit()
+            session.stats.reset()
+            result = await session.exec_stream(select(Hero), chunk_size=1)
+            names = [hero.name async for hero in result]
+            assert names == ["Deadpond", "Rusty-Man"]
+            assert session.stats.statements == {"select": 1}
+            assert session.stats.rows == 2
+            assert session.stats.hydration_time > 0
+        await engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import JSON, event
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_assign_unchanged_value_on_loaded_object(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", age=30))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        hero.name = "Deadpond"
+        hero.age = 30
+        assert not session.dirty
+        assert hero.model_fields_set == set()
+        hero.age = 31
+        assert hero in session.dirty
+        assert hero.model_fields_set == {"age"}
+        hero.age = 31
+        assert hero.age == 31
+        session.commit()
+        session.refresh(hero)
+        assert hero.age == 31
+
+
+def test_assign_unchanged_value_on_new_object(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    hero = Hero(name="Deadpond")
+    assert hero.model_fields_set == {"name"}
+    hero.age = None
+    assert hero.model_fields_set == {"name", "age"}
+
+
+def test_reassign_mutable_value_marks_modified(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        tags: list[str] = Field(default_factory=list, sa_type=JSON)
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(tags=["fast"]))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        hero.tags.append("strong")
+        hero.tags = hero.tags
+        assert hero in session.dirty
+
+
+def test_assign_unchanged_value_with_set_listener(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    values: list[Any] = []
+    event.listen(Hero.name, "set", lambda target, value, *args: values.append(value))
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.commit()
+        values.clear()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        hero.name = "Deadpond"
+        assert values == ["Deadpond"]
+
+
+def test_assign_with_validate_assignment(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        model_config = {"validate_assignment": True}
+        id: int | None = Field(default=None, primary_key=True)
+        age: int | None = None
+
+    assert Hero.__sqlmodel_class_info__.direct_set_names == frozenset()
+    hero = Hero()
+    hero.age = "42"
+    assert hero.age == 42
+    with pytest.raises(ValidationError):
+        hero.age = "not a number"
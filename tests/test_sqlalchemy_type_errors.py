@@ -1,23 +1,33 @@
-from typing import Any
-
 import pytest
 from sqlmodel import Field, SQLModel
 
 
-def test_type_list_breaks() -> None:
-    with pytest.raises(ValueError):
+def test_type_table_model_breaks(clear_sqlmodel) -> None:
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+
+    with pytest.raises(ValueError, match="declare the field with Relationship"):
 
         class Hero(SQLModel, table=True):
             id: int | None = Field(default=None, primary_key=True)
-            tags: list[str]
+            team: Team
 
 
-def test_type_dict_breaks() -> None:
-    with pytest.raises(ValueError):
+def test_type_table_model_collection_breaks(clear_sqlmodel) -> None:
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+
+    with pytest.raises(ValueError, match="declare the field with Relationship"):
 
         class Hero(SQLModel, table=True):
             id: int | None = Field(default=None, primary_key=True)
-            tags: dict[str, Any]
+            teams: list[Team]
+
+    with pytest.raises(ValueError, match="declare the field with Relationship"):
+
+        class Villain(SQLModel, table=True):
+            id: int | None = Field(default=None, primary_key=True)
+            teams: dict[str, list[Team | None]]
 
 
 def test_type_union_breaks() -> None:
@@ -0,0 +1,152 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import JSON
+from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel._compat import partial_init
+
+
+def generic_table_construct(instance: SQLModel, values: dict[str, Any]) -> None:
+    # The generic loop over the model fields that the generated constructor
+    # replaced, kept here as a reference for its behavior
+    cls = type(instance)
+    old_dict = instance.__dict__.copy()
+    fields_values: dict[str, Any] = {}
+    defaults: dict[str, Any] = {}
+    for name, field in cls.model_fields.items():
+        if field.alias and field.alias in values:
+            fields_values[name] = values.pop(field.alias)
+        elif name in values:
+            fields_values[name] = values.pop(name)
+        elif not field.is_required():
+            defaults[name] = field.get_default(call_default_factory=True)
+    fields_set = set(fields_values)
+    fields_values.update(defaults)
+    for key, value in {**old_dict, **fields_values}.items():
+        setattr(instance, key, value)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+
+def test_table_init_matches_generic_construct(clear_sqlmodel):
+    calls: list[str] = []
+
+    def make_tags() -> list[str]:
+        calls.append("tags")
+        return []
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str = Field(alias="heroName")
+        secret_name: str
+        age: int | None = None
+        tags: list[str] = Field(default_factory=make_tags, sa_type=JSON)
+        powers: list[str] = Field(default=["fly"], sa_type=JSON)
+
+    hero = Hero(heroName="Deadpond", secret_name="Dive Wilson")
+    with partial_init():
+        generic_hero = Hero()
+    generic_table_construct(
+        generic_hero, {"heroName": "Deadpond", "secret_name": "Dive Wilson"}
+    )
+    assert hero.model_dump() == generic_hero.model_dump()
+    assert hero.model_fields_set == {"name", "secret_name"}
+    assert generic_hero.model_fields_set == {"name", "secret_name"}
+    assert list(hero.__dict__) == list(generic_hero.__dict__)
+    assert calls == ["tags", "tags"]
+    # Mutable defaults are copied, not shared between instances
+    assert hero.powers == ["fly"]
+    assert hero.powers is not Hero(heroName="a", secret_name="b").powers
+
+    hero_by_name = Hero(name="Spider-Boy", secret_name="Pedro Parqueador", age=16)
+    assert hero_by_name.name == "Spider-Boy"
+    assert hero_by_name.model_fields_set == {"name", "secret_name", "age"}
+
+
+def test_table_init_sets_relationships(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    team = Team(name="Preventers")
+    hero = Hero(name="Rusty-Man", team=team)
+    assert hero.team is team
+    assert team.heroes == [hero]
+    assert "team" not in hero.model_fields_set
+    assert Team(name="Z-Force", heroes=[hero]).heroes == [hero]
+    assert hero.team is not team
+
+
+def test_table_init_extra_allow(clear_sqlmodel):
+    class Item(SQLModel, table=True):
+        model_config = {"extra": "allow"}
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    item = Item(name="Cup", color="blue")
+    assert item.__pydantic_extra__ == {"color": "blue"}
+
+
+def test_table_init_does_not_validate(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    hero = Hero(age="not a number")
+    assert hero.age == "not a number"
+    assert "name" not in hero.__dict__
+    assert hero.model_fields_set == {"age"}
+
+
+def test_table_init_validate_assignment(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        model_config = {"validate_assignment": True}
+        id: int | None = Field(default=None, primary_key=True)
+        age: int | None = None
+
+    assert Hero(age="42").age == 42
+    with pytest.raises(ValidationError):
+        Hero(age="not a number")
+
+
+def test_table_init_custom_setattr(clear_sqlmodel):
+    set_names: list[str] = []
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            set_names.append(name)
+            super().__setattr__(name, value)
+
+    hero = Hero(name="Deadpond")
+    assert hero.name == "Deadpond"
+    assert [name for name in set_names if not name.startswith("_sa_")] == [
+        "name",
+        "id",
+    ]
+
+
+def test_table_init_generated_on_first_instance(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    placeholder = Hero.__dict__["__sqlmodel_table_init__"]
+    hero = Hero(name="Deadpond")
+    assert hero.name == "Deadpond"
+    table_init = Hero.__dict__["__sqlmodel_table_init__"]
+    assert table_init is not placeholder
+    assert Hero(name="Rusty-Man").name == "Rusty-Man"
+    assert Hero.__dict__["__sqlmodel_table_init__"] is table_init
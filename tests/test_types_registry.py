@@ -0,0 +1,136 @@
+import copy
+import enum
+import ipaddress
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+from sqlalchemy import Boolean, Integer, String, Text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+from sqlmodel import Field, Session, SQLModel, create_engine, select, types
+from sqlmodel.sql.sqltypes import PydanticJSON
+
+
+class Slug(str):
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            cls, core_schema.str_schema()
+        )
+
+
+@pytest.fixture
+def restore_types(monkeypatch):
+    monkeypatch.setattr(types, "_registry", copy.deepcopy(types._registry))
+    monkeypatch.setattr(types, "_lookup_cache", {})
+
+
+def get_ddl(model: type[SQLModel], dialect: Any) -> str:
+    return str(CreateTable(model.__table__).compile(dialect=dialect))  # type: ignore[attr-defined]
+
+
+def test_register(clear_sqlmodel, restore_types):
+    def get_slug_type(annotation, metadata):
+        assert issubclass(annotation, Slug)
+        return String(metadata.max_length or 20)
+
+    types.register(Slug, get_slug_type)
+
+    class ShortSlug(Slug):
+        pass
+
+    class Article(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        slug: Slug | None = Field(default=None, max_length=50)
+        short_slug: ShortSlug
+
+    slug_type = Article.__table__.c.slug.type  # type: ignore[attr-defined]
+    assert isinstance(slug_type, String) and slug_type.length == 50
+    short_slug_type = Article.__table__.c.short_slug.type  # type: ignore[attr-defined]
+    assert isinstance(short_slug_type, String) and short_slug_type.length == 20
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Article(slug="hello-world", short_slug="hello"))
+        session.commit()
+        article = session.exec(select(Article)).one()
+        assert article.slug == "hello-world"
+
+
+def test_register_dialects(clear_sqlmodel, restore_types):
+    types.register(Slug, Text)
+    types.register(Slug, String(100), dialects=["postgresql", "mysql"])
+    # A type for a base class of the enum doesn't apply to it
+    types.register(str, Text, dialects="postgresql")
+
+    class Color(str, enum.Enum):
+        red = "red"
+        blue = "blue"
+
+    class Article(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        slug: Slug
+        color: Color
+
+    ddl = get_ddl(Article, postgresql.dialect())
+    assert "slug VARCHAR(100) NOT NULL" in ddl
+    assert "color color NOT NULL" in ddl
+    ddl = get_ddl(Article, sqlite.dialect())
+    assert "slug TEXT NOT NULL" in ddl
+    assert "color VARCHAR(4) NOT NULL" in ddl
+
+
+def test_register_dialects_only(clear_sqlmodel, restore_types):
+    # Only for PostgreSQL, the type of the base class is used for the rest
+    types.register(Slug, Text, dialects="postgresql")
+
+    class Article(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        slug: Slug
+
+    assert "slug TEXT NOT NULL" in get_ddl(Article, postgresql.dialect())
+    assert "slug VARCHAR NOT NULL" in get_ddl(Article, sqlite.dialect())
+
+
+def test_use_native_postgresql_types(clear_sqlmodel, restore_types):
+    types.use_native_postgresql_types()
+
+    class Owner(BaseModel):
+        name: str
+
+    class Server(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        address: ipaddress.IPv4Address
+        network: ipaddress.IPv6Network | None = None
+        ports: list[int]
+        tags: list[dict[str, str]]
+        labels: dict[str, str]
+        owner: Owner
+
+    ddl = get_ddl(Server, postgresql.dialect())
+    assert "address INET NOT NULL" in ddl
+    assert "network CIDR" in ddl
+    assert "ports INTEGER[] NOT NULL" in ddl
+    assert "tags JSONB NOT NULL" in ddl
+    assert "labels JSONB NOT NULL" in ddl
+    assert "owner JSONB NOT NULL" in ddl
+    ddl = get_ddl(Server, sqlite.dialect())
+    assert "address VARCHAR NOT NULL" in ddl
+    assert "network VARCHAR" in ddl
+    assert "ports JSON NOT NULL" in ddl
+    assert "owner JSON NOT NULL" in ddl
+
+
+def test_get_sa_type():
+    assert types.get_sa_type(int | None) is Integer
+    assert types.get_sa_type(bool) is Boolean
+    json_type = types.get_sa_type(list[int])
+    assert isinstance(json_type, PydanticJSON)
+    assert json_type.annotation == list[int]
+    with pytest.raises(ValueError, match="has no matching SQLAlchemy type"):
+        types.get_sa_type(object)
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import mysql, postgresql
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlmodel.orm.session import _get_upsert_statement
+
+
+def test_upsert(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        secret_name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", secret_name="Dive Wilson", age=30))
+        session.commit()
+
+    with Session(engine) as session:
+        session.upsert(
+            Hero,
+            [
+                Hero(name="Deadpond", secret_name="Dive Wilson", age=31),
+                {"name": "Spider-Boy", "secret_name": "Pedro Parqueador", "age": None},
+            ],
+            conflict_on=["name"],
+        )
+        session.commit()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.id, hero.name, hero.age) for hero in heroes] == [
+            (1, "Deadpond", 31),
+            (2, "Spider-Boy", None),
+        ]
+
+    with Session(engine) as session:
+        session.upsert(
+            Hero,
+            [
+                Hero(id=1, name="Deadpond", secret_name="Wade", age=32),
+                Hero(id=2, name="Spider-Boy", secret_name="Pedro", age=16),
+            ],
+            update_fields=["age"],
+        )
+        session.upsert(
+            Hero,
+            [Hero(id=1, name="Deadpond", secret_name="Dive Wilson", age=40)],
+            update_fields=[],
+        )
+        session.commit()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.secret_name, hero.age) for hero in heroes] == [
+            ("Dive Wilson", 32),
+            ("Pedro Parqueador", 16),
+        ]
+
+
+def test_upsert_batches(clear_sqlmodel):
+    class Item(SQLModel, table=True):
+        code: str = Field(primary_key=True)
+        quantity: int
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        rows = ({"code": f"item-{i % 15}", "quantity": i} for i in range(30))
+        session.upsert(Item, rows, batch_size=10)
+        session.commit()
+        items = session.exec(select(Item).order_by(Item.code)).all()
+        assert len(items) == 15
+        assert {item.quantity for item in items} == set(range(15, 30))
+
+
+def test_upsert_mixed_fields(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int = Field(primary_key=True)
+        name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(id=50, name="A", age=1), Hero(id=51, name="C", age=2)])
+        session.commit()
+
+    with Session(engine) as session:
+        session.upsert(
+            Hero,
+            [
+                {"id": 50, "name": "B"},
+                {"id": 51, "name": "D", "age": 9},
+                {"id": 52, "name": "E"},
+                {"id": 50, "name": "F", "age": 3},
+            ],
+        )
+        session.commit()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert [(hero.id, hero.name, hero.age) for hero in heroes] == [
+            (50, "F", 3),
+            (51, "D", 9),
+            (52, "E", None),
+        ]
+
+
+def test_upsert_statement(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        age: int | None = None
+
+    statement = _get_upsert_statement(
+        Hero, "postgresql", conflict_on=["name"], update_fields=["age"]
+    )
+    assert str(statement.compile(dialect=postgresql.dialect())) == (
+        "INSERT INTO hero (id, name, age) VALUES (%(id)s, %(name)s, %(age)s) "
+        "ON CONFLICT (name) DO UPDATE SET age = excluded.age"
+    )
+    statement = _get_upsert_statement(
+        Hero, "postgresql", conflict_on=["name"], update_fields=[]
+    )
+    assert str(statement.compile(dialect=postgresql.dialect())) == (
+        "INSERT INTO hero (id, name, age) VALUES (%(id)s, %(name)s, %(age)s) "
+        "ON CONFLICT (name) DO NOTHING"
+    )
+    statement = _get_upsert_statement(
+        Hero, "mysql", conflict_on=["name"], update_fields=["age"]
+    )
+    assert str(statement.compile(dialect=mysql.dialect())) == (
+        "INSERT INTO hero (id, name, age) VALUES (%s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE age = VALUES(age)"
+    )
+    statement = _get_upsert_statement(
+        Hero, "mysql", conflict_on=["name"], update_fields=[]
+    )
+    assert str(statement.compile(dialect=mysql.dialect())) == (
+        "INSERT INTO hero (id, name, age) VALUES (%s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE name = hero.name"
+    )
+
+
+def test_upsert_errors(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    with pytest.raises(ValueError, match="'title' is not a column field of Hero"):
+        _get_upsert_statement(Hero, "sqlite", conflict_on=["title"], update_fields=[])
+    with pytest.raises(ValueError, match="not supported for the 'oracle' database"):
+        _get_upsert_statement(Hero, "oracle", conflict_on=["id"], update_fields=[])
+
+
+def test_async_upsert(clear_sqlmodel):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            await session.upsert(Hero, [Hero(id=1, name="Deadpond")])
+            await session.upsert(Hero, [Hero(id=1, name="Spider-Boy")])
+            await session.commit()
+            result = await session.exec(select(Hero.name))
+            assert result.all() == ["Spider-Boy"]
+        await engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError, field_validator, model_validator
+from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+
+
+def test_validate_many_table(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str = Field(alias="heroName")
+        secret_name: str
+        age: int | None = None
+
+    heroes = Hero.model_validate_many(
+        [
+            {"heroName": "Deadpond", "secret_name": "Dive Wilson"},
+            {"heroName": "Spider-Boy", "secret_name": "Pedro Parqueador", "age": "16"},
+        ]
+    )
+    assert [hero.name for hero in heroes] == ["Deadpond", "Spider-Boy"]
+    assert heroes[1].age == 16
+    assert heroes[0].model_fields_set == {"name", "secret_name"}
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(heroes)
+        session.commit()
+        assert [hero.id for hero in heroes] == [1, 2]
+
+    with Session(engine) as session:
+        names = session.exec(select(Hero.name).order_by(Hero.id)).all()
+        assert names == ["Deadpond", "Spider-Boy"]
+
+
+def test_validate_many_errors(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    with pytest.raises(ValidationError) as exc_info:
+        Hero.model_validate_many(
+            [{"age": 1}, {"name": "Deadpond"}, {"name": "Rusty-Man", "age": "old"}]
+        )
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        (0, "name"),
+        (2, "age"),
+    ]
+
+
+def test_validate_many_update(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        heroes: list["Hero"] = Relationship(back_populates="team")
+
+    class HeroCreate(SQLModel):
+        name: str
+        age: int | None = None
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+        team_id: int | None = Field(default=None, foreign_key="team.id")
+        team: Team | None = Relationship(back_populates="heroes")
+
+    team = Team(name="Preventers")
+    heroes = Hero.model_validate_many(
+        [HeroCreate(name="Deadpond"), {"name": "Rusty-Man", "age": 48}],
+        update={"team": team, "age": 30},
+    )
+    assert [hero.age for hero in heroes] == [30, 30]
+    # Relationships are only read from objects, as in model_validate()
+    assert heroes[0].team is team
+    assert heroes[1].team is None
+    assert team.heroes == [heroes[0]]
+
+
+def test_validate_many_non_table(clear_sqlmodel):
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+
+    hero = Hero(id=1, name="Deadpond", secret_name="Dive Wilson")
+    public = HeroPublic(id=2, name="Spider-Boy")
+    heroes = HeroPublic.model_validate_many([hero, public])
+    assert [h.model_dump() for h in heroes] == [
+        {"id": 1, "name": "Deadpond"},
+        {"id": 2, "name": "Spider-Boy"},
+    ]
+    assert heroes[1] is not public
+
+
+def test_validate_many_custom_setattr(clear_sqlmodel):
+    set_names: list[str] = []
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            set_names.append(name)
+            super().__setattr__(name, value)
+
+    heroes = Hero.model_validate_many([{"name": "Deadpond"}])
+    assert heroes[0].name == "Deadpond"
+    assert heroes[0].model_fields_set == {"name"}
+    assert "name" in set_names
+
+
+def test_validate_many_model_validator(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+        @model_validator(mode="after")
+        def check_age(self) -> "Hero":
+            if self.age is not None and self.age < 0:
+                raise ValueError("age must be positive")
+            return self
+
+    heroes = Hero.model_validate_many([{"name": "Deadpond", "age": 30}])
+    assert heroes[0].age == 30
+    with pytest.raises(ValidationError) as exc_info:
+        Hero.model_validate_many(
+            [{"name": "Deadpond", "age": -1}, {"name": "Rusty-Man"}, {"age": 1}]
+        )
+    errors = exc_info.value.errors()
+    assert [(error["type"], error["loc"]) for error in errors] == [
+        ("value_error", (0,)),
+        ("missing", (2, "name")),
+    ]
+    assert errors[0]["msg"] == "Value error, age must be positive"
+
+
+def test_validate_many_errors_same_shape(clear_sqlmodel):
+    def check_name(value: str) -> str:
+        if not value.istitle():
+            raise ValueError("name must be titled")
+        return value
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+        _check_name = field_validator("name")(check_name)
+
+    class CheckedHero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+        _check_name = field_validator("name")(check_name)
+
+        # Not a plain model schema, validated one by one
+        @model_validator(mode="after")
+        def check(self) -> "CheckedHero":
+            return self
+
+    data = [{"age": "old"}, {"name": "Deadpond"}, {"name": "rusty-man"}]
+    errors = []
+    for model in (Hero, CheckedHero):
+        with pytest.raises(ValidationError) as exc_info:
+            model.model_validate_many(data)
+        assert exc_info.value.title == model.__name__
+        errors.append(exc_info.value.errors(include_context=False))
+    assert errors[0] == errors[1]
+    assert [(error["type"], error["loc"]) for error in errors[0]] == [
+        ("missing", (0, "name")),
+        ("int_parsing", (0, "age")),
+        ("value_error", (2, "name")),
+    ]
+    assert errors[0][0]["url"].endswith("/missing")
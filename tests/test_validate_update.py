@@ -0,0 +1,70 @@
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+
+def test_validate_object_with_update(clear_sqlmodel):
+    class HeroCreate(SQLModel):
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    hero_create = HeroCreate(name="Deadpond", secret_name="Dive Wilson", age=48)
+    hero = Hero.model_validate(hero_create, update={"age": "49", "id": 3})
+    assert hero.model_dump() == {
+        "id": 3,
+        "name": "Deadpond",
+        "secret_name": "Dive Wilson",
+        "age": 49,
+    }
+    assert hero_create.age == 48
+
+
+def test_validate_plain_object_with_update(clear_sqlmodel):
+    class HeroSource:
+        name = "Deadpond"
+
+        def __init__(self) -> None:
+            self.age = 48
+
+        @property
+        def secret_name(self) -> str:
+            return "Dive Wilson"
+
+    class Hero(SQLModel):
+        name: str
+        secret_name: str
+        age: int | None = None
+
+    hero = Hero.model_validate(HeroSource(), update={"name": "Spider-Boy"})
+    assert hero.model_dump() == {
+        "name": "Spider-Boy",
+        "secret_name": "Dive Wilson",
+        "age": 48,
+    }
+
+
+def test_validate_expired_object_with_update(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        age: int | None = None
+
+    class HeroPublic(SQLModel):
+        id: int
+        name: str
+        age: int | None = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", age=48))
+        session.commit()
+        hero = session.exec(select(Hero)).one()
+        session.expire(hero)
+        hero_public = HeroPublic.model_validate(hero, update={"age": 49})
+        assert hero_public.model_dump() == {"id": 1, "name": "Deadpond", "age": 49}